@@ -0,0 +1,52 @@
+import { describe, it, expect } from 'vitest';
+import { AdaptiveConcurrency } from '../adaptive-concurrency.js';
+
+describe('AdaptiveConcurrency', () => {
+  it('starts at the configured maximum', () => {
+    expect(new AdaptiveConcurrency(5).limit).toBe(5);
+  });
+
+  it('halves on rate limits without dropping below one', () => {
+    const concurrency = new AdaptiveConcurrency(5);
+    concurrency.recordRateLimit();
+    expect(concurrency.limit).toBe(2);
+    concurrency.recordRateLimit();
+    concurrency.recordRateLimit();
+    expect(concurrency.limit).toBe(1);
+  });
+
+  it('halves once for concurrent rate limits from the same throttling event', () => {
+    const concurrency = new AdaptiveConcurrency(8);
+    const inFlight = Array.from({ length: 8 }, () => concurrency.epoch);
+
+    for (const epoch of inFlight) concurrency.recordRateLimit(epoch);
+    expect(concurrency.limit).toBe(4);
+
+    // A request started after the cut reports a new event
+    concurrency.recordRateLimit(concurrency.epoch);
+    expect(concurrency.limit).toBe(2);
+  });
+
+  it('recovers by one per 20 successes up to the maximum', () => {
+    const concurrency = new AdaptiveConcurrency(3);
+    concurrency.recordRateLimit();
+    expect(concurrency.limit).toBe(1);
+
+    for (let i = 0; i < 19; i++) concurrency.recordSuccess();
+    expect(concurrency.limit).toBe(1);
+    concurrency.recordSuccess();
+    expect(concurrency.limit).toBe(2);
+
+    for (let i = 0; i < 100; i++) concurrency.recordSuccess();
+    expect(concurrency.limit).toBe(3);
+  });
+
+  it('restarts the success streak after a rate limit', () => {
+    const concurrency = new AdaptiveConcurrency(4);
+    concurrency.recordRateLimit();
+    for (let i = 0; i < 15; i++) concurrency.recordSuccess();
+    concurrency.recordRateLimit();
+    for (let i = 0; i < 15; i++) concurrency.recordSuccess();
+    expect(concurrency.limit).toBe(1);
+  });
+});
@@ -863,6 +863,38 @@ describe('processBatch', () => {
     expect(lastCall[0]).toBe(1);
   });
 
+  it('coalesces per-document progress reports for fast batches', async () => {
+    const ids = Array.from({ length: 6 }, (_, i) => `fast-${i}`);
+    db.insert(document)
+      .values(
+        ids.map((id, i) => ({
+          id,
+          paperlessId: 100 + i,
+          title: id,
+          processingStatus: 'completed',
+          syncedAt: '2024-01-01T00:00:00Z',
+        })),
+      )
+      .run();
+    db.insert(documentContent)
+      .values(ids.map((id) => ({ documentId: id, fullText: 'text', contentHash: id })))
+      .run();
+    const onProgress = vi.fn();
+
+    await processBatch(db, {
+      provider: createMockProvider(),
+      client: createMockClient(),
+      config,
+      onProgress,
+    });
+
+    const documentReports = onProgress.mock.calls.filter(([, message]) =>
+      String(message).startsWith('Processed '),
+    );
+    expect(documentReports.length).toBeLessThan(ids.length);
+    expect(documentReports.at(-1)?.[0]).toBe(1);
+  });
+
   it('records token usage in result', async () => {
     seedDocs(db);
     const provider = createMockProvider();
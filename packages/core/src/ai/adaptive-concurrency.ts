@@ -0,0 +1,45 @@
+/** Successful requests needed before one more concurrent request is allowed back. */
+const RECOVERY_SUCCESSES = 20;
+
+/**
+ * Additive-increase/multiplicative-decrease cap on in-flight provider requests.
+ * A rate-limited request halves the cap; every RECOVERY_SUCCESSES successes
+ * raise it by one again, never above the configured maximum.
+ *
+ * Requests that were already in flight when the cap was last halved report the
+ * same throttling event, so callers pass the `epoch` a request started in and
+ * its rate limit is ignored if the cap has been cut since.
+ */
+export class AdaptiveConcurrency {
+  private current: number;
+  private successes = 0;
+  private decreases = 0;
+
+  constructor(private readonly max: number) {
+    this.current = Math.max(1, max);
+  }
+
+  get limit(): number {
+    return this.current;
+  }
+
+  /** Changes each time the cap is halved; read it when a request starts. */
+  get epoch(): number {
+    return this.decreases;
+  }
+
+  recordSuccess(): void {
+    if (this.current >= this.max) return;
+    if (++this.successes >= RECOVERY_SUCCESSES) {
+      this.successes = 0;
+      this.current++;
+    }
+  }
+
+  recordRateLimit(startedEpoch = this.decreases): void {
+    if (startedEpoch !== this.decreases) return;
+    this.current = Math.max(1, Math.floor(this.current / 2));
+    this.successes = 0;
+    this.decreases++;
+  }
+}
@@ -32,6 +32,22 @@ import type { AiCustomFieldRecommendation } from './providers/types.js';
 
 const logger = createLogger('ai-apply');
 
+/**
+ * Case-insensitive name index over Paperless reference entities. Names are
+ * lowercased once when the index is built rather than on every comparison;
+ * the first entity with a given name wins, matching `Array.find`.
+ */
+function indexByLowerName<T extends { name: string }>(items: readonly T[]): Map<string, T> {
+  const index = new Map<string, T>();
+  for (const item of items) addToNameIndex(index, item);
+  return index;
+}
+
+function addToNameIndex<T extends { name: string }>(index: Map<string, T>, item: T): void {
+  const key = item.name.toLowerCase();
+  if (!index.has(key)) index.set(key, item);
+}
+
 /** Pre-fetched reference data to avoid redundant API calls in batch mode. */
 export interface ReferenceData {
   correspondents: PaperlessCorrespondent[];
@@ -157,6 +173,10 @@ export async function applyAiResult(
         rawSuggestedCustomFields,
         customFields,
       );
+      const correspondentsByName = indexByLowerName(correspondents);
+      const documentTypesByName = indexByLowerName(documentTypes);
+      const tagsByName = indexByLowerName(tags);
+      const tagsById = new Map(tags.map((tag) => [tag.id, tag]));
 
       // Build pre-apply snapshot: use local DB data in batch mode, live API in single-doc mode
       let preApplyCorrespondent: PaperlessCorrespondent | null | undefined;
@@ -173,21 +193,17 @@ export async function applyAiResult(
       ) {
         // Reconstruct from AI result row's stored current* values + reference data
         preApplyCorrespondent = row.currentCorrespondent
-          ? correspondents.find(
-              (c) => c.name.toLowerCase() === row.currentCorrespondent!.toLowerCase(),
-            )
+          ? correspondentsByName.get(row.currentCorrespondent.toLowerCase())
           : null;
         preApplyDocType = row.currentDocumentType
-          ? documentTypes.find(
-              (dt) => dt.name.toLowerCase() === row.currentDocumentType!.toLowerCase(),
-            )
+          ? documentTypesByName.get(row.currentDocumentType.toLowerCase())
           : null;
         const currentTagNames: string[] = row.currentTagsJson
           ? JSON.parse(row.currentTagsJson)
           : [];
         preApplyTagNames = currentTagNames;
         currentDocTagIds = currentTagNames
-          .map((name) => tags.find((t) => t.name.toLowerCase() === name.toLowerCase())?.id)
+          .map((name) => tagsByName.get(name.toLowerCase())?.id)
           .filter((id): id is number => id !== undefined);
         currentCustomFields = row.currentCustomFieldsJson
           ? JSON.parse(row.currentCustomFieldsJson)
@@ -212,7 +228,7 @@ export async function applyAiResult(
           ? documentTypes.find((dt) => dt.id === currentDoc!.documentType)
           : null;
         preApplyTagNames = currentDoc!.tags
-          .map((tid) => tags.find((t) => t.id === tid)?.name)
+          .map((tid) => tagsById.get(tid)?.name)
           .filter((n): n is string => n !== undefined);
         currentDocTagIds = currentDoc!.tags;
         currentCustomFields = currentDoc!.customFields;
@@ -233,9 +249,7 @@ export async function applyAiResult(
       // Resolve correspondent
       if (options.fields.includes('correspondent')) {
         if (suggestedCorrespondent) {
-          let found = correspondents.find(
-            (c) => c.name.toLowerCase() === suggestedCorrespondent.toLowerCase(),
-          );
+          let found = correspondentsByName.get(suggestedCorrespondent.toLowerCase());
           if (!found) {
             if (options.createMissingEntities === false) {
               logger.info(
@@ -245,6 +259,7 @@ export async function applyAiResult(
             } else {
               found = await client.createCorrespondent(suggestedCorrespondent);
               correspondents.push(found);
+              addToNameIndex(correspondentsByName, found);
               logger.info({ name: suggestedCorrespondent }, 'Created new correspondent');
             }
           }
@@ -258,9 +273,7 @@ export async function applyAiResult(
       // Resolve document type
       if (options.fields.includes('documentType')) {
         if (suggestedDocumentType) {
-          let found = documentTypes.find(
-            (dt) => dt.name.toLowerCase() === suggestedDocumentType.toLowerCase(),
-          );
+          let found = documentTypesByName.get(suggestedDocumentType.toLowerCase());
           if (!found) {
             if (options.createMissingEntities === false) {
               logger.info(
@@ -270,6 +283,7 @@ export async function applyAiResult(
             } else {
               found = await client.createDocumentType(suggestedDocumentType);
               documentTypes.push(found);
+              addToNameIndex(documentTypesByName, found);
               logger.info({ name: suggestedDocumentType }, 'Created new document type');
             }
           }
@@ -296,7 +310,7 @@ export async function applyAiResult(
             logger.info({ name: tagName }, 'Skipping protected tag from AI suggestion');
             continue;
           }
-          let found = tags.find((t) => t.name.toLowerCase() === tagName.toLowerCase());
+          let found = tagsByName.get(tagName.toLowerCase());
           if (!found) {
             if (options.createMissingEntities === false) {
               logger.info({ name: tagName }, 'Skipping: would create new tag');
@@ -304,6 +318,8 @@ export async function applyAiResult(
             }
             found = await client.createTag(tagName);
             tags.push(found); // add to local cache
+            addToNameIndex(tagsByName, found);
+            tagsById.set(found.id, found);
             logger.info({ name: tagName }, 'Created new tag');
           }
           resolvedTagIds.push(found.id);
@@ -312,7 +328,7 @@ export async function applyAiResult(
         // Preserve protected tags already on the document
         if (protectedTagSet.size > 0) {
           for (const existingTagId of currentDocTagIds) {
-            const existingTag = tags.find((t) => t.id === existingTagId);
+            const existingTag = tagsById.get(existingTagId);
             if (existingTag && protectedTagSet.has(existingTag.name.toLowerCase())) {
               if (!resolvedTagIds.includes(existingTagId)) {
                 resolvedTagIds.push(existingTagId);
@@ -330,12 +346,12 @@ export async function applyAiResult(
 
       let processedTagId: number | null = null;
       if (options.addProcessedTag && options.processedTagName) {
-        let processedTag = tags.find(
-          (tag) => tag.name.toLowerCase() === options.processedTagName!.toLowerCase(),
-        );
+        let processedTag = tagsByName.get(options.processedTagName.toLowerCase());
         if (!processedTag) {
           processedTag = await client.createTag(options.processedTagName);
           tags.push(processedTag);
+          addToNameIndex(tagsByName, processedTag);
+          tagsById.set(processedTag.id, processedTag);
           logger.info({ name: options.processedTagName }, 'Created ai-processed tag');
         }
         processedTagId = processedTag.id;
@@ -359,13 +375,13 @@ export async function applyAiResult(
           ? documentTypes.find((item) => item.id === finalLiveDocument.documentType)
           : null;
         preApplyTagNames = finalLiveDocument.tags
-          .map((id) => tags.find((tag) => tag.id === id)?.name)
+          .map((id) => tagsById.get(id)?.name)
           .filter((name): name is string => name !== undefined);
       }
 
       if (resolvedTagIds && finalLiveDocument) {
         for (const existingTagId of finalLiveDocument.tags) {
-          const existingTag = tags.find((tag) => tag.id === existingTagId);
+          const existingTag = tagsById.get(existingTagId);
           if (
             existingTag &&
             protectedTagSet.has(existingTag.name.toLowerCase()) &&
@@ -409,6 +425,8 @@ export async function applyAiResult(
       if (options.auditFields) {
         if (!finalLiveDocument) throw new Error('Reviewed apply lost its live document');
         const actual = new Set<string>();
+        const auditsTags = options.auditFields.includes('tags');
+        const auditsProcessedTag = options.auditFields.includes('processedTag');
         if (
           options.auditFields.includes('title') &&
           update.title !== undefined &&
@@ -437,28 +455,24 @@ export async function applyAiResult(
           delete update.documentType;
         }
 
-        const finalTagIds = update.tags ?? finalLiveDocument.tags;
+        const liveTagIds = new Set(finalLiveDocument.tags);
+        const finalTagIds = new Set(update.tags ?? finalLiveDocument.tags);
         const tagAdded = tagsBeforeProcessed.filter(
-          (id) =>
-            !finalLiveDocument.tags.includes(id) &&
-            !(options.auditFields!.includes('processedTag') && id === processedTagId),
+          (id) => !liveTagIds.has(id) && !(auditsProcessedTag && id === processedTagId),
         );
-        const tagRemoved = finalLiveDocument.tags.filter((id) => !finalTagIds.includes(id));
+        const tagRemoved = finalLiveDocument.tags.filter((id) => !finalTagIds.has(id));
         const processedTagAdded =
           processedTagId !== null &&
-          !finalLiveDocument.tags.includes(processedTagId) &&
-          finalTagIds.includes(processedTagId);
-        if (
-          options.auditFields.includes('tags') &&
-          (tagAdded.length > 0 || tagRemoved.length > 0)
-        ) {
+          !liveTagIds.has(processedTagId) &&
+          finalTagIds.has(processedTagId);
+        if (auditsTags && (tagAdded.length > 0 || tagRemoved.length > 0)) {
           actual.add('tags');
         }
-        if (options.auditFields.includes('processedTag') && processedTagAdded) {
+        if (auditsProcessedTag && processedTagAdded) {
           actual.add(`processedTag:${processedTagId}`);
         }
         if (
-          (options.auditFields.includes('tags') || options.auditFields.includes('processedTag')) &&
+          (auditsTags || auditsProcessedTag) &&
           (tagAdded.length > 0 || tagRemoved.length > 0 || processedTagAdded)
         ) {
           tagAudit = {
@@ -564,7 +578,7 @@ export async function applyAiResult(
       }
       if (update.tags) {
         const tagNames = update.tags
-          .map((id) => tags.find((t) => t.id === id)?.name)
+          .map((id) => tagsById.get(id)?.name)
           .filter((n): n is string => n !== undefined);
         docUpdate.tagsJson = JSON.stringify(tagNames);
       }
@@ -20,6 +20,8 @@ import type { AiConfig } from './types.js';
 import { normalizeSuggestedLabel, normalizeSuggestedTags } from './normalize.js';
 import { getModelPricing, estimateResultCost } from './costs.js';
 import { TpmThrottle } from './tpm-throttle.js';
+import { AdaptiveConcurrency } from './adaptive-concurrency.js';
+import { createProgressThrottle } from '../jobs/progress-throttle.js';
 import { normalizeCustomFieldRecommendations } from './custom-fields.js';
 import { replaceAiResultWithRevision } from './history.js';
 import type { AiRequestBudget } from './extract.js';
@@ -140,20 +142,22 @@ export async function processBatch(
             : Promise.resolve([]),
         ]);
 
-        // Build document query
+        // Build document query. OCR text is read per document when it is sent,
+        // so the selection carries only whether a document has any.
+        const docColumns = {
+          id: document.id,
+          paperlessId: document.paperlessId,
+          title: document.title,
+          correspondent: document.correspondent,
+          documentType: document.documentType,
+          tagsJson: document.tagsJson,
+          customFieldsJson: document.customFieldsJson,
+          hasContent: sql<number>`coalesce(length(${documentContent.fullText}), 0) > 0`,
+        };
         let docs;
         if (syncGenerationId) {
           docs = db
-            .select({
-              id: document.id,
-              paperlessId: document.paperlessId,
-              title: document.title,
-              correspondent: document.correspondent,
-              documentType: document.documentType,
-              tagsJson: document.tagsJson,
-              customFieldsJson: document.customFieldsJson,
-              fullText: documentContent.fullText,
-            })
+            .select(docColumns)
             .from(document)
             .leftJoin(documentContent, eq(document.id, documentContent.documentId))
             .where(
@@ -172,16 +176,7 @@ export async function processBatch(
             .all();
         } else if (documentIds && documentIds.length > 0) {
           docs = db
-            .select({
-              id: document.id,
-              paperlessId: document.paperlessId,
-              title: document.title,
-              correspondent: document.correspondent,
-              documentType: document.documentType,
-              tagsJson: document.tagsJson,
-              customFieldsJson: document.customFieldsJson,
-              fullText: documentContent.fullText,
-            })
+            .select(docColumns)
             .from(document)
             .leftJoin(documentContent, eq(document.id, documentContent.documentId))
             .where(
@@ -194,16 +189,7 @@ export async function processBatch(
             .all();
         } else if (reprocess) {
           docs = db
-            .select({
-              id: document.id,
-              paperlessId: document.paperlessId,
-              title: document.title,
-              correspondent: document.correspondent,
-              documentType: document.documentType,
-              tagsJson: document.tagsJson,
-              customFieldsJson: document.customFieldsJson,
-              fullText: documentContent.fullText,
-            })
+            .select(docColumns)
             .from(document)
             .leftJoin(documentContent, eq(document.id, documentContent.documentId))
             .orderBy(document.id)
@@ -211,16 +197,7 @@ export async function processBatch(
             .all();
         } else {
           docs = db
-            .select({
-              id: document.id,
-              paperlessId: document.paperlessId,
-              title: document.title,
-              correspondent: document.correspondent,
-              documentType: document.documentType,
-              tagsJson: document.tagsJson,
-              customFieldsJson: document.customFieldsJson,
-              fullText: documentContent.fullText,
-            })
+            .select(docColumns)
             .from(document)
             .leftJoin(documentContent, eq(document.id, documentContent.documentId))
             .where(
@@ -272,55 +249,58 @@ export async function processBatch(
 
         await onProgress?.(0, `Starting AI processing of ${totalDocs} documents...`);
 
-        // Pre-partition: handle skipped docs (no content) upfront
+        // Pre-partition: handle skipped docs (no content) upfront. Their records
+        // are written in one transaction rather than one commit per document.
         const processableDocs: typeof docs = [];
         const now = new Date().toISOString();
-        for (const doc of docs) {
-          if (!doc.fullText) {
-            result.skipped++;
-            result.processed++;
-
-            // Write a skipped record so the doc leaves the unprocessed queue
-            writeAiResultWithHistory(db, {
-              documentId: doc.id,
-              paperlessId: doc.paperlessId,
-              provider: provider.provider,
-              model: config.model,
-              suggestedTitle: null,
-              suggestedCorrespondent: null,
-              suggestedDocumentType: null,
-              suggestedTagsJson: null,
-              suggestedCustomFieldsJson: null,
-              confidenceJson: null,
-              currentTitle: doc.title,
-              currentCorrespondent: doc.correspondent,
-              currentDocumentType: doc.documentType,
-              currentTagsJson: doc.tagsJson,
-              currentCustomFieldsJson: doc.customFieldsJson,
-              appliedStatus: 'skipped',
-              appliedAt: null,
-              appliedFieldsJson: null,
-              evidence: null,
-              failureType: 'no_content',
-              rawResponseJson: null,
-              promptTokens: null,
-              completionTokens: null,
-              errorMessage: 'Document has no OCR text content available for AI processing',
-              processingTimeMs: null,
-              estimatedCostUsd: null,
-              syncGenerationId,
-              createdAt: now,
-            });
+        db.transaction(() => {
+          for (const doc of docs) {
+            if (!doc.hasContent) {
+              result.skipped++;
+              result.processed++;
+
+              // Write a skipped record so the doc leaves the unprocessed queue
+              writeAiResultWithHistory(db, {
+                documentId: doc.id,
+                paperlessId: doc.paperlessId,
+                provider: provider.provider,
+                model: config.model,
+                suggestedTitle: null,
+                suggestedCorrespondent: null,
+                suggestedDocumentType: null,
+                suggestedTagsJson: null,
+                suggestedCustomFieldsJson: null,
+                confidenceJson: null,
+                currentTitle: doc.title,
+                currentCorrespondent: doc.correspondent,
+                currentDocumentType: doc.documentType,
+                currentTagsJson: doc.tagsJson,
+                currentCustomFieldsJson: doc.customFieldsJson,
+                appliedStatus: 'skipped',
+                appliedAt: null,
+                appliedFieldsJson: null,
+                evidence: null,
+                failureType: 'no_content',
+                rawResponseJson: null,
+                promptTokens: null,
+                completionTokens: null,
+                errorMessage: 'Document has no OCR text content available for AI processing',
+                processingTimeMs: null,
+                estimatedCostUsd: null,
+                syncGenerationId,
+                createdAt: now,
+              });
 
-            aiDocumentsTotal().add(1, { outcome: 'skipped', 'gen_ai.system': provider.provider });
-            logger.warn(
-              { documentId: doc.id, title: doc.title },
-              'Skipping document with no content',
-            );
-          } else {
-            processableDocs.push(doc);
+              aiDocumentsTotal().add(1, { outcome: 'skipped', 'gen_ai.system': provider.provider });
+              logger.warn(
+                { documentId: doc.id, title: doc.title },
+                'Skipping document with no content',
+              );
+            } else {
+              processableDocs.push(doc);
+            }
           }
-        }
+        });
 
         if (result.skipped > 0) {
           await onProgress?.(
@@ -343,18 +323,33 @@ export async function processBatch(
         let circuitBroken = false;
         let circuitBreakerError: Error | undefined;
         const throttle = new TpmThrottle();
+        const concurrency = new AdaptiveConcurrency(maxConcurrency);
         const retryQueue: typeof processableDocs = [];
         const MAX_RETRY_PASSES = 3;
         let requestSequence = 0;
+        const shouldReportProgress = createProgressThrottle();
+        // Pricing is a JSON blob in app_config; read and parse it once per batch
+        // rather than once per processed document
+        const pricing = getModelPricing(db, config.model);
 
         // Process a single document: API call, DB upsert, telemetry
         async function processOne(doc: (typeof processableDocs)[0]): Promise<void> {
           const docStartMs = performance.now();
+          const concurrencyEpoch = concurrency.epoch;
           try {
+            const content = db
+              .select({ fullText: documentContent.fullText })
+              .from(documentContent)
+              .where(eq(documentContent.documentId, doc.id))
+              .get();
+            if (!content?.fullText) {
+              throw new Error('Document OCR text is no longer available');
+            }
+
             const extraction = await processDocument({
               provider,
               documentTitle: doc.title,
-              documentContent: doc.fullText!,
+              documentContent: content.fullText,
               existingCorrespondents: correspondentNames,
               existingDocumentTypes: documentTypeNames,
               existingTags: tagNames,
@@ -393,7 +388,6 @@ export async function processBatch(
               : [];
 
             // Compute cost estimate
-            const pricing = getModelPricing(db, config.model);
             const estimatedCostUsd = pricing
               ? estimateResultCost(
                   pricing,
@@ -449,6 +443,7 @@ export async function processBatch(
             });
 
             result.succeeded++;
+            concurrency.recordSuccess();
             // Update throttle from rate limit headers
             if (extraction.rateLimit) {
               throttle.update(extraction.rateLimit);
@@ -497,6 +492,7 @@ export async function processBatch(
               result.rateLimitRetries++;
               const retryAfterMs = error.retryAfterMs ?? 5000;
               throttle.recordRateLimit(retryAfterMs);
+              concurrency.recordRateLimit(concurrencyEpoch);
               result.rateLimitPauses++;
               logger.warn(
                 { documentId: doc.id, retryAfterMs },
@@ -581,6 +577,9 @@ export async function processBatch(
 
           result.processed++;
           const status = throttle.getStatus();
+          // Fast documents finish many times a second; report at most once per
+          // interval, but always report pauses and the final document
+          if (!shouldReportProgress(status.paused || result.processed >= totalDocs)) return;
           let progressMsg = `Processed ${result.processed} of ${totalDocs} documents (${result.succeeded} succeeded, ${result.failed} failed)`;
           if (status.paused) {
             progressMsg = `Paused for rate limit — resuming in ${Math.ceil(status.pauseRemainingMs / 1000)}s (${result.processed} of ${totalDocs} processed)`;
@@ -596,8 +595,8 @@ export async function processBatch(
         for (let i = 0; i < processableDocs.length; i++) {
           if (circuitBroken) break;
 
-          // Wait for a concurrency slot
-          if (pending.size >= maxConcurrency) {
+          // Wait for a concurrency slot; the limit shrinks after rate limits
+          while (pending.size >= concurrency.limit) {
             await Promise.race(pending);
           }
 
@@ -642,7 +641,7 @@ export async function processBatch(
           for (let i = 0; i < retryDocs.length; i++) {
             if (circuitBroken) break;
 
-            if (pending.size >= maxConcurrency) {
+            while (pending.size >= concurrency.limit) {
               await Promise.race(pending);
             }
             if (circuitBroken) break;
@@ -663,43 +662,45 @@ export async function processBatch(
         }
 
         // Record permanent failures for docs that exhausted all retry passes
-        for (const doc of retryQueue) {
-          const now = new Date().toISOString();
-          writeAiResultWithHistory(db, {
-            documentId: doc.id,
-            paperlessId: doc.paperlessId,
-            provider: provider.provider,
-            model: config.model,
-            suggestedTitle: null,
-            suggestedCorrespondent: null,
-            suggestedDocumentType: null,
-            suggestedTagsJson: null,
-            suggestedCustomFieldsJson: null,
-            confidenceJson: null,
-            currentTitle: doc.title,
-            currentCorrespondent: doc.correspondent,
-            currentDocumentType: doc.documentType,
-            currentTagsJson: doc.tagsJson,
-            currentCustomFieldsJson: doc.customFieldsJson,
-            appliedStatus: 'failed',
-            appliedAt: null,
-            appliedFieldsJson: null,
-            evidence: null,
-            failureType: 'rate_limit',
-            rawResponseJson: null,
-            promptTokens: null,
-            completionTokens: null,
-            errorMessage: 'Rate limit exceeded after all retry passes',
-            processingTimeMs: null,
-            estimatedCostUsd: null,
-            syncGenerationId,
-            createdAt: now,
-          });
-
-          result.failed++;
-          result.processed++;
-          aiDocumentsTotal().add(1, { outcome: 'failed', 'gen_ai.system': provider.provider });
-        }
+        db.transaction(() => {
+          for (const doc of retryQueue) {
+            const now = new Date().toISOString();
+            writeAiResultWithHistory(db, {
+              documentId: doc.id,
+              paperlessId: doc.paperlessId,
+              provider: provider.provider,
+              model: config.model,
+              suggestedTitle: null,
+              suggestedCorrespondent: null,
+              suggestedDocumentType: null,
+              suggestedTagsJson: null,
+              suggestedCustomFieldsJson: null,
+              confidenceJson: null,
+              currentTitle: doc.title,
+              currentCorrespondent: doc.correspondent,
+              currentDocumentType: doc.documentType,
+              currentTagsJson: doc.tagsJson,
+              currentCustomFieldsJson: doc.customFieldsJson,
+              appliedStatus: 'failed',
+              appliedAt: null,
+              appliedFieldsJson: null,
+              evidence: null,
+              failureType: 'rate_limit',
+              rawResponseJson: null,
+              promptTokens: null,
+              completionTokens: null,
+              errorMessage: 'Rate limit exceeded after all retry passes',
+              processingTimeMs: null,
+              estimatedCostUsd: null,
+              syncGenerationId,
+              createdAt: now,
+            });
+
+            result.failed++;
+            result.processed++;
+            aiDocumentsTotal().add(1, { outcome: 'failed', 'gen_ai.system': provider.provider });
+          }
+        });
 
         result.durationMs = Math.round(performance.now() - startMs);
 
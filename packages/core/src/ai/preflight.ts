@@ -6,7 +6,12 @@ import { z } from 'zod';
 import { aiProcessingResult } from '../schema/sqlite/ai-processing.js';
 import { document } from '../schema/sqlite/documents.js';
 import { type PaperlessClient } from '../paperless/client.js';
-import type { PaperlessDocument } from '../paperless/types.js';
+import type {
+  PaperlessCorrespondent,
+  PaperlessDocument,
+  PaperlessDocumentType,
+  PaperlessTag,
+} from '../paperless/types.js';
 import type { AppDatabase } from '../db/client.js';
 import { reviewedMutationPlan } from '../schema/sqlite/review.js';
 import { resolveResultIdsForApplyScope } from './scopes.js';
@@ -202,6 +207,15 @@ function fieldsForSelection(selection: AiFieldSelection): AiApplyField[] {
   return fields;
 }
 
+/** Id of the processed tag, matched case-insensitively against the configured name. */
+function findProcessedTagId(
+  tags: PaperlessTag[],
+  processedTagName = 'ai-processed',
+): number | null {
+  const wanted = processedTagName.toLowerCase();
+  return tags.find((tag) => tag.name.toLowerCase() === wanted)?.id ?? null;
+}
+
 function auditFieldsForSelection(selection: AiFieldSelection): string[] {
   return [
     ...fieldsForSelection(selection).filter((field) => field !== 'customFields'),
@@ -241,26 +255,22 @@ export async function createAiApplyPlan(
   if (rows.size !== resultIds.length) throw new Error('One or more AI results no longer exist');
 
   const processedTagId = selection.processedTag
-    ? ((await client.getTags()).find(
-        (tag) =>
-          tag.name.toLowerCase() === (options.processedTagName ?? 'ai-processed').toLowerCase(),
-      )?.id ?? null)
+    ? findProcessedTagId(await client.getTags(), options.processedTagName)
     : null;
-  const frozenResults: FrozenAiResult[] = [];
-  for (const resultId of resultIds) {
-    const row = rows.get(resultId)!;
+  const orderedRows = resultIds.map((resultId) => rows.get(resultId)!);
+  for (const row of orderedRows) {
     if (!isReviewableAiResult(row)) {
-      throw new Error(`AI result is not pending review: ${resultId}`);
+      throw new Error(`AI result is not pending review: ${row.id}`);
     }
-    const live = await client.getDocument(row.paperlessId);
-    frozenResults.push({
-      resultId,
-      resultVersion: selectedSuggestionVersion(row, selection),
-      documentId: row.documentId,
-      paperlessId: row.paperlessId,
-      reviewedState: selectedState(live, selection, processedTagId),
-    });
   }
+  const liveDocuments = await fetchLiveDocuments(client, orderedRows.map((row) => row.paperlessId));
+  const frozenResults: FrozenAiResult[] = orderedRows.map((row, index) => ({
+    resultId: row.id,
+    resultVersion: selectedSuggestionVersion(row, selection),
+    documentId: row.documentId,
+    paperlessId: row.paperlessId,
+    reviewedState: selectedState(liveDocuments[index], selection, processedTagId),
+  }));
 
   const allowClearing = options.allowClearing ?? false;
   const createMissingEntities = options.createMissingEntities ?? true;
@@ -407,25 +417,99 @@ function appliedSelection(
   };
 }
 
+/** Live documents requested at once while previewing a reviewed plan. */
+const LIVE_DOCUMENT_FETCH_CONCURRENCY = 8;
+
+/**
+ * Fetch the live Paperless documents for a plan preview, a bounded number at a
+ * time rather than one round trip after another. Results line up with
+ * `paperlessIds`.
+ */
+export async function fetchLiveDocuments(
+  client: PaperlessClient,
+  paperlessIds: readonly number[],
+): Promise<PaperlessDocument[]> {
+  const documents: PaperlessDocument[] = new Array(paperlessIds.length);
+  let next = 0;
+  const runner = async () => {
+    while (next < paperlessIds.length) {
+      const index = next++;
+      documents[index] = await client.getDocument(paperlessIds[index]);
+    }
+  };
+  await Promise.all(
+    Array.from({ length: Math.min(LIVE_DOCUMENT_FETCH_CONCURRENCY, paperlessIds.length) }, runner),
+  );
+  return documents;
+}
+
+/** Loads a reference list, refetching only when a required id is missing. */
+type ReferenceListLoader<T> = (requiredIds: readonly number[]) => Promise<T[]>;
+
+export interface ReferenceLists {
+  correspondents: ReferenceListLoader<PaperlessCorrespondent>;
+  documentTypes: ReferenceListLoader<PaperlessDocumentType>;
+  tags: ReferenceListLoader<PaperlessTag>;
+}
+
+function cachedReferenceList<T extends { id: number }>(
+  fetchAll: () => Promise<T[]>,
+): ReferenceListLoader<T> {
+  let cached: Promise<T[]> | undefined;
+  const load = () => {
+    const pending = fetchAll();
+    // Forget failed fetches so the next document retries instead of rethrowing
+    pending.catch(() => {
+      if (cached === pending) cached = undefined;
+    });
+    return (cached = pending);
+  };
+  return async (requiredIds) => {
+    const list = await (cached ?? load());
+    const known = new Set(list.map(({ id }) => id));
+    // An id created after the first fetch (e.g. by another apply) forces a refresh
+    return requiredIds.every((id) => known.has(id)) ? list : load();
+  };
+}
+
+/**
+ * Reference lists shared across one mutation plan run, so refreshing each
+ * document's local cache does not re-download every list per document.
+ */
+export function createReferenceLists(client: PaperlessClient): ReferenceLists {
+  return {
+    correspondents: cachedReferenceList(() => client.getCorrespondents()),
+    documentTypes: cachedReferenceList(() => client.getDocumentTypes()),
+    tags: cachedReferenceList(() => client.getTags()),
+  };
+}
+
 async function syncSelectedLocalCache(
   db: AppDatabase,
-  client: PaperlessClient,
+  lists: ReferenceLists,
   row: typeof aiProcessingResult.$inferSelect,
   live: PaperlessDocument,
   selection: AiFieldSelection,
 ): Promise<void> {
   const update: Record<string, unknown> = {};
   if (selection.title) update.title = live.title;
-  if (selection.correspondent) {
-    const correspondents = await client.getCorrespondents();
+  // The reference lists are independent requests, so fetch them concurrently
+  const [correspondents, documentTypes, tags] = await Promise.all([
+    selection.correspondent
+      ? lists.correspondents(live.correspondent !== null ? [live.correspondent] : [])
+      : undefined,
+    selection.documentType
+      ? lists.documentTypes(live.documentType !== null ? [live.documentType] : [])
+      : undefined,
+    selection.tags || selection.processedTag ? lists.tags(live.tags) : undefined,
+  ]);
+  if (correspondents) {
     update.correspondent = correspondents.find(({ id }) => id === live.correspondent)?.name ?? null;
   }
-  if (selection.documentType) {
-    const documentTypes = await client.getDocumentTypes();
+  if (documentTypes) {
     update.documentType = documentTypes.find(({ id }) => id === live.documentType)?.name ?? null;
   }
-  if (selection.tags || selection.processedTag) {
-    const tags = await client.getTags();
+  if (tags) {
     update.tagsJson = JSON.stringify(
       live.tags
         .map((id) => tags.find((tag) => tag.id === id)?.name)
@@ -491,11 +575,9 @@ export async function executeClaimedAiApplyPlan(
     results: [],
   };
   const processedTagId = plan.selection.processedTag
-    ? ((await client.getTags()).find(
-        (tag) =>
-          tag.name.toLowerCase() === (options.processedTagName ?? 'ai-processed').toLowerCase(),
-      )?.id ?? null)
+    ? findProcessedTagId(await client.getTags(), options.processedTagName)
     : null;
+  const referenceLists = createReferenceLists(client);
   for (const frozen of plan.results) {
     try {
       const row = db
@@ -525,7 +607,7 @@ export async function executeClaimedAiApplyPlan(
           });
           continue;
         }
-        await syncSelectedLocalCache(db, client, row, live, actualSelection);
+        await syncSelectedLocalCache(db, referenceLists, row, live, actualSelection);
         output.applied++;
         output.results.push({ resultId: frozen.resultId, status: 'applied' });
         continue;
@@ -553,7 +635,7 @@ export async function executeClaimedAiApplyPlan(
         if (intended && differingReviewedFields(liveState, intended).length === 0) {
           const actualSelection = appliedSelection(plan.selection, storedAppliedFields);
           finalizeStartedAiApply(db, row.id, storedAppliedFields);
-          await syncSelectedLocalCache(db, client, row, live, actualSelection);
+          await syncSelectedLocalCache(db, referenceLists, row, live, actualSelection);
           output.applied++;
           output.results.push({ resultId: frozen.resultId, status: 'applied' });
           continue;
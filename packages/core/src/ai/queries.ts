@@ -273,6 +273,7 @@ interface AiInboxCursor {
 }
 
 const AI_INBOX_CURSOR_KEY = 'internal.aiInboxCursorKey';
+const AI_INBOX_CURSOR_AAD = Buffer.from('ai-inbox-cursor:v1');
 
 function getAiInboxCursorKey(db: AppDatabase): string {
   const existing = db.select().from(appConfig).where(eq(appConfig.key, AI_INBOX_CURSOR_KEY)).get();
@@ -299,11 +300,10 @@ function canonicalAiInboxFilters(query: AiInboxQuery): string {
   });
 }
 
-function encodeAiInboxCursor(db: AppDatabase, cursor: AiInboxCursor): string {
+function encodeAiInboxCursor(key: Buffer, cursor: AiInboxCursor): string {
   const nonce = randomBytes(12);
-  const key = Buffer.from(getAiInboxCursorKey(db), 'base64url');
   const cipher = createCipheriv('aes-256-gcm', key, nonce);
-  cipher.setAAD(Buffer.from('ai-inbox-cursor:v1'));
+  cipher.setAAD(AI_INBOX_CURSOR_AAD);
   const ciphertext = Buffer.concat([cipher.update(JSON.stringify(cursor), 'utf8'), cipher.final()]);
   return [
     'v1',
@@ -314,7 +314,7 @@ function encodeAiInboxCursor(db: AppDatabase, cursor: AiInboxCursor): string {
 }
 
 function decodeAiInboxCursor(
-  db: AppDatabase,
+  key: Buffer,
   value: string,
   queue: AiInboxQueue,
   filters: string,
@@ -327,13 +327,8 @@ function decodeAiInboxCursor(
     const nonce = Buffer.from(encodedNonce, 'base64url');
     const tag = Buffer.from(encodedTag, 'base64url');
     if (nonce.length !== 12 || tag.length !== 16) throw new Error('invalid');
-    const decipher = createDecipheriv(
-      'aes-256-gcm',
-      Buffer.from(getAiInboxCursorKey(db), 'base64url'),
-      nonce,
-      { authTagLength: 16 },
-    );
-    decipher.setAAD(Buffer.from('ai-inbox-cursor:v1'));
+    const decipher = createDecipheriv('aes-256-gcm', key, nonce, { authTagLength: 16 });
+    decipher.setAAD(AI_INBOX_CURSOR_AAD);
     decipher.setAuthTag(tag);
     const payload = Buffer.concat([
       decipher.update(Buffer.from(encodedCiphertext, 'base64url')),
@@ -415,20 +410,20 @@ export function listAiReviewInbox(db: AppDatabase, query: AiInboxQuery): AiInbox
 
   const baseWhere = and(...conditions);
   const canonicalFilters = canonicalAiInboxFilters(query);
+  // Read the cursor key at most once per page, however many cursors use it
+  let cursorKey: Buffer | undefined;
+  const getCursorKey = () => (cursorKey ??= Buffer.from(getAiInboxCursorKey(db), 'base64url'));
   const cursor = query.cursor
-    ? decodeAiInboxCursor(db, query.cursor, query.queue, canonicalFilters)
+    ? decodeAiInboxCursor(getCursorKey(), query.cursor, query.queue, canonicalFilters)
     : null;
   const isDescending = query.queue !== 'failures';
   const isPrevious = cursor?.direction === 'previous';
 
   if (cursor) {
     const comparison = isDescending !== isPrevious ? '<' : '>';
+    // Row-value comparison: the rank expression is evaluated once per row
     conditions.push(
-      sql`(
-        ${rankExpression} ${sql.raw(comparison)} ${cursor.rank}
-        OR (${rankExpression} = ${cursor.rank} AND ${aiProcessingResult.createdAt} ${sql.raw(comparison)} ${cursor.createdAt})
-        OR (${rankExpression} = ${cursor.rank} AND ${aiProcessingResult.createdAt} = ${cursor.createdAt} AND ${aiProcessingResult.id} ${sql.raw(comparison)} ${cursor.id})
-      )`,
+      sql`(${rankExpression}, ${aiProcessingResult.createdAt}, ${aiProcessingResult.id}) ${sql.raw(comparison)} (${cursor.rank}, ${cursor.createdAt}, ${cursor.id})`,
     );
   }
 
@@ -512,7 +507,7 @@ export function listAiReviewInbox(db: AppDatabase, query: AiInboxQuery): AiInbox
     row: (typeof pageRows)[number],
     direction: AiInboxCursor['direction'],
   ): string =>
-    encodeAiInboxCursor(db, {
+    encodeAiInboxCursor(getCursorKey(), {
       v: 1,
       queue: query.queue,
       direction,
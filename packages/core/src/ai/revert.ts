@@ -22,7 +22,9 @@ import type {
   AiMutationPlanPayload,
   AiMutationPlanPreview,
   ClaimedAiMutationPlan,
+  ReferenceLists,
 } from './preflight.js';
+import { createReferenceLists, fetchLiveDocuments } from './preflight.js';
 import type { AppliedTagAudit } from './queries.js';
 import { PaperlessApiError, PaperlessConnectionError } from '../paperless/errors.js';
 
@@ -80,6 +82,7 @@ function tagAudit(row: typeof aiProcessingResult.$inferSelect): AppliedTagAudit
     if (!Array.isArray(parsed)) return parsed;
   }
   const after = parsedTagIds(row.appliedTagIdsJson);
+  const afterSet = new Set(after);
   const fields = row.appliedFieldsJson ? (JSON.parse(row.appliedFieldsJson) as string[]) : [];
   const exactProcessed = fields.find((field) => field.startsWith('processedTag:'));
   const processedTagId = exactProcessed
@@ -91,7 +94,7 @@ function tagAudit(row: typeof aiProcessingResult.$inferSelect): AppliedTagAudit
   return {
     after,
     tagAdded: after.filter((id) => !before.has(id) && id !== legacyProcessedId),
-    tagRemoved: [...before].filter((id) => !after.includes(id)),
+    tagRemoved: [...before].filter((id) => !afterSet.has(id)),
     processedTagId: legacyProcessedId,
     processedTagAdded: legacyProcessedId !== null && !before.has(legacyProcessedId),
   };
@@ -211,7 +214,7 @@ export async function createAiRevertPlan(
   const selection = aiFieldSelectionSchema.parse(rawSelection);
   const resultIds = [...new Set(requestedResultIds)];
   if (resultIds.length === 0) throw new Error('No AI results selected for revert');
-  const results: AiMutationPlanPayload['results'] = [];
+  const rows: (typeof aiProcessingResult.$inferSelect)[] = [];
   for (const resultId of resultIds) {
     const row = db
       .select()
@@ -234,13 +237,17 @@ export async function createAiRevertPlan(
     ) {
       throw new Error(`AI revert selection includes a field that was not applied: ${resultId}`);
     }
-    const live = await client.getDocument(row.paperlessId);
-    const liveState = selectedLiveState(live, selection, tagAudit(row));
+    rows.push(row);
+  }
+  const liveDocuments = await fetchLiveDocuments(client, rows.map((row) => row.paperlessId));
+  const results: AiMutationPlanPayload['results'] = [];
+  for (const [index, row] of rows.entries()) {
+    const liveState = selectedLiveState(liveDocuments[index], selection, tagAudit(row));
     if (JSON.stringify(liveState) !== JSON.stringify(appliedState(row, selection))) {
-      throw new Error(`AI revert preview conflicts with live Paperless state: ${resultId}`);
+      throw new Error(`AI revert preview conflicts with live Paperless state: ${row.id}`);
     }
     results.push({
-      resultId,
+      resultId: row.id,
       resultVersion: revertVersion(row, selection),
       documentId: row.documentId,
       paperlessId: row.paperlessId,
@@ -320,23 +327,30 @@ function mergeRevertedCustomFields(
 
 async function syncRevertedLocalCache(
   db: AppDatabase,
-  client: PaperlessClient,
+  lists: ReferenceLists,
   row: typeof aiProcessingResult.$inferSelect,
   live: PaperlessDocument,
   selection: AiFieldSelection,
 ): Promise<void> {
   const update: Record<string, unknown> = {};
   if (selection.title) update.title = live.title;
-  if (selection.correspondent) {
-    const correspondents = await client.getCorrespondents();
+  // The reference lists are independent requests, so fetch them concurrently
+  const [correspondents, documentTypes, tags] = await Promise.all([
+    selection.correspondent
+      ? lists.correspondents(live.correspondent !== null ? [live.correspondent] : [])
+      : undefined,
+    selection.documentType
+      ? lists.documentTypes(live.documentType !== null ? [live.documentType] : [])
+      : undefined,
+    selection.tags || selection.processedTag ? lists.tags(live.tags) : undefined,
+  ]);
+  if (correspondents) {
     update.correspondent = correspondents.find(({ id }) => id === live.correspondent)?.name ?? null;
   }
-  if (selection.documentType) {
-    const documentTypes = await client.getDocumentTypes();
+  if (documentTypes) {
     update.documentType = documentTypes.find(({ id }) => id === live.documentType)?.name ?? null;
   }
-  if (selection.tags || selection.processedTag) {
-    const tags = await client.getTags();
+  if (tags) {
     update.tagsJson = JSON.stringify(
       live.tags
         .map((id) => tags.find((tag) => tag.id === id)?.name)
@@ -367,6 +381,7 @@ export async function executeClaimedAiRevertPlan(
     total: plan.results.length,
     results: [],
   };
+  const referenceLists = createReferenceLists(client);
   for (const frozen of plan.results) {
     try {
       const row = db
@@ -397,7 +412,7 @@ export async function executeClaimedAiRevertPlan(
           });
           continue;
         }
-        await syncRevertedLocalCache(db, client, row, live, plan.selection);
+        await syncRevertedLocalCache(db, referenceLists, row, live, plan.selection);
         output.applied++;
         output.results.push({ resultId: row.id, status: 'applied' });
         continue;
@@ -437,7 +452,7 @@ export async function executeClaimedAiRevertPlan(
             })
             .where(eq(aiProcessingResult.id, row.id))
             .run();
-          await syncRevertedLocalCache(db, client, row, live, plan.selection);
+          await syncRevertedLocalCache(db, referenceLists, row, live, plan.selection);
           output.applied++;
           output.results.push({ resultId: row.id, status: 'applied' });
           continue;
@@ -492,7 +507,7 @@ export async function executeClaimedAiRevertPlan(
         .run();
       await syncRevertedLocalCache(
         db,
-        client,
+        referenceLists,
         row,
         {
           ...live,
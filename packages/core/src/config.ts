@@ -7,6 +7,7 @@ const configSchema = z
     PAPERLESS_API_TOKEN: z.string().optional(),
     PAPERLESS_USERNAME: z.string().optional(),
     PAPERLESS_PASSWORD: z.string().optional(),
+    PAPERLESS_MAX_REQUESTS_PER_SECOND: z.coerce.number().positive().optional(),
     PORT: z.coerce.number().int().min(1).max(65535).default(3000),
     LOG_LEVEL: z.enum(['debug', 'info', 'warn', 'error']).default('info'),
     CORS_ALLOW_ORIGIN: z.string().default(''),
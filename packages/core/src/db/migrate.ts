@@ -134,6 +134,9 @@ export async function migrateDatabase(sqlite: Database.Database): Promise<void>
   // Pre-DDL migration: add title-related columns to ai_processing_result
   migrateAiTitleColumns(sqlite);
 
+  // Pre-DDL migration: key MinHash signatures by the content they were built from
+  migrateSignatureContentHash(sqlite);
+
   // Compatibility migrations run independently of the stored schema hash so
   // released intermediate schemas are canonical before generated DDL executes.
   migrateJobExecutionToken(sqlite);
@@ -1908,6 +1911,21 @@ function migrateAiTitleColumns(sqlite: Database.Database): void {
   }
 }
 
+/**
+ * Add content_hash to document_signature so signatures can be reused across
+ * documents with identical normalized text. Existing rows get NULL and are
+ * simply not used as cache sources until they are regenerated.
+ */
+function migrateSignatureContentHash(sqlite: Database.Database): void {
+  if (!tableHasColumn(sqlite, 'document_signature', 'id')) return;
+  if (tableHasColumn(sqlite, 'document_signature', 'content_hash')) return;
+
+  sqlite.exec(`ALTER TABLE document_signature ADD COLUMN content_hash TEXT`);
+  sqlite.exec(
+    `CREATE INDEX IF NOT EXISTS idx_ds_content_hash ON document_signature (content_hash)`,
+  );
+}
+
 /** Add the per-launch worker ownership token even when an old hash claims current DDL. */
 function migrateJobExecutionToken(sqlite: Database.Database): void {
   if (!tableHasColumn(sqlite, 'job', 'id')) return;
@@ -1,5 +1,9 @@
 import { describe, it, expect } from 'vitest';
-import { extractDiscriminativeTokens, computeDiscriminativeScore } from '../discriminative.js';
+import {
+  compareDiscriminativeTokens,
+  extractDiscriminativeTokens,
+  computeDiscriminativeScore,
+} from '../discriminative.js';
 
 describe('extractDiscriminativeTokens', () => {
   // ── Dates ───────────────────────────────────────────────────────────
@@ -553,3 +557,17 @@ describe('computeDiscriminativeScore', () => {
     });
   });
 });
+
+describe('compareDiscriminativeTokens', () => {
+  it('matches computeDiscriminativeScore on pre-extracted tokens', () => {
+    const text1 = 'invoice inv-2024-001 dated 15/01/2024 total $1,234.56';
+    const text2 = 'invoice inv-2024-002 dated 15/02/2024 total $1,234.56';
+
+    expect(
+      compareDiscriminativeTokens(
+        extractDiscriminativeTokens(text1),
+        extractDiscriminativeTokens(text2),
+      ),
+    ).toBe(computeDiscriminativeScore(text1, text2));
+  });
+});
@@ -1,5 +1,11 @@
-import { describe, it, expect } from 'vitest';
-import { tokenSortRatio, sampleText } from '../fuzzy.js';
+import { describe, it, expect, vi } from 'vitest';
+import { distance } from 'fastest-levenshtein';
+import { tokenSortRatio, sortedTokenRatio, sortTokens, sampleText } from '../fuzzy.js';
+
+vi.mock('fastest-levenshtein', async (importOriginal) => {
+  const actual = await importOriginal<typeof import('fastest-levenshtein')>();
+  return { ...actual, distance: vi.fn(actual.distance) };
+});
 
 describe('tokenSortRatio', () => {
   it('returns 1.0 for identical strings', () => {
@@ -28,6 +34,51 @@ describe('tokenSortRatio', () => {
   it('handles strings with extra whitespace', () => {
     expect(tokenSortRatio('  hello   world  ', 'world hello')).toBe(1.0);
   });
+
+  it('returns 0 when the ratio falls below scoreCutoff', () => {
+    const ratio = tokenSortRatio('hello world', 'hello there');
+    expect(tokenSortRatio('hello world', 'hello there', ratio + 0.01)).toBe(0);
+    expect(tokenSortRatio('hello world', 'hello there', ratio)).toBe(ratio);
+  });
+
+  it('short-circuits when length difference alone rules out the cutoff', () => {
+    expect(tokenSortRatio('short', 'a much much longer piece of text', 0.5)).toBe(0);
+  });
+});
+
+describe('sortTokens', () => {
+  it('sorts tokens and collapses whitespace', () => {
+    expect(sortTokens('  world\thello  foo ')).toBe('foo hello world');
+  });
+
+  it('returns an empty string for whitespace-only input', () => {
+    expect(sortTokens('   ')).toBe('');
+  });
+});
+
+describe('sortedTokenRatio', () => {
+  it('matches tokenSortRatio on presorted input', () => {
+    const a = 'the quick brown fox';
+    const b = 'fox brown quick a';
+    expect(sortedTokenRatio(sortTokens(a), sortTokens(b))).toBe(tokenSortRatio(a, b));
+  });
+
+  it('rejects equal-length strings with disjoint characters below the cutoff', () => {
+    expect(sortedTokenRatio('aaaa bbbb', 'cccc dddd', 0.5)).toBe(0);
+  });
+
+  it('counts the deficit of characters that the longer string repeats', () => {
+    // 'a' is shared but appears nine more times in the second string, so at
+    // least nine edits are needed and the bound alone rules out the cutoff
+    vi.mocked(distance).mockClear();
+    expect(sortedTokenRatio('abcdefgh', 'aaaaaaaaaa', 0.2)).toBe(0);
+    expect(distance).not.toHaveBeenCalled();
+  });
+
+  it('returns the exact ratio when the cheap bounds pass', () => {
+    const exact = sortedTokenRatio('apple banana cherry', 'apple banana cherri');
+    expect(sortedTokenRatio('apple banana cherry', 'apple banana cherri', 0.9)).toBe(exact);
+  });
 });
 
 describe('sampleText', () => {
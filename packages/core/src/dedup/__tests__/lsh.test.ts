@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { LSHIndex } from '../lsh.js';
+import { LSHIndex, SortedBandIndex } from '../lsh.js';
 import { MinHash } from '../minhash.js';
 
 function makeShingleSet(start: number, count: number): Set<number> {
@@ -91,3 +91,53 @@ describe('LSHIndex', () => {
     expect(lsh.rowsPerBand).toBe(9); // floor(192/20) = 9
   });
 });
+
+describe('SortedBandIndex', () => {
+  it('returns the same candidates as LSHIndex', () => {
+    const width = 128;
+    const starts = [0, 5, 50, 1000, 1003, 20000];
+    const matrix = new Uint32Array(starts.length * width);
+    const lsh = new LSHIndex(width, 16);
+
+    starts.forEach((start, row) => {
+      const mh = new MinHash(width);
+      mh.update(makeShingleSet(start, 100));
+      matrix.set(mh.signature, row * width);
+      lsh.insert(String(row), mh.signature);
+    });
+
+    const index = new SortedBandIndex(matrix, width, starts.length, 16);
+    for (let row = 0; row < starts.length; row++) {
+      const expected = lsh.getCandidates(matrix.subarray(row * width, (row + 1) * width));
+      const actual = [...index.getCandidateRows(row)].map(String);
+      expect(new Set(actual)).toEqual(expected);
+    }
+  });
+
+  it('includes rows with identical signatures', () => {
+    const width = 64;
+    const mh = new MinHash(width);
+    mh.update(makeShingleSet(0, 50));
+    const matrix = new Uint32Array(3 * width);
+    matrix.set(mh.signature, 0);
+    matrix.set(mh.signature, 2 * width);
+
+    const index = new SortedBandIndex(matrix, width, 3, 8);
+    expect(index.getCandidateRows(0)).toEqual(new Set([0, 2]));
+  });
+
+  it('skips buckets larger than maxBucketSize', () => {
+    const width = 64;
+    const mh = new MinHash(width);
+    mh.update(makeShingleSet(0, 50));
+    const matrix = new Uint32Array(4 * width);
+    for (let row = 0; row < 3; row++) {
+      matrix.set(mh.signature, row * width);
+    }
+
+    const index = new SortedBandIndex(matrix, width, 4, 8, 2);
+    expect(index.largestBucketSize).toBe(3);
+    expect(index.oversizedBuckets).toBe(8);
+    expect(index.getCandidateRows(0)).toEqual(new Set([0]));
+  });
+});
@@ -20,6 +20,29 @@ describe('MinHash', () => {
     expect(Array.from(mh1.signature)).toEqual(Array.from(mh2.signature));
   });
 
+  it('keeps coefficient tables for different sizes consistent', () => {
+    const shingles = makeShingleSet(0, 100);
+    const large = new MinHash(128);
+    large.update(shingles);
+    const small = new MinHash(64);
+    small.update(shingles);
+
+    // Both sizes draw from the same seeded sequence, so the smaller
+    // signature is a prefix of the larger one.
+    expect(Array.from(small.signature)).toEqual(Array.from(large.signature.subarray(0, 64)));
+  });
+
+  it('matches signatures from the original BigInt hashing', () => {
+    // Reference values from ((a * x + b) % (2^61 - 1)) % (2^32 - 1) in BigInt,
+    // including shingles at the edges of the 32-bit range.
+    const mh = new MinHash(8);
+    mh.update(new Set([0, 1, 0x7fffffff, 0xdeadbeef, 0xffffffff]));
+
+    expect(Array.from(mh.signature)).toEqual([
+      212146949, 1582700367, 1724826835, 17853321, 706864564, 566860811, 226512616, 1040436430,
+    ]);
+  });
+
   it('estimates Jaccard similarity within reasonable tolerance', () => {
     // Create two sets with known overlap
     // Set A: 0..99 (100 elements)
@@ -82,6 +105,15 @@ describe('MinHash', () => {
     expect(MinHash.jaccardFromArrays(mh.signature, restored.signature)).toBe(1.0);
   });
 
+  it('infers numPermutations from the serialized length', () => {
+    const mh = new MinHash(64);
+    mh.update(makeShingleSet(0, 50));
+
+    const restored = MinHash.deserialize(mh.serialize());
+    expect(restored.numPermutations).toBe(64);
+    expect(() => MinHash.deserialize(mh.serialize(), 128)).toThrow('expected 512');
+  });
+
   describe('jaccardFromArrays', () => {
     it('gives same result as instance jaccard method', () => {
       const setA = makeShingleSet(0, 100);
@@ -97,6 +129,21 @@ describe('MinHash', () => {
       expect(staticResult).toBe(instanceResult);
     });
 
+    it('matches jaccardFromArrays when comparing rows of a signature matrix', () => {
+      const mhA = new MinHash(64);
+      mhA.update(makeShingleSet(0, 100));
+      const mhB = new MinHash(64);
+      mhB.update(makeShingleSet(40, 100));
+
+      const matrix = new Uint32Array(3 * 64);
+      matrix.set(mhA.signature, 64);
+      matrix.set(mhB.signature, 128);
+
+      expect(MinHash.jaccardFromMatrix(matrix, 64, 1, 2)).toBe(
+        MinHash.jaccardFromArrays(mhA.signature, mhB.signature),
+      );
+    });
+
     it('throws on mismatched array lengths', () => {
       const a = new Uint32Array(64);
       const b = new Uint32Array(128);
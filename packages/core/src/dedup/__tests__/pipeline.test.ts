@@ -20,7 +20,7 @@ function seedDocument(
   paperlessId: number,
   title: string,
   text: string,
-  opts?: { processingStatus?: string },
+  opts?: { processingStatus?: string; contentHash?: string },
 ): string {
   const now = new Date().toISOString();
   const words = text.split(/\s+/).filter((w) => w.length > 0);
@@ -41,6 +41,7 @@ function seedDocument(
       documentId: result.id,
       normalizedText: text,
       wordCount: words.length,
+      contentHash: opts?.contentHash,
     })
     .run();
 
@@ -314,6 +315,97 @@ describe('runAnalysis pipeline', () => {
     expect(result2.signaturesReused).toBe(0);
   });
 
+  it('should reuse a stored signature for documents with the same content hash', async () => {
+    const text = generateText('the quick brown fox jumps over the lazy dog near the river', 10);
+    const docId1 = seedDocument(db, 1, 'Doc 1', text, { contentHash: 'shared-hash' });
+
+    await runAnalysis(db);
+
+    // Different text under the same hash proves the signature was copied, not recomputed
+    const docId2 = seedDocument(
+      db,
+      2,
+      'Doc 2',
+      generateText('completely different document about space travel exploration', 10),
+      { contentHash: 'shared-hash' },
+    );
+
+    const result = await runAnalysis(db);
+    expect(result.signaturesGenerated).toBe(1);
+
+    const sig1 = db
+      .select()
+      .from(documentSignature)
+      .where(eq(documentSignature.documentId, docId1))
+      .get();
+    const sig2 = db
+      .select()
+      .from(documentSignature)
+      .where(eq(documentSignature.documentId, docId2))
+      .get();
+    expect(sig2?.contentHash).toBe('shared-hash');
+    expect(Buffer.compare(sig1!.minhashSignature!, sig2!.minhashSignature!)).toBe(0);
+  });
+
+  it('should group documents with the same content hash as exact duplicates', async () => {
+    const text = generateText('the quick brown fox jumps over the lazy dog near the river', 10);
+    seedDocument(db, 1, 'Doc 1', text, { contentHash: 'same-text' });
+    seedDocument(db, 2, 'Doc 2', text, { contentHash: 'same-text' });
+
+    const result = await runAnalysis(db);
+    expect(result.groupsCreated).toBe(1);
+
+    const group = db.select().from(duplicateGroup).get();
+    expect(group?.confidenceScore).toBe(1);
+    expect(group?.jaccardSimilarity).toBe(1);
+    expect(group?.fuzzyTextRatio).toBe(1);
+  });
+
+  it('should group exact duplicates that overflow every LSH bucket', async () => {
+    const text = generateText('the quick brown fox jumps over the lazy dog near the river', 10);
+    for (let i = 1; i <= 5; i++) {
+      seedDocument(db, i, `Copy ${i}`, text, { contentHash: 'same-text' });
+    }
+
+    // Identical signatures share a bucket in every band, so a cap of 3 skips them all
+    const result = await runAnalysis(db, { maxLshBucketSize: 3 });
+    expect(result.groupsCreated).toBe(1);
+
+    const members = db.select().from(duplicateMember).all();
+    expect(members).toHaveLength(5);
+    expect(db.select().from(duplicateGroup).get()?.confidenceScore).toBe(1);
+  });
+
+  it('should rescore a former exact duplicate after its content is edited', async () => {
+    const text = generateText('the quick brown fox jumps over the lazy dog near the river', 10);
+    seedDocument(db, 1, 'Doc 1', text, { contentHash: 'same-text' });
+    const docId2 = seedDocument(db, 2, 'Doc 2', text, { contentHash: 'same-text' });
+    await runAnalysis(db);
+
+    // Sync rewrites the content and marks the document pending but keeps its signature
+    db.update(documentContent)
+      .set({ normalizedText: `${text} signed copy`, wordCount: 132, contentHash: 'edited-text' })
+      .where(eq(documentContent.documentId, docId2))
+      .run();
+    db.update(document).set({ processingStatus: 'pending' }).where(eq(document.id, docId2)).run();
+
+    const result = await runAnalysis(db);
+    expect(result.signaturesGenerated).toBe(1);
+    expect(result.signaturesReused).toBe(0);
+
+    const sig2 = db
+      .select()
+      .from(documentSignature)
+      .where(eq(documentSignature.documentId, docId2))
+      .get();
+    expect(sig2?.contentHash).toBe('edited-text');
+
+    const group = db.select().from(duplicateGroup).get();
+    expect(group).toBeDefined();
+    expect(group!.fuzzyTextRatio).toBeLessThan(1);
+    expect(group!.confidenceScore).toBeLessThan(1);
+  });
+
   it('should set primary document to the one with lowest paperlessId', async () => {
     const text = generateText('the quick brown fox jumps over the lazy dog near the river', 10);
 
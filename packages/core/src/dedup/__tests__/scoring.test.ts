@@ -1,5 +1,6 @@
 import { describe, it, expect } from 'vitest';
 import { computeSimilarityScore } from '../scoring.js';
+import { sortTokens } from '../fuzzy.js';
 import type { DocumentScoringData, SimilarityWeights } from '../types.js';
 
 const defaultWeights: SimilarityWeights = {
@@ -18,21 +19,6 @@ function makeDoc(overrides: Partial<DocumentScoringData> = {}): DocumentScoringD
 }
 
 describe('computeSimilarityScore', () => {
-  describe('quick mode', () => {
-    it('returns only jaccard similarity', () => {
-      const doc1 = makeDoc();
-      const doc2 = makeDoc({ id: 'doc2' });
-      const result = computeSimilarityScore(doc1, doc2, 0.85, defaultWeights, {
-        quickMode: true,
-      });
-
-      expect(result.overall).toBe(0.85);
-      expect(result.jaccard).toBe(0.85);
-      expect(result.fuzzy).toBe(0);
-      expect(result.discriminative).toBe(0);
-    });
-  });
-
   describe('full mode', () => {
     it('computes base score from jaccard and fuzzy with penalty applied', () => {
       const doc1 = makeDoc();
@@ -167,4 +153,46 @@ describe('computeSimilarityScore', () => {
       expect(resultWithPenalty.overall).toBeLessThan(resultNoPenalty.overall);
     });
   });
+
+  describe('precomputed sorted tokens', () => {
+    it('produces the same score as sorting on the fly', () => {
+      const doc1 = makeDoc({ normalizedText: 'alpha beta gamma delta' });
+      const doc2 = makeDoc({ id: 'doc2', normalizedText: 'delta gamma beta epsilon' });
+
+      const onTheFly = computeSimilarityScore(doc1, doc2, 0.7, defaultWeights);
+      const presorted = computeSimilarityScore(
+        { ...doc1, sortedTokens: sortTokens(doc1.normalizedText) },
+        { ...doc2, sortedTokens: sortTokens(doc2.normalizedText) },
+        0.7,
+        defaultWeights,
+      );
+      expect(presorted).toEqual(onTheFly);
+    });
+  });
+
+  describe('similarity threshold cutoff', () => {
+    it('matches the uncut score when the pair clears the threshold', () => {
+      const doc1 = makeDoc();
+      const doc2 = makeDoc({ id: 'doc2' });
+
+      const full = computeSimilarityScore(doc1, doc2, 0.9, defaultWeights);
+      const cut = computeSimilarityScore(doc1, doc2, 0.9, defaultWeights, {
+        similarityThreshold: 0.75,
+      });
+      expect(cut).toEqual(full);
+    });
+
+    it('skips pairs whose fuzzy score cannot reach the threshold', () => {
+      const doc1 = makeDoc();
+      const doc2 = makeDoc({ id: 'doc2', normalizedText: 'completely unrelated words here' });
+
+      const full = computeSimilarityScore(doc1, doc2, 0.5, defaultWeights);
+      const cut = computeSimilarityScore(doc1, doc2, 0.5, defaultWeights, {
+        similarityThreshold: 0.75,
+      });
+      expect(full.overall).toBeLessThan(0.75);
+      expect(cut.overall).toBe(0);
+      expect(cut.jaccard).toBe(0.5);
+    });
+  });
 });
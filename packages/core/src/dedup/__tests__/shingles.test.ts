@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { fnv1a32, textToShingles } from '../shingles.js';
+import { fnv1a32, fnv1a32Words, textToShingles } from '../shingles.js';
 
 describe('fnv1a32', () => {
   it('returns deterministic output for the same input', () => {
@@ -27,6 +27,23 @@ describe('fnv1a32', () => {
   });
 });
 
+describe('fnv1a32Words', () => {
+  it('hashes only the requested slice', () => {
+    const words = new Uint32Array([1, 2, 3, 4, 5, 6]);
+    expect(fnv1a32Words(words, 2, 4)).toBe(fnv1a32Words(new Uint32Array([3, 4])));
+  });
+
+  it('distinguishes word order', () => {
+    expect(fnv1a32Words(new Uint32Array([1, 2]))).not.toBe(fnv1a32Words(new Uint32Array([2, 1])));
+  });
+
+  it('returns an unsigned 32-bit integer', () => {
+    const hash = fnv1a32Words(new Uint32Array([0xffffffff, 0x12345678]));
+    expect(hash).toBeGreaterThanOrEqual(0);
+    expect(hash).toBeLessThanOrEqual(0xffffffff);
+  });
+});
+
 describe('textToShingles', () => {
   const twentyWords = Array.from({ length: 20 }, (_, i) => `word${i}`).join(' ');
   const tenWords = Array.from({ length: 10 }, (_, i) => `word${i}`).join(' ');
@@ -60,6 +77,11 @@ describe('textToShingles', () => {
     expect(result!.size).toBeLessThanOrEqual(16);
   });
 
+  it('hashes each n-gram as its words joined by single spaces', () => {
+    const result = textToShingles(' alpha\tbeta\n\ngamma  delta ', 3, 1);
+    expect(result).toEqual(new Set([fnv1a32('alpha beta gamma'), fnv1a32('beta gamma delta')]));
+  });
+
   it('returns deterministic results', () => {
     const result1 = textToShingles(twentyWords);
     const result2 = textToShingles(twentyWords);
@@ -2,7 +2,7 @@
  * Analysis pipeline orchestrator — 10-stage deduplication engine.
  */
 
-import { eq, inArray, count } from 'drizzle-orm';
+import { eq, inArray, count, getTableColumns } from 'drizzle-orm';
 import { nanoid } from 'nanoid';
 import { document, documentContent, documentSignature } from '../schema/sqlite/documents.js';
 import { duplicateGroup, duplicateMember } from '../schema/sqlite/duplicates.js';
@@ -10,9 +10,10 @@ import { syncState } from '../schema/sqlite/app.js';
 import { createLogger } from '../logger.js';
 import { textToShingles } from './shingles.js';
 import { MinHash } from './minhash.js';
-import { LSHIndex } from './lsh.js';
+import { SortedBandIndex } from './lsh.js';
 import { computeSimilarityScore } from './scoring.js';
-import { sampleText } from './fuzzy.js';
+import { sampleText, sortTokens } from './fuzzy.js';
+import { extractDiscriminativeTokens } from './discriminative.js';
 import { UnionFind } from './union-find.js';
 import { getDedupConfig } from './config.js';
 import { computeAnalysisConfigHash, saveAnalysisConfigHash } from './analysis-hash.js';
@@ -25,6 +26,7 @@ import {
   analysisStageDuration,
 } from '../telemetry/metrics.js';
 import type { AppDatabase } from '../db/client.js';
+import type { NewDuplicateGroup, NewDuplicateMember } from '../schema/types.js';
 import type {
   AnalysisOptions,
   AnalysisResult,
@@ -35,6 +37,49 @@ import type {
 
 const PROGRESS_BATCH_SIZE = 50;
 const SQL_VARIABLE_LIMIT = 500;
+const SCORING_BATCH_SIZE = 1000;
+
+/**
+ * LSH band buckets larger than this are skipped during near-duplicate search.
+ * Exact duplicates are matched by content hash, so the cap never hides them.
+ */
+const MAX_LSH_BUCKET_SIZE = 5000;
+
+/** Rows per multi-row INSERT, sized so bound parameters stay under SQL_VARIABLE_LIMIT. */
+const GROUP_INSERT_BATCH = Math.floor(
+  SQL_VARIABLE_LIMIT / Object.keys(getTableColumns(duplicateGroup)).length,
+);
+const MEMBER_INSERT_BATCH = Math.floor(
+  SQL_VARIABLE_LIMIT / Object.keys(getTableColumns(duplicateMember)).length,
+);
+
+/**
+ * Load the document columns the pipeline reads as flat arrays plus one lookup.
+ * The per-row objects returned by the query are not held past this call, so
+ * they can be collected before signature generation starts.
+ */
+function loadDocumentColumns(db: AppDatabase) {
+  const rows = db
+    .select({
+      id: document.id,
+      paperlessId: document.paperlessId,
+      processingStatus: document.processingStatus,
+    })
+    .from(document)
+    .all();
+
+  const allDocIds: string[] = new Array(rows.length);
+  const pendingDocIds: string[] = [];
+  const paperlessIdMap = new Map<string, number>();
+  for (let i = 0; i < rows.length; i++) {
+    const row = rows[i];
+    allDocIds[i] = row.id;
+    paperlessIdMap.set(row.id, row.paperlessId);
+    if (row.processingStatus === 'pending') pendingDocIds.push(row.id);
+  }
+
+  return { allDocIds, pendingDocIds, paperlessIdMap };
+}
 
 export async function runAnalysis(
   db: AppDatabase,
@@ -69,53 +114,66 @@ export async function runAnalysis(
     // Stage 2: Load documents
     await onProgress?.(0.02, 'Loading documents...');
 
-    const allDocs = db
-      .select({
-        id: document.id,
-        paperlessId: document.paperlessId,
-        processingStatus: document.processingStatus,
-      })
-      .from(document)
-      .all();
+    const { allDocIds, pendingDocIds, paperlessIdMap } = loadDocumentColumns(db);
 
-    result.totalDocuments = allDocs.length;
+    result.totalDocuments = allDocIds.length;
 
-    if (allDocs.length === 0) {
+    if (allDocIds.length === 0) {
       logger.info('No documents to analyze');
       await onProgress?.(1.0, 'No documents to analyze');
       result.durationMs = Date.now() - startTime;
       return result;
     }
 
-    const allDocIds = new Set(allDocs.map((d) => d.id));
-
     // Docs to process: pending-only or all if force
-    const docsToProcess = force ? allDocs : allDocs.filter((d) => d.processingStatus === 'pending');
+    const docsToProcess = force ? allDocIds : pendingDocIds;
 
-    const docsToProcessIds = new Set(docsToProcess.map((d) => d.id));
+    const docsToProcessIds = new Set(docsToProcess);
 
-    logger.info({ total: allDocs.length, toProcess: docsToProcess.length }, 'Documents loaded');
+    logger.info({ total: allDocIds.length, toProcess: docsToProcess.length }, 'Documents loaded');
     await onProgress?.(
       0.05,
-      `Loaded ${allDocs.length} documents, ${docsToProcess.length} to process`,
+      `Loaded ${allDocIds.length} documents, ${docsToProcess.length} to process`,
     );
 
     // Stage 3: Generate MinHash signatures
     let sigGenerated = 0;
     let sigReused = 0;
+    let sigCacheHits = 0;
 
-    // Load existing signatures for reuse check
+    // Load existing signatures for reuse check. A signature is only reusable
+    // while it was built from the document's current content: sync keeps the
+    // old signature when Paperless content changes, so a stale contentHash
+    // means the signature is regenerated.
     const existingSignatures = new Map<string, number>();
+    // Signatures depend only on normalized text, so documents with identical
+    // content can share one. Maps contentHash -> a document whose stored
+    // signature was built from that content. Only ids are kept across batches;
+    // signature bytes are fetched per batch so memory stays bounded.
+    const signatureSourceByContentHash = new Map<string, string>();
     if (!force) {
       const sigs = db
         .select({
           documentId: documentSignature.documentId,
           numPermutations: documentSignature.numPermutations,
+          algorithmVersion: documentSignature.algorithmVersion,
+          contentHash: documentSignature.contentHash,
+          currentContentHash: documentContent.contentHash,
         })
         .from(documentSignature)
+        .leftJoin(documentContent, eq(documentContent.documentId, documentSignature.documentId))
         .all();
       for (const sig of sigs) {
-        existingSignatures.set(sig.documentId, sig.numPermutations);
+        if (sig.contentHash === sig.currentContentHash) {
+          existingSignatures.set(sig.documentId, sig.numPermutations);
+        }
+        if (
+          sig.contentHash &&
+          sig.numPermutations === config.numPermutations &&
+          sig.algorithmVersion === ALGORITHM_VERSION
+        ) {
+          signatureSourceByContentHash.set(sig.contentHash, sig.documentId);
+        }
       }
     }
 
@@ -125,91 +183,173 @@ export async function runAnalysis(
     let skipTooShort = 0;
     let skipShinglesFailed = 0;
 
-    for (let i = 0; i < docsToProcess.length; i++) {
-      const doc = docsToProcess[i];
+    const reportSignatureProgress = async (i: number) => {
+      if (i % PROGRESS_BATCH_SIZE === 0) {
+        const sigPhase = i / docsToProcess.length;
+        await onProgress?.(
+          0.05 + 0.35 * sigPhase,
+          `Processing signatures: ${i}/${docsToProcess.length}`,
+          sigPhase,
+        );
+      }
+    };
+
+    // Work through documents in batches: one query loads the content for the
+    // whole batch, MinHashes are computed back to back, and the resulting
+    // upserts are committed in a single transaction rather than one per document.
+    for (let batchStart = 0; batchStart < docsToProcess.length; batchStart += SQL_VARIABLE_LIMIT) {
+      const batch = docsToProcess.slice(batchStart, batchStart + SQL_VARIABLE_LIMIT);
 
       // Check if signature already exists with matching numPermutations
-      if (!force) {
-        const existingNumPerm = existingSignatures.get(doc.id);
-        if (existingNumPerm === config.numPermutations) {
-          sigReused++;
-          processedDocIds.push(doc.id);
-          if (i % PROGRESS_BATCH_SIZE === 0) {
-            const sigPhase = i / docsToProcess.length;
-            await onProgress?.(
-              0.05 + 0.35 * sigPhase,
-              `Processing signatures: ${i}/${docsToProcess.length}`,
-              sigPhase,
-            );
-          }
-          continue;
+      const needsSignature = force
+        ? batch
+        : batch.filter((docId) => existingSignatures.get(docId) !== config.numPermutations);
+
+      const contentByDocId = new Map<
+        string,
+        { normalizedText: string | null; wordCount: number | null; contentHash: string | null }
+      >();
+      if (needsSignature.length > 0) {
+        const contentRows = db
+          .select({
+            documentId: documentContent.documentId,
+            normalizedText: documentContent.normalizedText,
+            wordCount: documentContent.wordCount,
+            contentHash: documentContent.contentHash,
+          })
+          .from(documentContent)
+          .where(inArray(documentContent.documentId, needsSignature))
+          .all();
+        for (const row of contentRows) {
+          contentByDocId.set(row.documentId, row);
         }
       }
 
-      // Load content
-      const content = db
-        .select({
-          normalizedText: documentContent.normalizedText,
-          wordCount: documentContent.wordCount,
-        })
-        .from(documentContent)
-        .where(eq(documentContent.documentId, doc.id))
-        .get();
-
-      if (!content || !content.normalizedText) {
-        skippedDocIds.push(doc.id);
-        skipNoContent++;
-        continue;
+      // Fetch stored signatures for content already hashed under another document.
+      // Bytes computed within this batch are added as they are produced.
+      const signatureByContentHash = new Map<string, Buffer>();
+      const sourceDocIds = new Set<string>();
+      for (const content of contentByDocId.values()) {
+        if (!content.contentHash) continue;
+        const sourceDocId = signatureSourceByContentHash.get(content.contentHash);
+        if (sourceDocId) sourceDocIds.add(sourceDocId);
       }
-
-      if ((content.wordCount ?? 0) < config.minWords) {
-        skippedDocIds.push(doc.id);
-        skipTooShort++;
-        continue;
+      if (sourceDocIds.size > 0) {
+        const sourceRows = db
+          .select({
+            contentHash: documentSignature.contentHash,
+            minhashSignature: documentSignature.minhashSignature,
+          })
+          .from(documentSignature)
+          .where(inArray(documentSignature.documentId, [...sourceDocIds]))
+          .all();
+        for (const row of sourceRows) {
+          if (row.contentHash && row.minhashSignature) {
+            signatureByContentHash.set(row.contentHash, row.minhashSignature);
+          }
+        }
       }
 
-      const shingles = textToShingles(content.normalizedText, config.ngramSize, config.minWords);
-      if (!shingles) {
-        skippedDocIds.push(doc.id);
-        skipShinglesFailed++;
-        continue;
-      }
+      const signatureRows: {
+        documentId: string;
+        minhashSignature: Buffer;
+        contentHash: string | null;
+      }[] = [];
 
-      const mh = new MinHash(config.numPermutations);
-      mh.update(shingles);
-      const serialized = mh.serialize();
-      const now = new Date().toISOString();
+      for (let j = 0; j < batch.length; j++) {
+        const i = batchStart + j;
+        const docId = batch[j];
+
+        if (!force && existingSignatures.get(docId) === config.numPermutations) {
+          sigReused++;
+          processedDocIds.push(docId);
+          await reportSignatureProgress(i);
+          continue;
+        }
+
+        const content = contentByDocId.get(docId);
+
+        if (!content || !content.normalizedText) {
+          skippedDocIds.push(docId);
+          skipNoContent++;
+          continue;
+        }
+
+        if ((content.wordCount ?? 0) < config.minWords) {
+          skippedDocIds.push(docId);
+          skipTooShort++;
+          continue;
+        }
+
+        let serialized = content.contentHash
+          ? signatureByContentHash.get(content.contentHash)
+          : undefined;
+        if (serialized) {
+          sigCacheHits++;
+        } else {
+          const shingles = textToShingles(
+            content.normalizedText,
+            config.ngramSize,
+            config.minWords,
+          );
+          if (!shingles) {
+            skippedDocIds.push(docId);
+            skipShinglesFailed++;
+            continue;
+          }
 
-      // Upsert signature
-      db.insert(documentSignature)
-        .values({
-          documentId: doc.id,
+          const mh = new MinHash(config.numPermutations);
+          mh.update(shingles);
+          serialized = mh.serialize();
+          if (content.contentHash) {
+            signatureByContentHash.set(content.contentHash, serialized);
+          }
+        }
+
+        signatureRows.push({
+          documentId: docId,
           minhashSignature: serialized,
-          algorithmVersion: ALGORITHM_VERSION,
-          numPermutations: config.numPermutations,
-          createdAt: now,
-        })
-        .onConflictDoUpdate({
-          target: documentSignature.documentId,
-          set: {
-            minhashSignature: serialized,
-            algorithmVersion: ALGORITHM_VERSION,
-            numPermutations: config.numPermutations,
-            createdAt: now,
-          },
-        })
-        .run();
+          contentHash: content.contentHash,
+        });
 
-      sigGenerated++;
-      processedDocIds.push(doc.id);
+        sigGenerated++;
+        processedDocIds.push(docId);
+        await reportSignatureProgress(i);
+      }
 
-      if (i % PROGRESS_BATCH_SIZE === 0) {
-        const sigPhase = i / docsToProcess.length;
-        await onProgress?.(
-          0.05 + 0.35 * sigPhase,
-          `Processing signatures: ${i}/${docsToProcess.length}`,
-          sigPhase,
-        );
+      if (signatureRows.length > 0) {
+        const now = new Date().toISOString();
+        db.transaction((tx) => {
+          for (const row of signatureRows) {
+            // Upsert signature
+            tx.insert(documentSignature)
+              .values({
+                documentId: row.documentId,
+                minhashSignature: row.minhashSignature,
+                algorithmVersion: ALGORITHM_VERSION,
+                numPermutations: config.numPermutations,
+                contentHash: row.contentHash,
+                createdAt: now,
+              })
+              .onConflictDoUpdate({
+                target: documentSignature.documentId,
+                set: {
+                  minhashSignature: row.minhashSignature,
+                  algorithmVersion: ALGORITHM_VERSION,
+                  numPermutations: config.numPermutations,
+                  contentHash: row.contentHash,
+                  createdAt: now,
+                },
+              })
+              .run();
+          }
+        });
+
+        for (const row of signatureRows) {
+          if (row.contentHash) {
+            signatureSourceByContentHash.set(row.contentHash, row.documentId);
+          }
+        }
       }
     }
 
@@ -224,7 +364,12 @@ export async function runAnalysis(
     };
 
     logger.info(
-      { generated: sigGenerated, reused: sigReused, skipped: skippedDocIds.length },
+      {
+        generated: sigGenerated,
+        reused: sigReused,
+        contentCacheHits: sigCacheHits,
+        skipped: skippedDocIds.length,
+      },
       'Signatures processed',
     );
     await onProgress?.(0.4, `Signatures: ${sigGenerated} generated, ${sigReused} reused`);
@@ -232,7 +377,13 @@ export async function runAnalysis(
     // Stage 4: Build LSH index from ALL signatures
     await onProgress?.(0.4, 'Building LSH index...');
 
-    const { lshIndex, signatureMap } = await withSpan(
+    const {
+      lshIndex,
+      signatureMatrix,
+      signatureRows,
+      rowDocIds,
+      rowContentHashes,
+    } = await withSpan(
       'dedupe.analysis.build_lsh_index',
       {},
       async (span) => {
@@ -240,67 +391,155 @@ export async function runAnalysis(
           .select({
             documentId: documentSignature.documentId,
             minhashSignature: documentSignature.minhashSignature,
+            contentHash: documentSignature.contentHash,
+            currentContentHash: documentContent.contentHash,
           })
           .from(documentSignature)
+          .leftJoin(documentContent, eq(documentContent.documentId, documentSignature.documentId))
           .where(eq(documentSignature.numPermutations, config.numPermutations))
           .all();
 
-        const idx = new LSHIndex(config.numPermutations, config.numBands);
-        const sigMap = new Map<string, Uint32Array>();
+        // All signatures live in one row-major matrix (row = document) instead
+        // of a separate ArrayBuffer per document; rows maps docId -> row and
+        // docIds/contentHashes map row -> docId/contentHash.
+        const width = config.numPermutations;
+        const matrix = new Uint32Array(allSignatureRows.length * width);
+        const rows = new Map<string, number>();
+        const docIds: string[] = [];
+        const contentHashes: (string | null)[] = [];
 
         for (const row of allSignatureRows) {
           if (!row.minhashSignature) continue;
-          const sig = new Uint32Array(
-            row.minhashSignature.buffer.slice(
-              row.minhashSignature.byteOffset,
-              row.minhashSignature.byteOffset + row.minhashSignature.byteLength,
-            ),
+          if (row.minhashSignature.byteLength !== width * Uint32Array.BYTES_PER_ELEMENT) continue;
+          const rowIndex = rows.size;
+          const offset = rowIndex * width;
+          // Byte-wise copy: the blob's byteOffset is not guaranteed to be 4-aligned
+          new Uint8Array(matrix.buffer, offset * Uint32Array.BYTES_PER_ELEMENT).set(
+            row.minhashSignature,
           );
-          idx.insert(row.documentId, sig);
-          sigMap.set(row.documentId, sig);
+          rows.set(row.documentId, rowIndex);
+          docIds.push(row.documentId);
+          // Only a hash that still matches the current content may short-circuit
+          // scoring; a signature left over from edited content is scored normally
+          contentHashes.push(row.contentHash === row.currentContentHash ? row.contentHash : null);
         }
 
-        span.setAttribute('index.size', sigMap.size);
-        return { lshIndex: idx, signatureMap: sigMap };
+        const idx = new SortedBandIndex(
+          matrix,
+          width,
+          docIds.length,
+          config.numBands,
+          options?.maxLshBucketSize ?? MAX_LSH_BUCKET_SIZE,
+        );
+
+        span.setAttribute('index.size', rows.size);
+        span.setAttribute('index.largest_bucket', idx.largestBucketSize);
+        span.setAttribute('index.oversized_buckets', idx.oversizedBuckets);
+        return {
+          lshIndex: idx,
+          signatureMatrix: matrix,
+          signatureRows: rows,
+          rowDocIds: docIds,
+          rowContentHashes: contentHashes,
+        };
       },
     );
 
-    logger.info({ indexedSignatures: signatureMap.size }, 'LSH index built');
-    await onProgress?.(0.5, `LSH index built with ${signatureMap.size} signatures`);
+    logger.info(
+      {
+        indexedSignatures: signatureRows.size,
+        largestBucket: lshIndex.largestBucketSize,
+        oversizedBuckets: lshIndex.oversizedBuckets,
+      },
+      'LSH index built',
+    );
+    await onProgress?.(0.5, `LSH index built with ${signatureRows.size} signatures`);
 
     // Stage 5: Find candidate pairs
     await onProgress?.(0.5, 'Finding candidate pairs...');
 
     const searchDocIds = force
-      ? [...allDocIds]
+      ? allDocIds
       : processedDocIds.filter((id) => docsToProcessIds.has(id));
 
-    const candidatePairs = new Map<string, { docId1: string; docId2: string; jaccard: number }>();
+    // Pairs at or above this MinHash Jaccard go on to full scoring; the check
+    // happens as each pair is found rather than in a second pass.
+    const jaccardPreFilter = config.similarityThreshold * 0.8;
+    const filteredPairs: { docId1: string; docId2: string; jaccard: number }[] = [];
 
+    const rowCount = rowDocIds.length;
+    const searchRows = new Uint8Array(rowCount);
     for (const docId of searchDocIds) {
-      const sig = signatureMap.get(docId);
-      if (!sig) continue;
+      const row = signatureRows.get(docId);
+      if (row !== undefined) searchRows[row] = 1;
+    }
 
-      const candidates = lshIndex.getCandidates(sig);
-      candidates.delete(docId); // Remove self
+    // Pairs with identical normalized text (same content hash) are exact
+    // duplicates whatever LSH made of them, so they are found by grouping rows
+    // on their hash rather than through band buckets. Each group that holds a
+    // searched row is linked as a star around it, which joins the same
+    // component as every pairwise link. They bypass the Jaccard estimate and
+    // text scoring entirely.
+    const exactPairs: { docId1: string; docId2: string }[] = [];
+    const rowsByContentHash = new Map<string, number[]>();
+    for (let row = 0; row < rowCount; row++) {
+      const contentHash = rowContentHashes[row];
+      if (contentHash === null) continue;
+      const rows = rowsByContentHash.get(contentHash);
+      if (rows) rows.push(row);
+      else rowsByContentHash.set(contentHash, [row]);
+    }
+    for (const rows of rowsByContentHash.values()) {
+      if (rows.length < 2) continue;
+      const hub = rows.find((row) => searchRows[row] === 1);
+      if (hub === undefined) continue;
+      const hubId = rowDocIds[hub];
+      for (const row of rows) {
+        if (row === hub) continue;
+        const otherId = rowDocIds[row];
+        exactPairs.push(
+          hubId < otherId ? { docId1: hubId, docId2: otherId } : { docId1: otherId, docId2: hubId },
+        );
+      }
+    }
+    rowsByContentHash.clear();
+
+    // Band buckets are symmetric, so every pair involving an already-searched
+    // row was recorded when that row was searched. Candidate rows come back
+    // deduplicated, so each pair is visited once and only needs counting.
+    const searchedRows = new Uint8Array(rowCount);
+    let candidatePairsFound = 0;
 
-      for (const candidateId of candidates) {
+    const width = config.numPermutations;
+    for (const docId of searchDocIds) {
+      const row = signatureRows.get(docId);
+      if (row === undefined) continue;
+
+      const candidates = lshIndex.getCandidateRows(row);
+      searchedRows[row] = 1; // Also excludes self
+      const contentHash = rowContentHashes[row];
+
+      for (const candidateRow of candidates) {
+        if (searchedRows[candidateRow]) continue;
+        // Identical content was already paired by the content-hash pass
+        if (contentHash !== null && contentHash === rowContentHashes[candidateRow]) continue;
+
+        candidatePairsFound++;
+        const jaccard = MinHash.jaccardFromMatrix(signatureMatrix, width, row, candidateRow);
+        if (jaccard < jaccardPreFilter) continue;
+        const candidateId = rowDocIds[candidateRow];
         // Canonical ordering
         const [id1, id2] = docId < candidateId ? [docId, candidateId] : [candidateId, docId];
-        const pairKey = `${id1}|${id2}`;
-
-        if (!candidatePairs.has(pairKey)) {
-          const candidateSig = signatureMap.get(candidateId);
-          if (!candidateSig) continue;
-          const jaccard = MinHash.jaccardFromArrays(sig, candidateSig);
-          candidatePairs.set(pairKey, { docId1: id1, docId2: id2, jaccard });
-        }
+        filteredPairs.push({ docId1: id1, docId2: id2, jaccard });
       }
     }
 
-    result.candidatePairsFound = candidatePairs.size;
-    logger.info({ candidatePairs: candidatePairs.size }, 'Candidate pairs found');
-    await onProgress?.(0.55, `Found ${candidatePairs.size} candidate pairs`);
+    result.candidatePairsFound = exactPairs.length + candidatePairsFound;
+    logger.info(
+      { candidatePairs: result.candidatePairsFound, exactPairs: exactPairs.length },
+      'Candidate pairs found',
+    );
+    await onProgress?.(0.55, `Found ${result.candidatePairsFound} candidate pairs`);
 
     // Stage 6: Score candidates
     const scoringStart = Date.now();
@@ -312,10 +551,6 @@ export async function runAnalysis(
       discriminativePenaltyStrength: config.discriminativePenaltyStrength,
     };
 
-    // Pre-filter candidates by jaccard threshold
-    const jaccardPreFilter = config.similarityThreshold * 0.8;
-    const filteredPairs = [...candidatePairs.values()].filter((p) => p.jaccard >= jaccardPreFilter);
-
     // Collect all document IDs needed for scoring
     const scoringDocIds = new Set<string>();
     for (const pair of filteredPairs) {
@@ -364,41 +599,72 @@ export async function runAnalysis(
           const data = docDataMap.get(row.documentId);
           if (data && row.normalizedText) {
             data.normalizedText = sampleText(row.normalizedText, config.fuzzySampleSize);
+            // Derive per-document comparison inputs once; every pair the
+            // document joins reuses them instead of re-tokenizing the text
+            if (weights.fuzzy > 0) {
+              data.sortedTokens = sortTokens(data.normalizedText);
+            }
+            data.discriminativeTokens = extractDiscriminativeTokens(data.normalizedText);
           }
         }
       }
     }
 
-    // Score each pair
+    // Score each pair, merging passing pairs into their components as we go
     const scoredPairs: ScoredPair[] = [];
+    const uf = new UnionFind<string>();
 
-    for (let i = 0; i < filteredPairs.length; i++) {
-      const pair = filteredPairs[i];
-      const doc1 = docDataMap.get(pair.docId1);
-      const doc2 = docDataMap.get(pair.docId2);
+    // Identical text scores 1 on every component (the two weights sum to 100)
+    for (const pair of exactPairs) {
+      scoredPairs.push({
+        docId1: pair.docId1,
+        docId2: pair.docId2,
+        similarity: { overall: 1, jaccard: 1, fuzzy: 1, discriminative: 1 },
+      });
+      uf.union(pair.docId1, pair.docId2);
+    }
 
-      if (!doc1 || !doc2) continue;
+    const scoringOptions = {
+      fuzzySampleSize: config.fuzzySampleSize,
+      similarityThreshold: config.similarityThreshold,
+    };
 
-      const similarity = computeSimilarityScore(doc1, doc2, pair.jaccard, weights, {
-        fuzzySampleSize: config.fuzzySampleSize,
-      });
+    // Scoring is synchronous CPU work in this worker thread; pairs are scored
+    // in batches so progress is written once per batch rather than per pair
+    for (let start = 0; start < filteredPairs.length; start += SCORING_BATCH_SIZE) {
+      const end = Math.min(start + SCORING_BATCH_SIZE, filteredPairs.length);
 
-      if (similarity.overall >= config.similarityThreshold) {
-        scoredPairs.push({
-          docId1: pair.docId1,
-          docId2: pair.docId2,
-          similarity,
-        });
-      }
+      for (let i = start; i < end; i++) {
+        const pair = filteredPairs[i];
+        const doc1 = docDataMap.get(pair.docId1);
+        const doc2 = docDataMap.get(pair.docId2);
 
-      if (i % PROGRESS_BATCH_SIZE === 0) {
-        const scorePhase = i / filteredPairs.length;
-        await onProgress?.(
-          0.55 + 0.25 * scorePhase,
-          `Scoring: ${i}/${filteredPairs.length}`,
-          scorePhase,
+        if (!doc1 || !doc2) continue;
+
+        const similarity = computeSimilarityScore(
+          doc1,
+          doc2,
+          pair.jaccard,
+          weights,
+          scoringOptions,
         );
+
+        if (similarity.overall >= config.similarityThreshold) {
+          scoredPairs.push({
+            docId1: pair.docId1,
+            docId2: pair.docId2,
+            similarity,
+          });
+          uf.union(pair.docId1, pair.docId2);
+        }
       }
+
+      const scorePhase = end / filteredPairs.length;
+      await onProgress?.(
+        0.55 + 0.25 * scorePhase,
+        `Scoring: ${end}/${filteredPairs.length}`,
+        scorePhase,
+      );
     }
 
     result.candidatePairsScored = scoredPairs.length;
@@ -409,12 +675,6 @@ export async function runAnalysis(
     // Stage 7: Form groups via union-find
     await onProgress?.(0.8, 'Forming duplicate groups...');
 
-    const uf = new UnionFind<string>();
-
-    for (const pair of scoredPairs) {
-      uf.union(pair.docId1, pair.docId2);
-    }
-
     // Group scored pairs by their union-find root
     const groupedPairs = new Map<string, ScoredPair[]>();
     for (const pair of scoredPairs) {
@@ -425,15 +685,11 @@ export async function runAnalysis(
       groupedPairs.get(root)!.push(pair);
     }
 
-    // Build member sets for each group
+    // Only documents from passing pairs were added to the union-find, so
+    // each connected component is exactly one group's member set
     const groupMembers = new Map<string, Set<string>>();
-    for (const [root, pairs] of groupedPairs) {
-      const members = new Set<string>();
-      for (const pair of pairs) {
-        members.add(pair.docId1);
-        members.add(pair.docId2);
-      }
-      groupMembers.set(root, members);
+    for (const [root, members] of uf.getGroups()) {
+      groupMembers.set(root, new Set(members));
     }
 
     logger.info({ groups: groupMembers.size }, 'Groups formed');
@@ -442,26 +698,28 @@ export async function runAnalysis(
     // Stage 8: Write results in transaction
     await onProgress?.(0.85, 'Writing results...');
 
-    // Build paperlessId lookup for primary selection
-    const paperlessIdMap = new Map<string, number>();
-    for (const doc of allDocs) {
-      paperlessIdMap.set(doc.id, doc.paperlessId);
-    }
-
     // Load existing groups to match by member set
     const existingGroups = db.select().from(duplicateGroup).all();
 
+    // Load every membership row in one query rather than one query per group
+    const membersByGroupId = new Map<string, Set<string>>();
+    for (const group of existingGroups) {
+      membersByGroupId.set(group.id, new Set());
+    }
+    const existingMemberRows = db
+      .select({ groupId: duplicateMember.groupId, documentId: duplicateMember.documentId })
+      .from(duplicateMember)
+      .all();
+    for (const member of existingMemberRows) {
+      membersByGroupId.get(member.groupId)?.add(member.documentId);
+    }
+
     const existingGroupMembers = new Map<
       string,
       { groupId: string; memberIds: Set<string>; status: string }
     >();
     for (const group of existingGroups) {
-      const members = db
-        .select({ documentId: duplicateMember.documentId })
-        .from(duplicateMember)
-        .where(eq(duplicateMember.groupId, group.id))
-        .all();
-      const memberIds = new Set(members.map((m) => m.documentId));
+      const memberIds = membersByGroupId.get(group.id)!;
       const memberKey = [...memberIds].sort().join('|');
       existingGroupMembers.set(memberKey, {
         groupId: group.id,
@@ -489,6 +747,8 @@ export async function runAnalysis(
 
     db.transaction((tx) => {
       const now = new Date().toISOString();
+      const newGroupRows: NewDuplicateGroup[] = [];
+      const newMemberRows: NewDuplicateMember[] = [];
 
       for (const [root, members] of groupMembers) {
         const pairs = groupedPairs.get(root) ?? [];
@@ -538,18 +798,16 @@ export async function runAnalysis(
           // Create new group
           const groupId = nanoid();
 
-          tx.insert(duplicateGroup)
-            .values({
-              id: groupId,
-              confidenceScore: avgOverall,
-              jaccardSimilarity: avgJaccard,
-              fuzzyTextRatio: avgFuzzy,
-              discriminativeScore: avgDiscriminative,
-              algorithmVersion: ALGORITHM_VERSION,
-              createdAt: now,
-              updatedAt: now,
-            })
-            .run();
+          newGroupRows.push({
+            id: groupId,
+            confidenceScore: avgOverall,
+            jaccardSimilarity: avgJaccard,
+            fuzzyTextRatio: avgFuzzy,
+            discriminativeScore: avgDiscriminative,
+            algorithmVersion: ALGORITHM_VERSION,
+            createdAt: now,
+            updatedAt: now,
+          });
 
           // Primary = lowest paperlessId
           const sortedByPaperlessId = memberArray.sort((a, b) => {
@@ -557,24 +815,36 @@ export async function runAnalysis(
           });
 
           for (let i = 0; i < sortedByPaperlessId.length; i++) {
-            tx.insert(duplicateMember)
-              .values({
-                groupId,
-                documentId: sortedByPaperlessId[i],
-                isPrimary: i === 0,
-              })
-              .run();
+            newMemberRows.push({
+              groupId,
+              documentId: sortedByPaperlessId[i],
+              isPrimary: i === 0,
+            });
           }
 
           result.groupsCreated++;
         }
       }
 
+      // Insert new groups and their members with multi-row INSERTs instead of
+      // one statement per row. Groups go first to satisfy the member FK.
+      for (let i = 0; i < newGroupRows.length; i += GROUP_INSERT_BATCH) {
+        tx.insert(duplicateGroup)
+          .values(newGroupRows.slice(i, i + GROUP_INSERT_BATCH))
+          .run();
+      }
+      for (let i = 0; i < newMemberRows.length; i += MEMBER_INSERT_BATCH) {
+        tx.insert(duplicateMember)
+          .values(newMemberRows.slice(i, i + MEMBER_INSERT_BATCH))
+          .run();
+      }
+
       // Delete stale groups that are still pending (preserve user-actioned groups).
       // Two deletion criteria:
       // 1. Subsumed: all members appear in a newly-formed expanded group
       // 2. Stale: at least one member was in the search scope but group wasn't re-detected
       const searchDocIdSet = new Set(searchDocIds);
+      const staleGroupIds: string[] = [];
       for (const group of existingGroups) {
         if (activeExistingGroupIds.has(group.id)) continue;
         if (group.status !== 'pending') continue;
@@ -593,11 +863,15 @@ export async function runAnalysis(
           if (!wasEvaluated) continue;
         }
 
-        tx.delete(duplicateMember).where(eq(duplicateMember.groupId, group.id)).run();
-        tx.delete(duplicateGroup).where(eq(duplicateGroup.id, group.id)).run();
+        staleGroupIds.push(group.id);
+      }
 
-        result.groupsRemoved++;
+      for (let i = 0; i < staleGroupIds.length; i += SQL_VARIABLE_LIMIT) {
+        const batch = staleGroupIds.slice(i, i + SQL_VARIABLE_LIMIT);
+        tx.delete(duplicateMember).where(inArray(duplicateMember.groupId, batch)).run();
+        tx.delete(duplicateGroup).where(inArray(duplicateGroup.id, batch)).run();
       }
+      result.groupsRemoved += staleGroupIds.length;
     });
 
     logger.info(
@@ -303,9 +303,21 @@ function setJaccard(a: Set<string>, b: Set<string>): number {
  *   Dates 3x, times 2x, amounts 2x, identifiers 2x, references 1x, routes 3x.
  */
 export function computeDiscriminativeScore(text1: string, text2: string): number {
-  const tokens1 = extractDiscriminativeTokens(text1);
-  const tokens2 = extractDiscriminativeTokens(text2);
+  return compareDiscriminativeTokens(
+    extractDiscriminativeTokens(text1),
+    extractDiscriminativeTokens(text2),
+  );
+}
 
+/**
+ * Same as `computeDiscriminativeScore`, but on tokens already extracted with
+ * `extractDiscriminativeTokens`, so a document compared against many others
+ * only runs the extraction patterns once.
+ */
+export function compareDiscriminativeTokens(
+  tokens1: DiscriminativeTokens,
+  tokens2: DiscriminativeTokens,
+): number {
   // Neither document has discriminative tokens — neutral score
   if (tokens1.total === 0 && tokens2.total === 0) return 1.0;
 
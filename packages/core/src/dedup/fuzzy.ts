@@ -4,22 +4,64 @@
 
 import { distance } from 'fastest-levenshtein';
 
+const WHITESPACE_RE = /\s+/;
+
+/** Scratch per-code-unit counters for `histogramDistanceBound`; always left zeroed. */
+const charCounts = new Int32Array(0x10000);
+
+/**
+ * Lower bound on the edit distance between two strings from their character
+ * histograms: each edit fixes at most one surplus and one deficit, so at least
+ * max(surplus, deficit) edits are needed. O(n + m), no allocation.
+ */
+function histogramDistanceBound(a: string, b: string): number {
+  for (let i = 0; i < a.length; i++) charCounts[a.charCodeAt(i)]++;
+  for (let i = 0; i < b.length; i++) charCounts[b.charCodeAt(i)]--;
+
+  let surplus = 0;
+  let deficit = 0;
+  for (let i = 0; i < a.length; i++) {
+    const c = a.charCodeAt(i);
+    if (charCounts[c] > 0) {
+      surplus += charCounts[c];
+      charCounts[c] = 0;
+    }
+  }
+  // Negative counts for characters shared with `a` are still in place here
+  for (let i = 0; i < b.length; i++) {
+    const c = b.charCodeAt(i);
+    if (charCounts[c] < 0) deficit -= charCounts[c];
+    charCounts[c] = 0;
+  }
+  return Math.max(surplus, deficit);
+}
+
 export function sampleText(text: string, maxChars = 5000): string {
   return text.slice(0, maxChars);
 }
 
-export function tokenSortRatio(text1: string, text2: string): number {
-  const sorted1 = text1
-    .split(/\s+/)
-    .filter((w) => w.length > 0)
-    .sort()
-    .join(' ');
-  const sorted2 = text2
-    .split(/\s+/)
+/**
+ * Token-sort form of a text: whitespace-separated tokens sorted and re-joined
+ * with single spaces. Callers comparing one text against many can compute
+ * this once and score with `sortedTokenRatio`.
+ */
+export function sortTokens(text: string): string {
+  return text
+    .split(WHITESPACE_RE)
     .filter((w) => w.length > 0)
     .sort()
     .join(' ');
+}
 
+/**
+ * Levenshtein ratio in [0, 1] of two strings already in `sortTokens` form.
+ *
+ * When `scoreCutoff` is positive, any ratio below it is reported as 0, and
+ * pairs are screened by two cheap lower bounds on the edit distance before the
+ * O(n·m) computation: the length difference, then the character-histogram
+ * difference. Pairs either bound rules out never reach Levenshtein.
+ */
+export function sortedTokenRatio(sorted1: string, sorted2: string, scoreCutoff = 0): number {
   if (sorted1.length === 0 && sorted2.length === 0) {
     return 1.0;
   }
@@ -28,5 +70,20 @@ export function tokenSortRatio(text1: string, text2: string): number {
   }
 
   const maxLen = Math.max(sorted1.length, sorted2.length);
-  return 1 - distance(sorted1, sorted2) / maxLen;
+  if (scoreCutoff > 0) {
+    if (Math.min(sorted1.length, sorted2.length) / maxLen < scoreCutoff) {
+      return 0.0;
+    }
+    if (1 - histogramDistanceBound(sorted1, sorted2) / maxLen < scoreCutoff) {
+      return 0.0;
+    }
+  }
+
+  const ratio = 1 - distance(sorted1, sorted2) / maxLen;
+  return ratio < scoreCutoff ? 0.0 : ratio;
+}
+
+/** Token-sort Levenshtein ratio in [0, 1]; see `sortedTokenRatio` for `scoreCutoff`. */
+export function tokenSortRatio(text1: string, text2: string, scoreCutoff = 0): number {
+  return sortedTokenRatio(sortTokens(text1), sortTokens(text2), scoreCutoff);
 }
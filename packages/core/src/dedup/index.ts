@@ -1,9 +1,13 @@
 export { fnv1a32, textToShingles } from './shingles.js';
 export { MinHash } from './minhash.js';
-export { LSHIndex } from './lsh.js';
-export { tokenSortRatio, sampleText } from './fuzzy.js';
+export { LSHIndex, SortedBandIndex } from './lsh.js';
+export { tokenSortRatio, sortedTokenRatio, sortTokens, sampleText } from './fuzzy.js';
 export { computeSimilarityScore } from './scoring.js';
-export { computeDiscriminativeScore, extractDiscriminativeTokens } from './discriminative.js';
+export {
+  compareDiscriminativeTokens,
+  computeDiscriminativeScore,
+  extractDiscriminativeTokens,
+} from './discriminative.js';
 export { buildMatchExplanation } from './explanations.js';
 export type {
   DuplicateMatchExplanation,
@@ -2,13 +2,13 @@
  * Locality-Sensitive Hashing (LSH) index for candidate pair discovery.
  */
 
-import { fnv1a32 } from './shingles.js';
+import { fnv1a32Words } from './shingles.js';
 
 export class LSHIndex {
   readonly numPermutations: number;
   readonly numBands: number;
   readonly rowsPerBand: number;
-  bands: Map<string, Set<string>>[];
+  bands: Map<number, Set<string>>[];
 
   constructor(numPermutations = 192, numBands = 20) {
     this.numPermutations = numPermutations;
@@ -20,14 +20,9 @@ export class LSHIndex {
     }
   }
 
-  private hashBand(signature: Uint32Array, bandIndex: number): string {
+  private hashBand(signature: Uint32Array, bandIndex: number): number {
     const start = bandIndex * this.rowsPerBand;
-    const end = start + this.rowsPerBand;
-    const parts: string[] = [];
-    for (let i = start; i < end; i++) {
-      parts.push(String(signature[i]));
-    }
-    return String(fnv1a32(parts.join('|')));
+    return fnv1a32Words(signature, start, start + this.rowsPerBand);
   }
 
   insert(docId: string, signature: Uint32Array): void {
@@ -62,3 +57,103 @@ export class LSHIndex {
     }
   }
 }
+
+/**
+ * Read-only LSH index over a row-major signature matrix, addressed by row.
+ *
+ * Each band keeps its hashes sorted alongside the owning rows, so lookups are
+ * a binary search and no per-bucket Map/Set is allocated.
+ *
+ * Buckets holding more than `maxBucketSize` rows are ignored on lookup. Such
+ * buckets come from boilerplate-heavy documents whose bands collide en masse;
+ * expanding them is quadratic, and genuinely similar documents still meet
+ * through their other bands.
+ */
+export class SortedBandIndex {
+  readonly numBands: number;
+  readonly rowsPerBand: number;
+  readonly size: number;
+  readonly maxBucketSize: number;
+  /** Number of band buckets larger than `maxBucketSize`. */
+  readonly oversizedBuckets: number = 0;
+  /** Row count of the largest band bucket. */
+  readonly largestBucketSize: number = 0;
+  private readonly matrix: Uint32Array;
+  private readonly width: number;
+  private readonly sortedHashes: Uint32Array[] = [];
+  private readonly sortedRows: Uint32Array[] = [];
+
+  constructor(
+    matrix: Uint32Array,
+    width: number,
+    size: number,
+    numBands: number,
+    maxBucketSize = Infinity,
+  ) {
+    this.matrix = matrix;
+    this.width = width;
+    this.size = size;
+    this.numBands = numBands;
+    this.maxBucketSize = maxBucketSize;
+    this.rowsPerBand = Math.floor(width / numBands);
+
+    const hashes = new Uint32Array(size);
+    for (let b = 0; b < numBands; b++) {
+      const order = new Uint32Array(size);
+      for (let row = 0; row < size; row++) {
+        hashes[row] = this.hashBand(row, b);
+        order[row] = row;
+      }
+      order.sort((x, y) => hashes[x] - hashes[y] || x - y);
+
+      const sorted = new Uint32Array(size);
+      for (let i = 0; i < size; i++) {
+        sorted[i] = hashes[order[i]];
+      }
+      this.sortedHashes.push(sorted);
+      this.sortedRows.push(order);
+
+      for (let start = 0, end = 0; start < size; start = end) {
+        while (end < size && sorted[end] === sorted[start]) end++;
+        const bucketSize = end - start;
+        if (bucketSize > this.largestBucketSize) this.largestBucketSize = bucketSize;
+        if (bucketSize > maxBucketSize) this.oversizedBuckets++;
+      }
+    }
+  }
+
+  private hashBand(row: number, bandIndex: number): number {
+    const start = row * this.width + bandIndex * this.rowsPerBand;
+    return fnv1a32Words(this.matrix, start, start + this.rowsPerBand);
+  }
+
+  /**
+   * Rows sharing at least one band bucket (of at most `maxBucketSize` rows)
+   * with `row`, including `row` itself.
+   */
+  getCandidateRows(row: number): Set<number> {
+    const candidates = new Set<number>([row]);
+    for (let b = 0; b < this.numBands; b++) {
+      const key = this.hashBand(row, b);
+      const hashes = this.sortedHashes[b];
+      const rows = this.sortedRows[b];
+
+      // Lower bound of `key` in the band's sorted hashes
+      let lo = 0;
+      let hi = hashes.length;
+      while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (hashes[mid] < key) lo = mid + 1;
+        else hi = mid;
+      }
+      let end = lo;
+      while (end < hashes.length && hashes[end] === key) end++;
+      if (end - lo > this.maxBucketSize) continue;
+
+      for (let i = lo; i < end; i++) {
+        candidates.add(rows[i]);
+      }
+    }
+    return candidates;
+  }
+}
@@ -2,10 +2,14 @@
  * MinHash implementation for approximate Jaccard similarity estimation.
  */
 
-const MERSENNE_PRIME = (1n << 61n) - 1n;
 const MAX_HASH = 0xffffffff;
 const HASH_SEED = 42;
 
+const TWO_POW_16 = 0x10000;
+const TWO_POW_32 = 0x100000000;
+/** High 32-bit word of the Mersenne prime 2^61 - 1 (its low word is all ones). */
+const MERSENNE_HI = 0x1fffffff;
+
 function mulberry32(seed: number): () => number {
   let state = seed | 0;
   return () => {
@@ -16,36 +20,91 @@ function mulberry32(seed: number): () => number {
   };
 }
 
+/** Permutation coefficients with `a` pre-split into 16-bit halves for the hash loop. */
+interface Coefficients {
+  aLo: Uint32Array;
+  aHi: Uint32Array;
+  b: Uint32Array;
+}
+
+/**
+ * Permutation coefficients depend only on the seed and the permutation count,
+ * so every MinHash with the same size shares one table instead of re-running
+ * the RNG and allocating fresh arrays per document.
+ */
+const coefficientCache = new Map<number, Coefficients>();
+
+function getCoefficients(numPermutations: number): Coefficients {
+  let coefficients = coefficientCache.get(numPermutations);
+  if (!coefficients) {
+    const aLo = new Uint32Array(numPermutations);
+    const aHi = new Uint32Array(numPermutations);
+    const b = new Uint32Array(numPermutations);
+    const rng = mulberry32(HASH_SEED);
+    for (let i = 0; i < numPermutations; i++) {
+      let a = Math.floor(rng() * MAX_HASH);
+      if (a === 0) a = 1;
+      aLo[i] = a & 0xffff;
+      aHi[i] = a >>> 16;
+      b[i] = Math.floor(rng() * MAX_HASH);
+    }
+    coefficients = { aLo, aHi, b };
+    coefficientCache.set(numPermutations, coefficients);
+  }
+  return coefficients;
+}
+
 export class MinHash {
   readonly numPermutations: number;
   signature: Uint32Array;
-  private coeffA: BigInt64Array;
-  private coeffB: BigInt64Array;
+  private coefficients: Coefficients;
 
   constructor(numPermutations = 192) {
     this.numPermutations = numPermutations;
     this.signature = new Uint32Array(numPermutations).fill(MAX_HASH);
-    this.coeffA = new BigInt64Array(numPermutations);
-    this.coeffB = new BigInt64Array(numPermutations);
-
-    const rng = mulberry32(HASH_SEED);
-    for (let i = 0; i < numPermutations; i++) {
-      let a = BigInt(Math.floor(rng() * MAX_HASH));
-      if (a === 0n) a = 1n;
-      this.coeffA[i] = a;
-      this.coeffB[i] = BigInt(Math.floor(rng() * MAX_HASH));
-    }
+    this.coefficients = getCoefficients(numPermutations);
   }
 
+  /**
+   * Computes `((a * x + b) mod (2^61 - 1)) mod (2^32 - 1)` for every
+   * permutation using exact double arithmetic on 32-bit words rather than
+   * BigInt, which allocated on every step of the inner loop. The results are
+   * bit-identical to the BigInt formulation, so stored signatures stay valid.
+   */
   update(shingles: Set<number>): void {
+    const { aLo, aHi, b } = this.coefficients;
+    const { signature, numPermutations } = this;
     for (const x of shingles) {
-      const bx = BigInt(x);
-      for (let i = 0; i < this.numPermutations; i++) {
-        const h = Number(
-          ((this.coeffA[i] * bx + this.coeffB[i]) % MERSENNE_PRIME) % BigInt(MAX_HASH),
-        );
-        if (h < this.signature[i]) {
-          this.signature[i] = h;
+      const xLo = x & 0xffff;
+      const xHi = x >>> 16;
+      for (let i = 0; i < numPermutations; i++) {
+        // 64-bit product a * x + b as (hi, lo) 32-bit words via 16-bit limbs.
+        const mid = aLo[i] * xHi + aHi[i] * xLo;
+        const midHi = Math.floor(mid / TWO_POW_16);
+        let lo = aLo[i] * xLo + (mid - midHi * TWO_POW_16) * TWO_POW_16 + b[i];
+        let hi = aHi[i] * xHi + midHi;
+        if (lo >= TWO_POW_32) {
+          const carry = Math.floor(lo / TWO_POW_32);
+          lo -= carry * TWO_POW_32;
+          hi += carry;
+        }
+
+        // Mersenne reduction: 2^61 = 1 (mod 2^61 - 1), so fold bits above 61 back in.
+        let remHi = hi & MERSENNE_HI;
+        let remLo = lo + (hi >>> 29);
+        if (remLo >= TWO_POW_32) {
+          remLo -= TWO_POW_32;
+          remHi++;
+        }
+        if (remHi > MERSENNE_HI || (remHi === MERSENNE_HI && remLo === MAX_HASH)) {
+          remLo = (remHi - MERSENNE_HI) * TWO_POW_32 + (remLo - MAX_HASH);
+          remHi = 0;
+        }
+
+        // 2^32 = 1 (mod 2^32 - 1), so the high word folds in by addition.
+        const h = (remHi + remLo) % MAX_HASH;
+        if (h < signature[i]) {
+          signature[i] = h;
         }
       }
     }
@@ -79,11 +138,39 @@ export class MinHash {
     return matches / a.length;
   }
 
+  /**
+   * Jaccard estimate between two rows of a row-major signature matrix holding
+   * `width` permutations per row, compared in place without per-row views.
+   */
+  static jaccardFromMatrix(matrix: Uint32Array, width: number, rowA: number, rowB: number): number {
+    const offsetA = rowA * width;
+    const offsetB = rowB * width;
+    let matches = 0;
+    for (let i = 0; i < width; i++) {
+      if (matrix[offsetA + i] === matrix[offsetB + i]) {
+        matches++;
+      }
+    }
+    return matches / width;
+  }
+
   serialize(): Buffer {
     return Buffer.from(this.signature.buffer, this.signature.byteOffset, this.signature.byteLength);
   }
 
-  static deserialize(buffer: Buffer, numPerm = 192): MinHash {
+  /**
+   * Rebuild a MinHash from `serialize()` output. The blob is the raw uint32
+   * signature with no header, so the permutation count defaults to the one
+   * implied by its length.
+   */
+  static deserialize(
+    buffer: Buffer,
+    numPerm = buffer.byteLength / Uint32Array.BYTES_PER_ELEMENT,
+  ): MinHash {
+    const expectedBytes = numPerm * Uint32Array.BYTES_PER_ELEMENT;
+    if (buffer.byteLength !== expectedBytes) {
+      throw new Error(`Signature is ${buffer.byteLength} bytes, expected ${expectedBytes}`);
+    }
     const mh = Object.create(MinHash.prototype) as MinHash;
     const arrayBuffer = buffer.buffer.slice(
       buffer.byteOffset,
@@ -91,9 +178,8 @@ export class MinHash {
     );
     (mh as { signature: Uint32Array }).signature = new Uint32Array(arrayBuffer);
     (mh as { numPermutations: number }).numPermutations = numPerm;
-    // Deserialized instances don't need coefficients (they are read-only signatures)
-    (mh as unknown as { coeffA: BigInt64Array }).coeffA = new BigInt64Array(0);
-    (mh as unknown as { coeffB: BigInt64Array }).coeffB = new BigInt64Array(0);
+    // Deserialized instances share the cached coefficients so update() still works
+    (mh as unknown as { coefficients: Coefficients }).coefficients = getCoefficients(numPerm);
     return mh;
   }
 }
@@ -6,8 +6,8 @@
  *   overall = base × (1 - strength × (1 - D))
  */
 
-import { tokenSortRatio, sampleText } from './fuzzy.js';
-import { computeDiscriminativeScore } from './discriminative.js';
+import { sampleText, sortedTokenRatio, sortTokens } from './fuzzy.js';
+import { compareDiscriminativeTokens, extractDiscriminativeTokens } from './discriminative.js';
 import type {
   DocumentScoringData,
   SimilarityResult,
@@ -15,6 +15,27 @@ import type {
   ScoringOptions,
 } from './types.js';
 
+/** Small tolerance so floating-point rounding never rejects a pair exactly at the threshold. */
+const CUTOFF_EPSILON = 1e-9;
+
+/**
+ * Lowest fuzzy ratio that still lets the weighted base score reach
+ * `threshold`. The discriminative penalty can only reduce the base, so any
+ * fuzzy score below this value guarantees the pair is discarded.
+ */
+function minFuzzyForThreshold(
+  jaccardSimilarity: number,
+  weights: SimilarityWeights,
+  threshold: number,
+): number {
+  if (weights.fuzzy <= 0) return 0;
+  const jaccardWeight = Math.max(weights.jaccard, 0);
+  const required =
+    (threshold * (jaccardWeight + weights.fuzzy) - jaccardWeight * jaccardSimilarity) /
+    weights.fuzzy;
+  return Math.max(0, required - CUTOFF_EPSILON);
+}
+
 export function computeSimilarityScore(
   doc1: DocumentScoringData,
   doc2: DocumentScoringData,
@@ -22,23 +43,28 @@ export function computeSimilarityScore(
   weights: SimilarityWeights,
   options?: ScoringOptions,
 ): SimilarityResult {
-  if (options?.quickMode) {
-    return {
-      overall: jaccardSimilarity,
-      jaccard: jaccardSimilarity,
-      fuzzy: 0,
-      discriminative: 0,
-    };
-  }
-
   const maxChars = options?.fuzzySampleSize ?? 5000;
-  const fuzzyScore = tokenSortRatio(
-    sampleText(doc1.normalizedText, maxChars),
-    sampleText(doc2.normalizedText, maxChars),
+  const fuzzyCutoff =
+    options?.similarityThreshold !== undefined
+      ? minFuzzyForThreshold(jaccardSimilarity, weights, options.similarityThreshold)
+      : 0;
+  const fuzzyScore = sortedTokenRatio(
+    doc1.sortedTokens ?? sortTokens(sampleText(doc1.normalizedText, maxChars)),
+    doc2.sortedTokens ?? sortTokens(sampleText(doc2.normalizedText, maxChars)),
+    fuzzyCutoff,
   );
 
+  // Below the cutoff the pair cannot reach the threshold even before the
+  // discriminative penalty (which only lowers the score), so skip it.
+  if (fuzzyCutoff > 0 && fuzzyScore === 0) {
+    return { overall: 0, jaccard: jaccardSimilarity, fuzzy: 0, discriminative: 0 };
+  }
+
   // Always compute discriminative score for UI visibility
-  const discriminativeScore = computeDiscriminativeScore(doc1.normalizedText, doc2.normalizedText);
+  const discriminativeScore = compareDiscriminativeTokens(
+    doc1.discriminativeTokens ?? extractDiscriminativeTokens(doc1.normalizedText),
+    doc2.discriminativeTokens ?? extractDiscriminativeTokens(doc2.normalizedText),
+  );
 
   // 2-component weighted average for base score
   const components: { score: number; weight: number }[] = [];
@@ -14,17 +14,71 @@ export function fnv1a32(str: string): number {
   return hash >>> 0;
 }
 
+/**
+ * FNV-1a over the little-endian bytes of a Uint32Array slice. Hashes numeric
+ * data directly, without first formatting it into an intermediate string.
+ */
+export function fnv1a32Words(words: Uint32Array, start = 0, end = words.length): number {
+  let hash = FNV_OFFSET_BASIS;
+  for (let i = start; i < end; i++) {
+    const word = words[i];
+    hash = Math.imul(hash ^ (word & 0xff), FNV_PRIME);
+    hash = Math.imul(hash ^ ((word >>> 8) & 0xff), FNV_PRIME);
+    hash = Math.imul(hash ^ ((word >>> 16) & 0xff), FNV_PRIME);
+    hash = Math.imul(hash ^ (word >>> 24), FNV_PRIME);
+  }
+  return hash >>> 0;
+}
+
+/** Matches the code units covered by the `\s` regex class. */
+function isWhitespace(code: number): boolean {
+  return (
+    code === 0x20 ||
+    (code >= 0x09 && code <= 0x0d) ||
+    code === 0xa0 ||
+    code === 0x1680 ||
+    (code >= 0x2000 && code <= 0x200a) ||
+    code === 0x2028 ||
+    code === 0x2029 ||
+    code === 0x202f ||
+    code === 0x205f ||
+    code === 0x3000 ||
+    code === 0xfeff
+  );
+}
+
+/**
+ * Hash every word n-gram of `text`. Words are located in one scan and each
+ * n-gram is hashed straight from the source characters, giving the same value
+ * as `fnv1a32` of the words joined by single spaces without building the
+ * intermediate word arrays or n-gram strings.
+ */
 export function textToShingles(text: string, ngramSize = 3, minWords = 20): Set<number> | null {
-  const words = text.split(/\s+/).filter((w) => w.length > 0);
-  if (words.length < minWords) {
+  const wordStarts: number[] = [];
+  const wordEnds: number[] = [];
+  let pos = 0;
+  while (pos < text.length) {
+    while (pos < text.length && isWhitespace(text.charCodeAt(pos))) pos++;
+    if (pos === text.length) break;
+    wordStarts.push(pos);
+    while (pos < text.length && !isWhitespace(text.charCodeAt(pos))) pos++;
+    wordEnds.push(pos);
+  }
+  if (wordStarts.length < minWords) {
     return null;
   }
 
   const shingles = new Set<number>();
-  const limit = words.length - ngramSize + 1;
+  const limit = wordStarts.length - ngramSize + 1;
   for (let i = 0; i < limit; i++) {
-    const ngram = words.slice(i, i + ngramSize).join(' ');
-    shingles.add(fnv1a32(ngram));
+    let hash = FNV_OFFSET_BASIS;
+    for (let w = i; w < i + ngramSize; w++) {
+      if (w > i) hash = Math.imul(hash ^ 0x20, FNV_PRIME);
+      for (let c = wordStarts[w]; c < wordEnds[w]; c++) {
+        hash = Math.imul(hash ^ text.charCodeAt(c), FNV_PRIME);
+      }
+    }
+    shingles.add(hash >>> 0);
   }
   return shingles;
 }
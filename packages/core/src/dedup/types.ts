@@ -1,5 +1,6 @@
 import { z } from 'zod';
 import type { ProgressCallback } from '../jobs/worker-entry.js';
+import type { DiscriminativeTokens } from './discriminative.js';
 
 export const ALGORITHM_VERSION = '1.2.0';
 export const DEDUP_CONFIG_PREFIX = 'dedup.';
@@ -21,6 +22,14 @@ export interface DocumentScoringData {
   id: string;
   title: string;
   normalizedText: string;
+  /**
+   * Precomputed `sortTokens` form of the fuzzy sample of `normalizedText`.
+   * Lets a document compared against many candidates be tokenized and sorted
+   * once instead of once per pair.
+   */
+  sortedTokens?: string;
+  /** Precomputed `extractDiscriminativeTokens(normalizedText)`, reused across pairs. */
+  discriminativeTokens?: DiscriminativeTokens;
 }
 
 export interface DedupConfig {
@@ -70,6 +79,8 @@ export const DEFAULT_DEDUP_CONFIG: DedupConfig = {
 export interface AnalysisOptions {
   force?: boolean;
   onProgress?: ProgressCallback;
+  /** LSH band buckets larger than this are skipped in near-duplicate search. */
+  maxLshBucketSize?: number;
 }
 
 export interface AnalysisResult {
@@ -110,6 +121,11 @@ export interface DocumentForScoring {
 }
 
 export interface ScoringOptions {
-  quickMode?: boolean;
   fuzzySampleSize?: number;
+  /**
+   * Minimum overall score the caller will keep. When set, the fuzzy ratio is
+   * computed with the lowest cutoff that could still reach it, and pairs that
+   * fall short are returned with a zero score without further work.
+   */
+  similarityThreshold?: number;
 }
@@ -109,6 +109,7 @@ export {
   createDuplicateDeletionPlan,
   finalizeDuplicateGroupLocally,
   getDuplicateDeletionCheckpointState,
+  getDuplicateGroupCheckpointState,
   getReviewedMutationPlan,
   markDuplicateDocumentDeleteStarted,
   markDuplicateDocumentFailed,
@@ -219,7 +220,7 @@ export {
   toPaperlessConfig,
 } from './paperless/schemas.js';
 
-export { PaperlessClient } from './paperless/client.js';
+export { PaperlessClient, discardResponseBody } from './paperless/client.js';
 export { assertSafeTargetUrl, UnsafeUrlError } from './paperless/url-guard.js';
 export {
   PaperlessApiError,
@@ -279,10 +280,14 @@ export type {
 // Dedup
 export { fnv1a32, textToShingles } from './dedup/shingles.js';
 export { MinHash } from './dedup/minhash.js';
-export { LSHIndex } from './dedup/lsh.js';
-export { tokenSortRatio, sampleText } from './dedup/fuzzy.js';
+export { LSHIndex, SortedBandIndex } from './dedup/lsh.js';
+export { tokenSortRatio, sortedTokenRatio, sortTokens, sampleText } from './dedup/fuzzy.js';
 export { computeSimilarityScore } from './dedup/scoring.js';
-export { computeDiscriminativeScore, extractDiscriminativeTokens } from './dedup/discriminative.js';
+export {
+  compareDiscriminativeTokens,
+  computeDiscriminativeScore,
+  extractDiscriminativeTokens,
+} from './dedup/discriminative.js';
 export { buildMatchExplanation } from './dedup/explanations.js';
 export type {
   DuplicateMatchExplanation,
@@ -0,0 +1,30 @@
+import { describe, it, expect } from 'vitest';
+import { createProgressThrottle } from '../progress-throttle.js';
+
+describe('createProgressThrottle', () => {
+  it('passes the first report and then at most one per interval', () => {
+    let nowMs = 0;
+    const shouldReport = createProgressThrottle(1_000, () => nowMs);
+
+    expect(shouldReport()).toBe(true);
+    nowMs = 999;
+    expect(shouldReport()).toBe(false);
+    nowMs = 1_000;
+    expect(shouldReport()).toBe(true);
+    nowMs = 1_500;
+    expect(shouldReport()).toBe(false);
+  });
+
+  it('always passes forced reports and restarts the interval from them', () => {
+    let nowMs = 0;
+    const shouldReport = createProgressThrottle(1_000, () => nowMs);
+
+    shouldReport();
+    nowMs = 10;
+    expect(shouldReport(true)).toBe(true);
+    nowMs = 1_005;
+    expect(shouldReport()).toBe(false);
+    nowMs = 1_010;
+    expect(shouldReport()).toBe(true);
+  });
+});
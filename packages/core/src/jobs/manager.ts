@@ -1,4 +1,4 @@
-import { eq, and, or, desc, lt, sql } from 'drizzle-orm';
+import { eq, and, desc, sql } from 'drizzle-orm';
 import { nanoid } from 'nanoid';
 import type Database from 'better-sqlite3';
 
@@ -224,12 +224,7 @@ export function listJobHistory(db: AppDatabase, query: JobHistoryQuery = {}): Jo
       )
       .get(cursor.key) as { id: string; createdAt: string } | undefined;
     if (!boundary) throw new JobHistoryQueryError('cursor is invalid');
-    conditions.push(
-      or(
-        lt(job.createdAt, boundary.createdAt),
-        and(eq(job.createdAt, boundary.createdAt), lt(job.id, boundary.id)),
-      )!,
-    );
+    conditions.push(sql`(${job.createdAt}, ${job.id}) < (${boundary.createdAt}, ${boundary.id})`);
   }
 
   const rows = db
@@ -0,0 +1,20 @@
+/** Minimum gap between throttled progress reports; each report writes the job row. */
+export const PROGRESS_REPORT_INTERVAL_MS = 1_000;
+
+/**
+ * Gate for progress reports from tight loops. The first call passes, then at
+ * most one per `intervalMs`; `force` always passes (pauses, the final report)
+ * and restarts the interval.
+ */
+export function createProgressThrottle(
+  intervalMs: number = PROGRESS_REPORT_INTERVAL_MS,
+  now: () => number = () => performance.now(),
+): (force?: boolean) => boolean {
+  let lastReportMs = -Infinity;
+  return (force = false) => {
+    const reportMs = now();
+    if (!force && reportMs - lastReportMs < intervalMs) return false;
+    lastReportMs = reportMs;
+    return true;
+  };
+}
@@ -121,6 +121,7 @@ export async function runWorkerTaskWithData(
   notifyReady({ type: 'worker-ready', jobId, executionToken, claimed });
   if (!claimed) {
     logger.info({ jobId }, 'Worker execution claim already owned or not yet retry-eligible');
+    sqlite.close();
     await shutdownWorkerTelemetry();
     return;
   }
@@ -189,6 +190,7 @@ export async function runWorkerTaskWithData(
     failJob(db, jobId, errorMessage, executionToken);
     logger.error({ jobId, error: errorMessage }, 'Worker task failed');
   } finally {
+    sqlite.close();
     await shutdownWorkerTelemetry();
   }
 }
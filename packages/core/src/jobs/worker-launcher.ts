@@ -1,7 +1,7 @@
 import { Worker, type WorkerOptions } from 'node:worker_threads';
 import { nanoid } from 'nanoid';
 import { createLogger } from '../logger.js';
-import { createDatabase, createDatabaseWithHandle } from '../db/client.js';
+import { createDatabaseWithHandle } from '../db/client.js';
 import { failJob } from './manager.js';
 import { releaseWorkerClaimForRetry } from './worker-entry.js';
 import { serializeTraceContext } from '../telemetry/worker.js';
@@ -131,9 +131,13 @@ export function launchWorker(options: LaunchWorkerOptions): WorkerHandle {
       return;
     }
     try {
-      const db = createDatabase(dbPath);
-      const message = err instanceof Error ? err.message : String(err);
-      markJobFailed(db, jobId, `Worker crashed: ${message}`, executionToken);
+      const { db, sqlite } = createDatabaseWithHandle(dbPath);
+      try {
+        const message = err instanceof Error ? err.message : String(err);
+        markJobFailed(db, jobId, `Worker crashed: ${message}`, executionToken);
+      } finally {
+        sqlite.close();
+      }
       logger.info({ jobId }, 'Marked crashed worker job as failed');
     } catch (e) {
       logger.error({ jobId, error: e }, 'Failed to mark crashed job as failed');
@@ -159,6 +159,34 @@ describe('reviewed duplicate deletion worker', () => {
     ).toBe('deleted');
   });
 
+  it('time-gates per-group progress but always reports completion', async () => {
+    const preview = createDuplicateDeletionPlan(handle.db, ['changed-group', 'stable-group'], {
+      now: new Date('2026-07-24T11:00:00.000Z'),
+    });
+    const onProgress = vi.fn();
+    // Time stands still, so only the first group's report passes the gate
+    const progressClock = () => 0;
+
+    await executeReviewedDuplicateDeletion(
+      {
+        db: handle.db,
+        sqlite: handle.sqlite,
+        jobId: 'job-1',
+        taskData: { planToken: preview.token },
+        executionToken: 'execution-1',
+      } satisfies WorkerContext,
+      onProgress,
+      { deleteDocument: vi.fn().mockResolvedValue(undefined) },
+      new Date('2026-07-24T11:02:00.000Z'),
+      { progressClock },
+    );
+
+    expect(onProgress.mock.calls).toEqual([
+      [0, 'Processing reviewed group 1 of 2'],
+      [1, 'Batch operation complete'],
+    ]);
+  });
+
   it('does not delete when membership changes between the group and member snapshot reads', async () => {
     const preview = createDuplicateDeletionPlan(handle.db, ['stable-group'], {
       now: new Date('2026-07-24T11:00:00.000Z'),
@@ -457,6 +485,89 @@ describe('reviewed duplicate deletion worker', () => {
     expect(recovered.deleteDocument).toHaveBeenCalledOnce();
   });
 
+  it('stops taking documents after a failed delete and leaves the group resumable', async () => {
+    seedGroup(handle.db, 'wide-group', 'wide-primary', 300, 'wide-1', 301);
+    const extraIds = [302, 303, 304, 305, 306, 307, 308];
+    handle.db
+      .insert(document)
+      .values(
+        extraIds.map((paperlessId) => ({
+          id: `wide-${paperlessId - 300}`,
+          paperlessId,
+          title: `wide duplicate ${paperlessId}`,
+          syncedAt: '2026-07-24T09:00:00.000Z',
+        })),
+      )
+      .run();
+    handle.db
+      .insert(duplicateMember)
+      .values(
+        extraIds.map((paperlessId) => ({
+          id: `wide-member-${paperlessId}`,
+          groupId: 'wide-group',
+          documentId: `wide-${paperlessId - 300}`,
+          isPrimary: false,
+        })),
+      )
+      .run();
+    const preview = createDuplicateDeletionPlan(handle.db, ['wide-group'], {
+      now: new Date('2026-07-24T11:00:00.000Z'),
+    });
+    const firstAttempt = { deleteDocument: vi.fn().mockResolvedValue(undefined) };
+    let deletesStartedAtFailure = 0;
+
+    await expect(
+      executeReviewedDuplicateDeletion(
+        {
+          db: handle.db,
+          sqlite: handle.sqlite,
+          jobId: 'job-1',
+          taskData: { planToken: preview.token },
+        },
+        vi.fn(),
+        firstAttempt,
+        new Date('2026-07-24T11:01:00.000Z'),
+        {
+          afterRemoteDelete: (paperlessId) => {
+            if (paperlessId !== 302) return;
+            deletesStartedAtFailure = firstAttempt.deleteDocument.mock.calls.length;
+            throw new Error('simulated checkpoint failure');
+          },
+        },
+      ),
+    ).rejects.toThrow('simulated checkpoint failure');
+    expect(deletesStartedAtFailure).toBeGreaterThan(0);
+    expect(firstAttempt.deleteDocument).toHaveBeenCalledTimes(deletesStartedAtFailure);
+    expect(deletesStartedAtFailure).toBeLessThan(8);
+
+    const attempted = firstAttempt.deleteDocument.mock.calls.map(([id]) => id as number);
+    const resumed = { deleteDocument: vi.fn().mockResolvedValue(undefined) };
+    await expect(
+      executeReviewedDuplicateDeletion(
+        {
+          db: handle.db,
+          sqlite: handle.sqlite,
+          jobId: 'job-1',
+          taskData: { planToken: preview.token },
+        },
+        vi.fn(),
+        resumed,
+        new Date('2026-07-24T11:02:00.000Z'),
+      ),
+    ).resolves.toMatchObject({ deletedGroups: 1, errors: [] });
+    // The failed document and every document never attempted are deleted on resume
+    expect(resumed.deleteDocument.mock.calls.map(([id]) => id).sort()).toEqual(
+      [301, ...extraIds].filter((id) => id === 302 || !attempted.includes(id)),
+    );
+    expect(
+      handle.db
+        .select({ status: duplicateGroup.status })
+        .from(duplicateGroup)
+        .where(eq(duplicateGroup.id, 'wide-group'))
+        .get()?.status,
+    ).toBe('deleted');
+  });
+
   it('durably reconciles an earlier document when a later remote delete fails', async () => {
     handle.db
       .insert(document)
@@ -2,6 +2,7 @@ import { z } from 'zod';
 
 import { runWorkerTask } from '../worker-entry.js';
 import type { ProgressCallback, WorkerContext } from '../worker-entry.js';
+import { createProgressThrottle } from '../progress-throttle.js';
 import { PaperlessClient } from '../../paperless/client.js';
 import { PaperlessApiError, PaperlessConnectionError } from '../../paperless/errors.js';
 import { toPaperlessConfig } from '../../paperless/schemas.js';
@@ -11,6 +12,7 @@ import {
   completeDuplicateDeletionPlan,
   finalizeDuplicateGroupLocally,
   getDuplicateDeletionCheckpointState,
+  getDuplicateGroupCheckpointState,
   markDuplicateDocumentDeleteStarted,
   markDuplicateDocumentFailed,
   markDuplicateDocumentRemoteDeleted,
@@ -19,6 +21,7 @@ import {
   reconcileDuplicateDocumentLocally,
   revalidateFrozenDuplicateGroup,
 } from '../../review/mutation-plans.js';
+import type { FrozenDuplicateDocument } from '../../review/mutation-plans.js';
 
 const batchTaskDataSchema = z
   .object({
@@ -28,6 +31,9 @@ const batchTaskDataSchema = z
 
 type DeleteDocumentClient = Pick<PaperlessClient, 'deleteDocument'>;
 
+/** Remote deletes in flight at once while processing one reviewed group. */
+const REMOTE_DELETE_CONCURRENCY = 4;
+
 type BatchConflict = {
   groupId: string;
   reason: 'missing' | 'changed';
@@ -70,6 +76,8 @@ export type DuplicateDeletionWorkerHooks = {
   afterRemoteDelete?: (paperlessId: number) => void | Promise<void>;
   /** Test seam for a mutation racing the coherent group/member snapshot. */
   afterRevalidationGroupRead?: () => void;
+  /** Test seam for the clock that gates per-group progress reports. */
+  progressClock?: () => number;
 };
 
 function assertDuplicateDeleteLease(ctx: WorkerContext): void {
@@ -143,24 +151,28 @@ export async function executeReviewedDuplicateDeletion(
 
   const plan = claimDuplicateDeletionPlan(ctx.db, taskData.data.planToken, ctx.jobId, now);
 
+  // A resumed plan skips its completed groups in a tight loop, so reports are
+  // time-gated rather than written once per group
+  const shouldReportProgress = createProgressThrottle(undefined, hooks.progressClock);
   for (let index = 0; index < plan.groups.length; index++) {
     const frozenGroup = plan.groups[index];
-    await onProgress(
-      index / plan.groups.length,
-      `Processing reviewed group ${index + 1} of ${plan.groups.length}`,
-    );
+    if (shouldReportProgress()) {
+      await onProgress(
+        index / plan.groups.length,
+        `Processing reviewed group ${index + 1} of ${plan.groups.length}`,
+      );
+    }
 
-    const beforeState = getDuplicateDeletionCheckpointState(ctx.sqlite, plan.planId);
-    const beforeGroup = beforeState.groups.find(({ groupId }) => groupId === frozenGroup.groupId);
-    if (beforeGroup?.status === 'completed' || beforeGroup?.status === 'conflict') continue;
+    // Only this worker writes the group's checkpoints, so one read serves the
+    // whole group: each document below changes nothing but its own checkpoint
+    const before = getDuplicateGroupCheckpointState(ctx.sqlite, plan.planId, frozenGroup.groupId);
+    if (before.group?.status === 'completed' || before.group?.status === 'conflict') continue;
 
     const revalidation = revalidateFrozenDuplicateGroup(ctx.db, frozenGroup, {
       afterGroupRead: hooks.afterRevalidationGroupRead,
       reconciledDocumentIds: new Set(
-        beforeState.documents
-          .filter(
-            ({ groupId, status }) => groupId === frozenGroup.groupId && status === 'reconciled',
-          )
+        before.documents
+          .filter(({ status }) => status === 'reconciled')
           .map(({ documentId }) => documentId),
       ),
     });
@@ -176,14 +188,12 @@ export async function executeReviewedDuplicateDeletion(
     }
 
     markDuplicateGroupStarted(ctx.sqlite, plan.planId, frozenGroup.groupId, now);
+    const checkpoints = new Map(
+      before.documents.map((checkpoint) => [checkpoint.documentId, checkpoint]),
+    );
+    const startedDocuments: FrozenDuplicateDocument[] = [];
     for (const frozenDocument of frozenGroup.nonPrimaryDocuments) {
-      const checkpoint = getDuplicateDeletionCheckpointState(
-        ctx.sqlite,
-        plan.planId,
-      ).documents.find(
-        ({ groupId, documentId }) =>
-          groupId === frozenGroup.groupId && documentId === frozenDocument.documentId,
-      );
+      const checkpoint = checkpoints.get(frozenDocument.documentId);
       if (checkpoint?.status === 'reconciled') continue;
       if (checkpoint?.status === 'remote_deleted') {
         reconcileDuplicateDocumentLocally(
@@ -206,6 +216,10 @@ export async function executeReviewedDuplicateDeletion(
       ) {
         continue;
       }
+      startedDocuments.push(frozenDocument);
+    }
+
+    const deleteStartedDocument = async (frozenDocument: FrozenDuplicateDocument) => {
       let remoteOutcome: 'deleted' | 'already_missing';
       try {
         await client.deleteDocument(frozenDocument.paperlessId);
@@ -223,7 +237,7 @@ export async function executeReviewedDuplicateDeletion(
             failure.retryable,
             now,
           );
-          continue;
+          return;
         }
       }
       await hooks.afterRemoteDelete?.(frozenDocument.paperlessId);
@@ -242,12 +256,36 @@ export async function executeReviewedDuplicateDeletion(
         frozenDocument,
         now,
       );
-    }
+    };
+
+    // Each document is checkpointed independently, so the group's remote
+    // deletes can run a few at a time instead of one round trip after another.
+    // After a failure no runner takes another document, and the failure is only
+    // rethrown once every in-flight delete has written its checkpoint.
+    let nextDocument = 0;
+    const failures: unknown[] = [];
+    await Promise.allSettled(
+      Array.from(
+        { length: Math.min(REMOTE_DELETE_CONCURRENCY, startedDocuments.length) },
+        async () => {
+          while (failures.length === 0 && nextDocument < startedDocuments.length) {
+            try {
+              await deleteStartedDocument(startedDocuments[nextDocument++]);
+            } catch (error) {
+              failures.push(error);
+              throw error;
+            }
+          }
+        },
+      ),
+    );
+    if (failures.length > 0) throw failures[0];
 
-    const groupDocuments = getDuplicateDeletionCheckpointState(
+    const groupDocuments = getDuplicateGroupCheckpointState(
       ctx.sqlite,
       plan.planId,
-    ).documents.filter(({ groupId }) => groupId === frozenGroup.groupId);
+      frozenGroup.groupId,
+    ).documents;
     if (groupDocuments.every(({ status }) => status === 'reconciled')) {
       finalizeDuplicateGroupLocally(ctx.sqlite, plan.planId, frozenGroup, now);
     }
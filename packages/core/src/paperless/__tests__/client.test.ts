@@ -251,6 +251,25 @@ describe('PaperlessClient', () => {
       expect(sleepSpy).toHaveBeenCalledTimes(1);
     });
 
+    it('should draw server-error backoff uniformly up to the exponential bound', async () => {
+      const client = new PaperlessClient({
+        url: 'http://localhost:8000',
+        token: 'tok',
+        maxRetries: 2,
+        timeout: 5000,
+      });
+      vi.spyOn(Math, 'random').mockReturnValue(0.25);
+
+      mockFetch
+        .mockResolvedValueOnce(mockResponse({ error: 'fail' }, 503))
+        .mockResolvedValueOnce(mockResponse({ error: 'fail' }, 503))
+        .mockResolvedValueOnce(mockResponse({ ok: true }));
+
+      await (client as any).fetchWithRetry('http://localhost:8000/api/test/');
+
+      expect(sleepSpy.mock.calls.map(([ms]) => ms)).toEqual([250, 500]);
+    });
+
     it('should respect Retry-After header in seconds format for 429', async () => {
       const client = new PaperlessClient({
         url: 'http://localhost:8000',
@@ -266,7 +285,10 @@ describe('PaperlessClient', () => {
       await (client as any).fetchWithRetry('http://localhost:8000/api/test/');
 
       expect(mockFetch).toHaveBeenCalledTimes(2);
-      expect(sleepSpy).toHaveBeenCalledWith(3000);
+      // Retry-After plus up to a second of jitter
+      const sleepMs = sleepSpy.mock.calls[0][0] as number;
+      expect(sleepMs).toBeGreaterThanOrEqual(3000);
+      expect(sleepMs).toBeLessThan(4000);
     });
 
     it('should respect Retry-After header in HTTP date format for 429', async () => {
@@ -462,6 +484,83 @@ describe('PaperlessClient', () => {
       expect(mockFetch).toHaveBeenCalledTimes(1);
     });
 
+    it('should keep a bounded window of pages in flight ahead of the consumer', async () => {
+      const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
+
+      mockFetch.mockImplementation((url: string) => {
+        const page = Number(new URL(url).searchParams.get('page'));
+        const doc = makeSnakeCaseDocument({ id: page });
+        return Promise.resolve(
+          mockResponse(makePaginatedResponse([doc], page < 10 ? 'next' : null, 10)),
+        );
+      });
+
+      for await (const page of client.getDocuments({ pageSize: 1 })) {
+        // Pages 2-4 are already in flight while page 1 is being consumed
+        expect(mockFetch).toHaveBeenCalledTimes(4);
+        expect(page.results[0].id).toBe(1);
+        break;
+      }
+
+      expect(mockFetch).toHaveBeenCalledTimes(4);
+      expect(mockFetch.mock.calls[0][0]).toContain('page=1&page_size=1');
+      expect(mockFetch.mock.calls[3][0]).toContain('page=4&page_size=1');
+
+      mockFetch.mockClear();
+      for await (const page of client.getDocuments({ pageSize: 1, prefetch: 1 })) {
+        expect(page.results[0].id).toBe(1);
+        break;
+      }
+      expect(mockFetch).toHaveBeenCalledTimes(2);
+    });
+
+    it('should request each page only when it is reached with prefetch 0', async () => {
+      const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
+
+      mockFetch.mockImplementation((url: string) => {
+        const page = Number(new URL(url).searchParams.get('page'));
+        const doc = makeSnakeCaseDocument({ id: page });
+        return Promise.resolve(
+          mockResponse(makePaginatedResponse([doc], page < 3 ? 'next' : null, 3)),
+        );
+      });
+
+      for await (const page of client.getDocuments({ pageSize: 1, prefetch: 0 })) {
+        expect(page.results[0].id).toBe(1);
+        break;
+      }
+      expect(mockFetch).toHaveBeenCalledTimes(1);
+
+      mockFetch.mockClear();
+      const ids: number[] = [];
+      for await (const page of client.getDocuments({ pageSize: 1, prefetch: 0 })) {
+        expect(mockFetch).toHaveBeenCalledTimes(page.results[0].id);
+        ids.push(page.results[0].id);
+      }
+      expect(ids).toEqual([1, 2, 3]);
+    });
+
+    it('should stop at pages that disappeared because the list shrank', async () => {
+      const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
+
+      mockFetch.mockImplementation((url: string) => {
+        const page = Number(new URL(url).searchParams.get('page'));
+        if (page === 3) return Promise.resolve(mockResponse({ detail: 'Invalid page.' }, 404));
+        const doc = makeSnakeCaseDocument({ id: page });
+        return Promise.resolve(
+          mockResponse(makePaginatedResponse([doc], page === 1 ? 'next' : null, 3)),
+        );
+      });
+
+      const ids: number[] = [];
+      for await (const page of client.getDocuments({ pageSize: 1 })) {
+        ids.push(...page.results.map((doc) => doc.id));
+      }
+
+      expect(ids).toEqual([1, 2]);
+      expect(mockFetch).toHaveBeenCalledTimes(3);
+    });
+
     it('should yield empty array for zero results', async () => {
       const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
 
@@ -623,6 +722,9 @@ describe('PaperlessClient', () => {
       expect(result.documentCount).toBe(42);
       // No version headers in mock → falls back to 'unknown'
       expect(result.version).toBe('unknown');
+      expect(mockFetch.mock.calls[1][0]).toBe(
+        'http://localhost:8000/api/documents/?fields=id&page_size=1',
+      );
     });
 
     it('should return detected version from X-Version header', async () => {
@@ -718,6 +820,29 @@ describe('PaperlessClient', () => {
       expect(mockFetch).toHaveBeenCalledTimes(2);
     });
 
+    it('should request the remaining pages concurrently and keep page order', async () => {
+      const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
+      const corr = (id: number) => ({ id, name: `Corr ${id}`, matching_algorithm: 0, match: '' });
+
+      const resolvers: (() => void)[] = [];
+      mockFetch.mockImplementation((url: string) => {
+        const page = Number(new URL(url).searchParams.get('page'));
+        const body = makePaginatedResponse([corr(page)], page < 3 ? 'next' : null, 3);
+        if (page === 1) return Promise.resolve(mockResponse(body));
+        return new Promise((resolve) => resolvers.push(() => resolve(mockResponse(body))));
+      });
+
+      const pending = client.getCorrespondents();
+      await vi.waitFor(() => expect(resolvers).toHaveLength(2));
+      // Both later pages are in flight at once; finish them out of order
+      resolvers[1]();
+      resolvers[0]();
+
+      const correspondents = await pending;
+      expect(correspondents.map((c) => c.id)).toEqual([1, 2, 3]);
+      expect(mockFetch).toHaveBeenCalledTimes(3);
+    });
+
     it('should handle single page via getCorrespondents', async () => {
       const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
 
@@ -793,6 +918,34 @@ describe('PaperlessClient', () => {
     });
   });
 
+  describe('count endpoints', () => {
+    it('reads the total from a single one-item page', async () => {
+      const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
+      mockFetch.mockResolvedValueOnce(
+        mockResponse(makePaginatedResponse([], 'http://localhost:8000/api/tags/?page=2', 250)),
+      );
+
+      const count = await client.getTagCount();
+
+      expect(count).toBe(250);
+      expect(mockFetch).toHaveBeenCalledTimes(1);
+      expect(mockFetch.mock.calls[0][0]).toBe('http://localhost:8000/api/tags/?page_size=1');
+    });
+  });
+
+  describe('getDocumentContent', () => {
+    it('requests only the content field', async () => {
+      const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
+      mockFetch.mockResolvedValueOnce(mockResponse({ content: 'Invoice text' }));
+
+      await expect(client.getDocumentContent(42)).resolves.toBe('Invoice text');
+      expect(mockFetch).toHaveBeenCalledTimes(1);
+      expect(mockFetch.mock.calls[0][0]).toBe(
+        'http://localhost:8000/api/documents/42/?fields=content',
+      );
+    });
+  });
+
   describe('updateDocument', () => {
     it('serializes custom field instances in the v10 document format', async () => {
       const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
@@ -814,6 +967,39 @@ describe('PaperlessClient', () => {
         ],
       });
     });
+
+    it('reads the response body so the connection can be reused', async () => {
+      const client = new PaperlessClient({ url: 'http://localhost:8000', token: 'tok' });
+      const response = mockResponse({ id: 42 });
+      mockFetch.mockResolvedValueOnce(response);
+
+      await client.updateDocument(42, { title: 'Renamed' });
+
+      expect(response.bodyUsed).toBe(true);
+    });
+  });
+
+  // ─── Request pacing ──────────────────────────────────────────────────
+
+  describe('request pacing', () => {
+    it('delays requests beyond the configured rate', async () => {
+      const sleep = vi.spyOn(PaperlessClient.prototype as any, 'sleep').mockResolvedValue(undefined);
+      const client = new PaperlessClient({
+        url: 'http://localhost:8000',
+        token: 'tok',
+        maxRequestsPerSecond: 2,
+      });
+      mockFetch.mockImplementation(() => Promise.resolve(mockResponse({ ok: true })));
+
+      for (let i = 0; i < 3; i++) {
+        await (client as any).fetchWithRetry('http://localhost:8000/api/test/');
+      }
+
+      // Two requests fit the burst; the third waits about half a second
+      expect(sleep).toHaveBeenCalledTimes(1);
+      expect(sleep.mock.calls[0][0]).toBeGreaterThan(400);
+      expect(mockFetch).toHaveBeenCalledTimes(3);
+    });
   });
 
   // ─── deleteDocument ──────────────────────────────────────────────────
@@ -424,4 +424,13 @@ describe('paginatedResponseSchema', () => {
     expect(result.next).toBeNull();
     expect(result.previous).toBeNull();
   });
+
+  it('reuses the same schema for the same item schema', () => {
+    expect(paginatedResponseSchema(paperlessTagSchema)).toBe(
+      paginatedResponseSchema(paperlessTagSchema),
+    );
+    expect(paginatedResponseSchema(paperlessTagSchema)).not.toBe(
+      paginatedResponseSchema(paperlessDocumentSchema),
+    );
+  });
 });
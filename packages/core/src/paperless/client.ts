@@ -33,12 +33,64 @@ import { PaperlessApiError, PaperlessAuthError, PaperlessConnectionError } from
 /** Paperless-NGX matching_algorithm=0 disables automatic assignment matching. */
 const MATCHING_NONE = 0;
 
+/** Pages of a reference list requested at once after its first page. */
+const LIST_FETCH_CONCURRENCY = 4;
+
+/** Document pages kept in flight ahead of the consumer by default. */
+const DOCUMENT_PREFETCH_PAGES = 3;
+
+/** List envelope reduced to its total, for endpoints read only for their count. */
+const countResponseSchema = z.object({ count: z.number() });
+
+/** Document detail reduced to its OCR text. */
+const documentContentSchema = z.object({ content: z.string().default('') });
+
+/**
+ * Token bucket that paces requests to `rate` per second, allowing bursts of
+ * up to `rate` requests. Each caller reserves a slot up front, so concurrent
+ * requests queue behind each other instead of all waking at once.
+ */
+class RequestRateLimiter {
+  private readonly capacity: number;
+  private tokens: number;
+  private updatedAt: number;
+
+  constructor(
+    private readonly rate: number,
+    private readonly now: () => number = Date.now,
+  ) {
+    this.capacity = Math.max(1, rate);
+    this.tokens = this.capacity;
+    this.updatedAt = now();
+  }
+
+  /** Reserve the next request slot and return how long to wait for it, in ms. */
+  reserve(): number {
+    const now = this.now();
+    const refilled = ((now - this.updatedAt) / 1000) * this.rate;
+    this.tokens = Math.min(this.capacity, this.tokens + refilled) - 1;
+    this.updatedAt = now;
+    return this.tokens >= 0 ? 0 : (-this.tokens / this.rate) * 1000;
+  }
+}
+
+/**
+ * Read and drop a response body the caller has no use for. Node's fetch only
+ * returns a keep-alive connection to its pool once the body has been read;
+ * an unread body holds the socket until garbage collection, so the next
+ * request has to open a new connection.
+ */
+export async function discardResponseBody(response: Response): Promise<void> {
+  await response.arrayBuffer().catch(() => undefined);
+}
+
 export class PaperlessClient {
   private readonly baseUrl: string;
-  private readonly headers: Record<string, string>;
+  private headers: Record<string, string>;
   private readonly timeout: number;
   private readonly maxRetries: number;
   private readonly logger: Logger;
+  private readonly rateLimiter: RequestRateLimiter | null;
   private detectedApiVersion: string | null = null;
   private detectedPngxVersion: string | null = null;
 
@@ -59,6 +111,9 @@ export class PaperlessClient {
 
     this.timeout = config.timeout ?? 30000;
     this.maxRetries = config.maxRetries ?? 3;
+    this.rateLimiter = config.maxRequestsPerSecond
+      ? new RequestRateLimiter(config.maxRequestsPerSecond)
+      : null;
     this.logger = createLogger('paperless-client');
   }
 
@@ -66,6 +121,15 @@ export class PaperlessClient {
     return new Promise((resolve) => setTimeout(resolve, ms));
   }
 
+  /**
+   * Full-jitter exponential backoff: a uniform delay up to 2^attempt seconds,
+   * capped at 30s, so concurrent clients retrying the same failure spread out
+   * instead of retrying in lockstep.
+   */
+  private retryBackoffMs(attempt: number): number {
+    return Math.random() * Math.min(2 ** attempt * 1000, 30000);
+  }
+
   private buildUrl(path: string): string {
     return `${this.baseUrl}${path.startsWith('/') ? path : '/' + path}`;
   }
@@ -75,7 +139,12 @@ export class PaperlessClient {
     options: RequestInit = {},
     attempt: number = 0,
   ): Promise<Response> {
-    const mergedHeaders = { ...this.headers, ...options.headers };
+    // Pace locally rather than waiting for Paperless to answer 429
+    const waitMs = this.rateLimiter?.reserve() ?? 0;
+    if (waitMs > 0) await this.sleep(waitMs);
+
+    // Most requests are plain GETs: reuse the client headers instead of copying them
+    const mergedHeaders = options.headers ? { ...this.headers, ...options.headers } : this.headers;
 
     let response: Response;
     try {
@@ -91,7 +160,7 @@ export class PaperlessClient {
           (error.name === 'TimeoutError' || error.name === 'AbortError'))
       ) {
         if (attempt < this.maxRetries) {
-          const backoff = Math.min(2 ** attempt * 1000 + Math.random() * 1000, 30000);
+          const backoff = this.retryBackoffMs(attempt);
           this.logger.warn(
             { attempt: attempt + 1, maxRetries: this.maxRetries, backoffMs: Math.round(backoff) },
             'Network error, retrying request',
@@ -134,10 +203,18 @@ export class PaperlessClient {
             }
           }
         }
+        // Up to a second of jitter so clients told the same Retry-After do not
+        // all come back at the same instant
+        retryAfterMs += Math.random() * 1000;
         this.logger.warn(
-          { attempt: attempt + 1, maxRetries: this.maxRetries, retryAfterMs },
+          {
+            attempt: attempt + 1,
+            maxRetries: this.maxRetries,
+            retryAfterMs: Math.round(retryAfterMs),
+          },
           'Rate limited (429), retrying after delay',
         );
+        await discardResponseBody(response);
         await this.sleep(retryAfterMs);
         return this.fetchWithRetry(url, options, attempt + 1);
       }
@@ -151,7 +228,7 @@ export class PaperlessClient {
 
     if (response.status >= 500 && response.status < 600) {
       if (attempt < this.maxRetries) {
-        const backoff = Math.min(2 ** attempt * 1000 + Math.random() * 1000, 30000);
+        const backoff = this.retryBackoffMs(attempt);
         this.logger.warn(
           {
             attempt: attempt + 1,
@@ -161,6 +238,7 @@ export class PaperlessClient {
           },
           'Server error, retrying request',
         );
+        await discardResponseBody(response);
         await this.sleep(backoff);
         return this.fetchWithRetry(url, options, attempt + 1);
       }
@@ -189,7 +267,8 @@ export class PaperlessClient {
         this.detectedPngxVersion = pngxVer;
         // Pin subsequent requests to the server's reported API version so we
         // always get the latest format without requesting an unsupported version.
-        this.headers['Accept'] = `application/json; version=${apiVer}`;
+        // Replace rather than mutate: earlier requests were handed the old object.
+        this.headers = { ...this.headers, Accept: `application/json; version=${apiVer}` };
         this.logger.info(
           { apiVersion: apiVer, pngxVersion: pngxVer },
           'Detected Paperless-NGX API version',
@@ -215,18 +294,15 @@ export class PaperlessClient {
 
   async testConnection(): Promise<ConnectionTestResult> {
     try {
-      const statsResponse = await this.fetchWithRetry(this.buildUrl('/api/statistics/'));
-      const statsJson = await statsResponse.json();
-      paperlessStatisticsSchema.parse(statsJson);
+      await this.getJson('/api/statistics/', paperlessStatisticsSchema);
 
-      const docsResponse = await this.fetchWithRetry(this.buildUrl('/api/documents/?page_size=1'));
-      const docsJson = await docsResponse.json();
-      const paginated = paginatedResponseSchema(paperlessDocumentSchema).parse(docsJson);
+      // Only the count is needed, so ask for a single id-only document
+      const documentCount = await this.fetchCount('/api/documents/?fields=id');
 
       return {
         success: true,
         version: this.detectedPngxVersion ?? this.detectedApiVersion ?? 'unknown',
-        documentCount: paginated.count,
+        documentCount,
       };
     } catch (error) {
       if (error instanceof PaperlessAuthError) {
@@ -245,12 +321,12 @@ export class PaperlessClient {
   async *getDocuments(options?: {
     ordering?: string;
     pageSize?: number;
+    /** Pages requested ahead of the one being consumed; 0 fetches each page on demand. */
+    prefetch?: number;
   }): AsyncGenerator<{ results: PaperlessDocument[]; totalCount: number }> {
     const pageSize = options?.pageSize ?? 100;
     const ordering = options?.ordering ?? '-modified';
-    const schema = paginatedResponseSchema(paperlessDocumentSchema);
-    let page = 1;
-    let hasNext = true;
+    const prefetch = options?.prefetch ?? DOCUMENT_PREFETCH_PAGES;
 
     const fields = [
       'id',
@@ -268,32 +344,28 @@ export class PaperlessClient {
       'custom_fields',
     ].join(',');
 
-    while (hasNext) {
-      this.logger.debug({ page, pageSize, ordering }, 'Fetching documents page');
-      const response = await this.fetchWithRetry(
-        this.buildUrl(
-          `/api/documents/?page=${page}&page_size=${pageSize}&ordering=${ordering}&fields=${fields}`,
-        ),
-      );
-      const json = await response.json();
-      const parsed = schema.parse(json);
-
-      yield { results: parsed.results, totalCount: parsed.count };
-
-      hasNext = parsed.next !== null;
-      page++;
+    const pages = this.paginate<PaperlessDocument>(
+      `/api/documents/?ordering=${ordering}&fields=${fields}`,
+      paperlessDocumentSchema,
+      pageSize,
+      prefetch,
+    );
+    for await (const page of pages) {
+      yield { results: page.results, totalCount: page.count };
     }
   }
 
   async getDocument(id: number): Promise<PaperlessDocument> {
-    const response = await this.fetchWithRetry(this.buildUrl(`/api/documents/${id}/`));
-    const json = await response.json();
-    return paperlessDocumentSchema.parse(json);
+    return this.getJson(`/api/documents/${id}/`, paperlessDocumentSchema);
   }
 
   async getDocumentContent(id: number): Promise<string> {
-    const doc = await this.getDocument(id);
-    return doc.content;
+    // Only the text is needed; skip serializing the rest of the document
+    const { content } = await this.getJson(
+      `/api/documents/${id}/?fields=content`,
+      documentContentSchema,
+    );
+    return content;
   }
 
   async getTags(): Promise<PaperlessTag[]> {
@@ -313,15 +385,11 @@ export class PaperlessClient {
   }
 
   async getStatistics(): Promise<PaperlessStatistics> {
-    const response = await this.fetchWithRetry(this.buildUrl('/api/statistics/'));
-    const json = await response.json();
-    return paperlessStatisticsSchema.parse(json);
+    return this.getJson('/api/statistics/', paperlessStatisticsSchema);
   }
 
   async getStatus(): Promise<PaperlessStatus> {
-    const response = await this.fetchWithRetry(this.buildUrl('/api/status/'));
-    const json = await response.json();
-    return paperlessStatusSchema.parse(json);
+    return this.getJson('/api/status/', paperlessStatusSchema);
   }
 
   async getStoragePaths(): Promise<PaperlessStoragePath[]> {
@@ -329,21 +397,31 @@ export class PaperlessClient {
   }
 
   async getGroupCount(): Promise<number> {
-    const response = await this.fetchWithRetry(this.buildUrl('/api/groups/?page_size=1'));
-    const json = await response.json();
-    return z.object({ count: z.number() }).parse(json).count;
+    return this.fetchCount('/api/groups/');
   }
 
   async getUserCount(): Promise<number> {
-    const response = await this.fetchWithRetry(this.buildUrl('/api/users/?page_size=1'));
-    const json = await response.json();
-    return z.object({ count: z.number() }).parse(json).count;
+    return this.fetchCount('/api/users/');
+  }
+
+  async getTagCount(): Promise<number> {
+    return this.fetchCount('/api/tags/');
+  }
+
+  async getCorrespondentCount(): Promise<number> {
+    return this.fetchCount('/api/correspondents/');
+  }
+
+  async getDocumentTypeCount(): Promise<number> {
+    return this.fetchCount('/api/document_types/');
+  }
+
+  async getStoragePathCount(): Promise<number> {
+    return this.fetchCount('/api/storage_paths/');
   }
 
   async getRemoteVersion(): Promise<PaperlessRemoteVersion> {
-    const response = await this.fetchWithRetry(this.buildUrl('/api/remote_version/'));
-    const json = await response.json();
-    return paperlessRemoteVersionSchema.parse(json);
+    return this.getJson('/api/remote_version/', paperlessRemoteVersionSchema);
   }
 
   async updateDocument(id: number, update: DocumentUpdate): Promise<void> {
@@ -354,41 +432,24 @@ export class PaperlessClient {
     if (update.tags !== undefined) body.tags = update.tags;
     if (update.customFields !== undefined) body.custom_fields = update.customFields;
 
-    await this.fetchWithRetry(this.buildUrl(`/api/documents/${id}/`), {
+    const response = await this.fetchWithRetry(this.buildUrl(`/api/documents/${id}/`), {
       method: 'PATCH',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(body),
     });
+    await discardResponseBody(response);
   }
 
   async createCorrespondent(name: string): Promise<PaperlessCorrespondent> {
-    const response = await this.fetchWithRetry(this.buildUrl('/api/correspondents/'), {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ name, matching_algorithm: MATCHING_NONE }),
-    });
-    const json = await response.json();
-    return paperlessCorrespondentSchema.parse(json);
+    return this.createNamed('/api/correspondents/', name, paperlessCorrespondentSchema);
   }
 
   async createDocumentType(name: string): Promise<PaperlessDocumentType> {
-    const response = await this.fetchWithRetry(this.buildUrl('/api/document_types/'), {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ name, matching_algorithm: MATCHING_NONE }),
-    });
-    const json = await response.json();
-    return paperlessDocumentTypeSchema.parse(json);
+    return this.createNamed('/api/document_types/', name, paperlessDocumentTypeSchema);
   }
 
   async createTag(name: string): Promise<PaperlessTag> {
-    const response = await this.fetchWithRetry(this.buildUrl('/api/tags/'), {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ name, matching_algorithm: MATCHING_NONE }),
-    });
-    const json = await response.json();
-    return paperlessTagSchema.parse(json);
+    return this.createNamed('/api/tags/', name, paperlessTagSchema);
   }
 
   async deleteDocument(id: number): Promise<void> {
@@ -410,32 +471,124 @@ export class PaperlessClient {
     method: string,
     parameters: Record<string, unknown>,
   ): Promise<void> {
-    await this.fetchWithRetry(this.buildUrl('/api/documents/bulk_edit/'), {
+    const response = await this.fetchWithRetry(this.buildUrl('/api/documents/bulk_edit/'), {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ documents: documentIds, method, parameters }),
     });
+    await discardResponseBody(response);
+  }
+
+  /**
+   * Walk a paginated list endpoint, yielding each parsed page as it arrives so
+   * callers can process results without holding the whole collection. The
+   * first page's count says how many pages follow, so up to `window` of them
+   * are kept in flight ahead of the consumer and yielded in page order.
+   */
+  private async *paginate<T>(
+    path: string,
+    schema: ZodType,
+    pageSize = 100,
+    window = LIST_FETCH_CONCURRENCY,
+  ): AsyncGenerator<{ results: T[]; count: number }> {
+    const first = await this.fetchListPage(path, schema, 1, pageSize);
+    // Size pages by what the server returned, in case it caps page_size
+    const perPage = first.results.length;
+    const pageCount = first.next === null || perPage === 0 ? 1 : Math.ceil(first.count / perPage);
+
+    const inFlight: Promise<typeof first | null>[] = [];
+    let requested = 1;
+    const request = () => {
+      const promise = this.fetchListPageIfPresent(path, schema, ++requested, perPage);
+      // Mark the rejection handled up front: the consumer may still be busy
+      // (or may stop early) when it fails. The error still surfaces when the
+      // page is awaited.
+      promise.catch(() => undefined);
+      inFlight.push(promise);
+    };
+    const fill = () => {
+      while (requested < pageCount && inFlight.length < window) request();
+    };
+
+    fill();
+    yield { results: first.results as T[], count: first.count };
+
+    let last: typeof first | null = first;
+    while (inFlight.length > 0 || requested < pageCount) {
+      // Without a read-ahead window a page is only requested once it is asked for
+      if (inFlight.length === 0) request();
+      last = await inFlight.shift()!;
+      fill();
+      if (last) yield { results: last.results as T[], count: last.count };
+    }
+
+    // The list grew since the first page: follow next links past the counted pages
+    for (let page = pageCount + 1; last?.next; page++) {
+      last = await this.fetchListPage(path, schema, page, perPage);
+      yield { results: last.results as T[], count: last.count };
+    }
   }
 
-  private async fetchAllPaginated<T>(path: string, schema: ZodType): Promise<T[]> {
-    const paginatedSchema = paginatedResponseSchema(schema);
-    const allResults: T[] = [];
-    let page = 1;
-    let hasNext = true;
+  /** GET a JSON endpoint and parse the body with `schema`. */
+  private async getJson<S extends ZodType>(path: string, schema: S): Promise<z.output<S>> {
+    const response = await this.fetchWithRetry(this.buildUrl(path));
+    return schema.parse(await response.json());
+  }
 
-    while (hasNext) {
-      const separator = path.includes('?') ? '&' : '?';
-      const url = this.buildUrl(`${path}${separator}page=${page}&page_size=100`);
-      const response = await this.fetchWithRetry(url);
-      const json = await response.json();
-      const parsed = paginatedSchema.parse(json);
+  /** Create a named reference object with automatic matching disabled. */
+  private async createNamed<S extends ZodType>(
+    path: string,
+    name: string,
+    schema: S,
+  ): Promise<z.output<S>> {
+    const response = await this.fetchWithRetry(this.buildUrl(path), {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ name, matching_algorithm: MATCHING_NONE }),
+    });
+    return schema.parse(await response.json());
+  }
 
-      allResults.push(...(parsed.results as T[]));
+  private async fetchListPage(path: string, schema: ZodType, page: number, pageSize: number) {
+    this.logger.debug({ path, page, pageSize }, 'Fetching page');
+    const separator = path.includes('?') ? '&' : '?';
+    return this.getJson(
+      `${path}${separator}page=${page}&page_size=${pageSize}`,
+      paginatedResponseSchema(schema),
+    );
+  }
 
-      hasNext = parsed.next !== null;
-      page++;
+  /** Like fetchListPage, but null when the list shrank and the page no longer exists. */
+  private async fetchListPageIfPresent(
+    path: string,
+    schema: ZodType,
+    page: number,
+    pageSize: number,
+  ) {
+    try {
+      return await this.fetchListPage(path, schema, page, pageSize);
+    } catch (error) {
+      if (error instanceof PaperlessApiError && error.statusCode === 404) return null;
+      throw error;
     }
+  }
 
-    return allResults;
+  /** Total object count of a list endpoint, read from a single one-item page. */
+  private async fetchCount(path: string): Promise<number> {
+    const separator = path.includes('?') ? '&' : '?';
+    const { count } = await this.getJson(`${path}${separator}page_size=1`, countResponseSchema);
+    return count;
+  }
+
+  /**
+   * Collect a whole list endpoint, with up to LIST_FETCH_CONCURRENCY pages
+   * requested at once and results concatenated in page order.
+   */
+  private async fetchAllPaginated<T>(path: string, schema: ZodType, pageSize = 100): Promise<T[]> {
+    const results: T[] = [];
+    for await (const page of this.paginate<T>(path, schema, pageSize)) {
+      results.push(...page.results);
+    }
+    return results;
   }
 }
@@ -33,5 +33,5 @@ export {
   toPaperlessConfig,
 } from './schemas.js';
 
-export { PaperlessClient } from './client.js';
+export { PaperlessClient, discardResponseBody } from './client.js';
 export { PaperlessApiError, PaperlessAuthError, PaperlessConnectionError } from './errors.js';
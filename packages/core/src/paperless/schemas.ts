@@ -302,6 +302,7 @@ export const paperlessConfigSchema = z
     password: z.string().optional(),
     timeout: z.number().optional(),
     maxRetries: z.number().optional(),
+    maxRequestsPerSecond: z.number().positive().optional(),
   })
   .refine((data) => data.token || (data.username && data.password), {
     error: 'Either token or both username and password must be provided',
@@ -314,10 +315,11 @@ export function toPaperlessConfig(appConfig: AppConfig): PaperlessConfig {
     token: appConfig.PAPERLESS_API_TOKEN,
     username: appConfig.PAPERLESS_USERNAME,
     password: appConfig.PAPERLESS_PASSWORD,
+    maxRequestsPerSecond: appConfig.PAPERLESS_MAX_REQUESTS_PER_SECOND,
   };
 }
 
-export function paginatedResponseSchema<T extends ZodType>(itemSchema: T) {
+function buildPaginatedResponseSchema<T extends ZodType>(itemSchema: T) {
   return z.object({
     count: z.number(),
     next: z.string().nullable().default(null),
@@ -325,3 +327,21 @@ export function paginatedResponseSchema<T extends ZodType>(itemSchema: T) {
     results: z.array(itemSchema),
   });
 }
+
+const paginatedSchemaCache = new WeakMap<ZodType, ZodType>();
+
+/**
+ * Paginated envelope for `itemSchema`. Memoized per item schema so every page
+ * of an endpoint reuses one schema (and zod's compiled parser for it) instead
+ * of building a fresh one per request.
+ */
+export function paginatedResponseSchema<T extends ZodType>(
+  itemSchema: T,
+): ReturnType<typeof buildPaginatedResponseSchema<T>> {
+  let schema = paginatedSchemaCache.get(itemSchema);
+  if (!schema) {
+    schema = buildPaginatedResponseSchema(itemSchema);
+    paginatedSchemaCache.set(itemSchema, schema);
+  }
+  return schema as ReturnType<typeof buildPaginatedResponseSchema<T>>;
+}
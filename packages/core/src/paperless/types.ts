@@ -5,6 +5,8 @@ export interface PaperlessConfig {
   password?: string;
   timeout?: number;
   maxRetries?: number;
+  /** Client-side request rate cap; unset means requests are not paced. */
+  maxRequestsPerSecond?: number;
 }
 
 export interface PaperlessDocument {
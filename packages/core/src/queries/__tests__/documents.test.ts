@@ -900,6 +900,17 @@ describe('getDocumentStats', () => {
     });
   });
 
+  it('ranks tags by document count', () => {
+    insertTestDocuments(db);
+    const stats = getDocumentStats(db);
+
+    expect(stats.tagDistribution).toEqual([
+      { name: 'finance', count: 2 },
+      { name: 'legal', count: 1 },
+      { name: 'monthly', count: 1 },
+    ]);
+  });
+
   it('returns correct documentsOverTime grouped by month ascending', () => {
     insertTestDocuments(db);
     const stats = getDocumentStats(db);
@@ -15,6 +15,7 @@ import {
   batchSetStatus,
   purgeDeletedGroups,
   archiveAndDeleteMembers,
+  backfillDeletedGroupArchives,
   removeMemberFromGroup,
   removeDocumentFromAllGroups,
   StatusTransitionError,
@@ -1212,6 +1213,44 @@ describe('archiveAndDeleteMembers', () => {
   });
 });
 
+describe('backfillDeletedGroupArchives', () => {
+  let db: AppDatabase;
+
+  beforeEach(async () => {
+    const handle = createDatabaseWithHandle(':memory:');
+    db = handle.db;
+    await migrateDatabase(handle.sqlite);
+    insertTestData(db);
+  });
+
+  it('archives every unarchived deleted group and strips its members', () => {
+    db.update(duplicateGroup).set({ status: 'deleted' }).run();
+
+    expect(backfillDeletedGroupArchives(db)).toBe(2);
+
+    const groups = db.select().from(duplicateGroup).orderBy(duplicateGroup.id).all();
+    expect(groups.map((g) => [g.archivedMemberCount, g.archivedPrimaryTitle])).toEqual([
+      [2, 'Invoice A'],
+      [2, null],
+    ]);
+    expect(groups.every((g) => g.deletedAt)).toBe(true);
+    expect(db.select().from(duplicateMember).all()).toHaveLength(0);
+  });
+
+  it('leaves pending and already archived groups alone', () => {
+    archiveAndDeleteMembers(db, 'grp-1');
+
+    expect(backfillDeletedGroupArchives(db)).toBe(0);
+
+    const members = db
+      .select()
+      .from(duplicateMember)
+      .where(eq(duplicateMember.groupId, 'grp-2'))
+      .all();
+    expect(members).toHaveLength(2);
+  });
+});
+
 describe('getDuplicateGroups with includeDeleted', () => {
   let db: AppDatabase;
 
@@ -1,4 +1,5 @@
 import { and, asc, avg, count, desc, eq, isNotNull, isNull, like, sql } from 'drizzle-orm';
+import type Database from 'better-sqlite3';
 
 import type { AppDatabase } from '../db/client.js';
 import { document, documentContent, documentSignature } from '../schema/sqlite/documents.js';
@@ -22,6 +23,32 @@ import type {
 } from './types.js';
 import { decodeDocumentLibraryCursor, encodeDocumentLibraryCursor } from './types.js';
 
+const LIBRARY_STATEMENT_CACHE_SIZE = 64;
+const libraryStatements = new WeakMap<Database.Database, Map<string, Database.Statement>>();
+
+/**
+ * Prepare document library SQL once per distinct text. The SQL is assembled
+ * from the active filters, so a handful of shapes repeat on every page and
+ * count request; recompiling them each time is pure overhead.
+ */
+function prepareLibraryStatement(db: AppDatabase, sqlText: string): Database.Statement {
+  let statements = libraryStatements.get(db.$client);
+  if (!statements) {
+    statements = new Map();
+    libraryStatements.set(db.$client, statements);
+  }
+  let statement = statements.get(sqlText);
+  if (!statement) {
+    // IN-list lengths vary with the filters; keep the cache bounded
+    if (statements.size >= LIBRARY_STATEMENT_CACHE_SIZE) {
+      statements.delete(statements.keys().next().value!);
+    }
+    statement = db.$client.prepare(sqlText);
+    statements.set(sqlText, statement);
+  }
+  return statement;
+}
+
 function escapeLike(value: string): string {
   return value.replaceAll('\\', '\\\\').replaceAll('%', '\\%').replaceAll('_', '\\_');
 }
@@ -261,9 +288,9 @@ export function listDocumentLibrary(
   const base = buildDocumentLibraryWhere(query);
   const baseWhere = base.clauses.length > 0 ? `WHERE ${base.clauses.join(' AND ')}` : '';
 
-  const countRow = db.$client
-    .prepare(
-      `SELECT
+  const countRow = prepareLibraryStatement(
+    db,
+    `SELECT
         count(*) AS total,
         coalesce(sum(CASE WHEN NOT EXISTS (
           SELECT 1 FROM document_content count_content
@@ -285,8 +312,7 @@ export function listDocumentLibrary(
         ) THEN 1 ELSE 0 END), 0) AS aiStale
       FROM document d
       ${baseWhere}`,
-    )
-    .get(...base.parameters) as DocumentLibraryCounts;
+  ).get(...base.parameters) as DocumentLibraryCounts;
 
   const page = listDocumentLibraryRows(db, query);
 
@@ -308,6 +334,8 @@ export function listDocumentLibraryRows(
   query: DocumentLibraryQuery,
 ): Pick<DocumentLibraryPage, 'items' | 'nextCursor'> {
   const base = buildDocumentLibraryWhere(query);
+  // Row-value comparison: the added-date key is computed once per row
+  const afterKeyClause = `(${documentLibraryAddedDateKeySql}, d.paperless_id) < (?, ?)`;
   const rowClauses = [...base.clauses];
   const rowParameters = [...base.parameters];
   if (query.cursor) {
@@ -317,17 +345,14 @@ export function listDocumentLibraryRows(
       // function remains safe if validation changes independently.
       throw new Error('Invalid document library cursor');
     }
-    rowClauses.push(
-      `(${documentLibraryAddedDateKeySql} < ? OR (${documentLibraryAddedDateKeySql} = ? AND d.paperless_id < ?))`,
-    );
-    const cursorDate = cursor.addedDate ?? '';
-    rowParameters.push(cursorDate, cursorDate, cursor.paperlessId);
+    rowClauses.push(afterKeyClause);
+    rowParameters.push(cursor.addedDate ?? '', cursor.paperlessId);
   }
   const rowWhere = rowClauses.length > 0 ? `WHERE ${rowClauses.join(' AND ')}` : '';
 
-  const rows = db.$client
-    .prepare(
-      `SELECT
+  const rows = prepareLibraryStatement(
+    db,
+    `SELECT
         d.id,
         d.paperless_id AS paperlessId,
         d.title,
@@ -369,12 +394,23 @@ export function listDocumentLibraryRows(
       ${rowWhere}
       ORDER BY ${documentLibraryAddedDateKeySql} DESC, d.paperless_id DESC
       LIMIT ?`,
-    )
-    .all(...rowParameters, query.limit + 1) as DocumentLibrarySqlRow[];
-
-  const hasNextPage = rows.length > query.limit;
-  const visibleRows = hasNextPage ? rows.slice(0, query.limit) : rows;
-  const items: DocumentLibraryItem[] = visibleRows.map((row) => ({
+  ).all(...rowParameters, query.limit) as DocumentLibrarySqlRow[];
+
+  // Probe for one more row by sort key alone rather than fetching limit + 1
+  // full rows, so the OCR and duplicate subqueries never run for a row that
+  // is not shown. A short page cannot have a successor.
+  let hasNextPage = false;
+  const lastRow = rows.at(-1);
+  if (lastRow && rows.length === query.limit) {
+    const probeWhere = [...base.clauses, afterKeyClause].join(' AND ');
+    const probe = prepareLibraryStatement(
+      db,
+      `SELECT 1 FROM document d WHERE ${probeWhere} LIMIT 1`,
+    );
+    hasNextPage =
+      probe.get(...base.parameters, lastRow.addedDate ?? '', lastRow.paperlessId) !== undefined;
+  }
+  const items: DocumentLibraryItem[] = rows.map((row) => ({
     id: row.id,
     paperlessId: row.paperlessId,
     title: row.title,
@@ -662,21 +698,24 @@ export function getDocumentStats(db: AppDatabase): DocumentStats {
     .limit(20)
     .all() as { name: string; count: number }[];
 
-  // 6. Tag distribution
-  const tagRows = db.select({ tagsJson: document.tagsJson }).from(document).all();
-
-  const tagCounts = new Map<string, number>();
-  for (const row of tagRows) {
-    const tags = parseTagsJson(row.tagsJson);
-    for (const tag of tags) {
-      tagCounts.set(tag, (tagCounts.get(tag) ?? 0) + 1);
-    }
-  }
-
-  const tagDistribution = Array.from(tagCounts.entries())
-    .map(([name, count]) => ({ name, count }))
-    .sort((a, b) => b.count - a.count)
-    .slice(0, 30);
+  // 6. Tag distribution: counted and ranked in SQL so only the top 30 rows
+  // come back, rather than parsing every document's tags and sorting them all
+  const tagDistribution = (
+    db.$client
+      .prepare(
+        `SELECT tag.value AS name, count(*) AS count
+         FROM document d
+         JOIN json_each(
+           CASE WHEN json_valid(d.tags_json) AND json_type(d.tags_json) = 'array'
+             THEN d.tags_json ELSE '[]' END
+         ) tag
+         WHERE tag.type = 'text'
+         GROUP BY tag.value
+         ORDER BY count(*) DESC, tag.value ASC
+         LIMIT 30`,
+      )
+      .all() as { name: string; count: number }[]
+  ).map((row) => ({ name: row.name, count: Number(row.count) }));
 
   // 7. Average word count
   const [{ averageWordCount }] = db
@@ -1,17 +1,8 @@
-import { and, count, desc, asc, eq, gte, lt, lte, or, sql, inArray, ne } from 'drizzle-orm';
+import { and, count, desc, asc, eq, gte, lt, lte, sql, inArray, ne } from 'drizzle-orm';
 
 import type { AppDatabase } from '../db/client.js';
 import { buildMatchExplanation } from '../dedup/explanations.js';
 import type { GroupStatus } from '../types/enums.js';
-
-// ── Errors ───────────────────────────────────────────────────────────────
-
-export class StatusTransitionError extends Error {
-  constructor(groupId: string, currentStatus: string) {
-    super(`Cannot change status of group ${groupId}: status '${currentStatus}' is terminal`);
-    this.name = 'StatusTransitionError';
-  }
-}
 import { document, documentContent } from '../schema/sqlite/documents.js';
 import { duplicateGroup, duplicateMember } from '../schema/sqlite/duplicates.js';
 import { parseTagsJson } from './helpers.js';
@@ -39,6 +30,15 @@ import {
   encodeDuplicateInboxCursor,
 } from './types.js';
 
+// ── Errors ───────────────────────────────────────────────────────────────
+
+export class StatusTransitionError extends Error {
+  constructor(groupId: string, currentStatus: string) {
+    super(`Cannot change status of group ${groupId}: status '${currentStatus}' is terminal`);
+    this.name = 'StatusTransitionError';
+  }
+}
+
 // ── List queries ────────────────────────────────────────────────────────
 
 function duplicateInboxQueueWhere(queue: DuplicateInboxQueue) {
@@ -88,19 +88,9 @@ export function listDuplicateInbox(
       : lte(duplicateGroup.confidenceScore, query.maxConfidence),
   );
   const cursor = query.cursor ? decodeDuplicateInboxCursor(query.cursor) : null;
+  // A row-value comparison lets SQLite seek the sort key as one range
   const cursorWhere = cursor
-    ? or(
-        lt(duplicateGroup.confidenceScore, cursor.confidenceScore),
-        and(
-          eq(duplicateGroup.confidenceScore, cursor.confidenceScore),
-          lt(duplicateGroup.createdAt, cursor.createdAt),
-        ),
-        and(
-          eq(duplicateGroup.confidenceScore, cursor.confidenceScore),
-          eq(duplicateGroup.createdAt, cursor.createdAt),
-          lt(duplicateGroup.id, cursor.id),
-        ),
-      )
+    ? sql`(${duplicateGroup.confidenceScore}, ${duplicateGroup.createdAt}, ${duplicateGroup.id}) < (${cursor.confidenceScore}, ${cursor.createdAt}, ${cursor.id})`
     : undefined;
   const where = and(
     duplicateInboxQueueWhere(query.queue),
@@ -707,47 +697,43 @@ export function archiveAndDeleteMembers(db: AppDatabase, groupId: string): boole
 }
 
 export function backfillDeletedGroupArchives(db: AppDatabase): number {
-  // One-time backfill: for existing deleted groups that haven't been archived yet
-  const unarchived = db
-    .select({ id: duplicateGroup.id })
-    .from(duplicateGroup)
-    .where(
-      and(eq(duplicateGroup.status, 'deleted'), sql`${duplicateGroup.archivedMemberCount} IS NULL`),
-    )
-    .all();
-
-  for (const group of unarchived) {
-    const [{ memberCount }] = db
-      .select({ memberCount: count() })
-      .from(duplicateMember)
-      .where(eq(duplicateMember.groupId, group.id))
-      .all();
-
-    const primaryDoc = db
-      .select({ title: document.title })
-      .from(duplicateMember)
-      .innerJoin(document, eq(duplicateMember.documentId, document.id))
-      .where(and(eq(duplicateMember.groupId, group.id), eq(duplicateMember.isPrimary, true)))
-      .get();
+  // One-time backfill: for existing deleted groups that haven't been archived yet.
+  // Snapshots are taken by correlated subqueries so every group is archived by
+  // one UPDATE instead of a count and a primary lookup per group.
+  const now = new Date().toISOString();
 
-    const now = new Date().toISOString();
+  return db.transaction((tx) => {
+    const result = tx
+      .update(duplicateGroup)
+      .set({
+        archivedMemberCount: sql`(SELECT COUNT(*) FROM duplicate_member WHERE group_id = ${duplicateGroup.id})`,
+        archivedPrimaryTitle: sql`(SELECT d.title FROM duplicate_member m
+          JOIN document d ON d.id = m.document_id
+          WHERE m.group_id = ${duplicateGroup.id} AND m.is_primary = 1 LIMIT 1)`,
+        deletedAt: now,
+        updatedAt: now,
+      })
+      .where(
+        and(eq(duplicateGroup.status, 'deleted'), sql`${duplicateGroup.archivedMemberCount} IS NULL`),
+      )
+      .run();
 
-    db.transaction((tx) => {
-      tx.update(duplicateGroup)
-        .set({
-          archivedMemberCount: memberCount,
-          archivedPrimaryTitle: primaryDoc?.title ?? null,
-          deletedAt: now,
-          updatedAt: now,
-        })
-        .where(eq(duplicateGroup.id, group.id))
+    if (result.changes > 0) {
+      tx.delete(duplicateMember)
+        .where(
+          inArray(
+            duplicateMember.groupId,
+            tx
+              .select({ id: duplicateGroup.id })
+              .from(duplicateGroup)
+              .where(eq(duplicateGroup.status, 'deleted')),
+          ),
+        )
         .run();
+    }
 
-      tx.delete(duplicateMember).where(eq(duplicateMember.groupId, group.id)).run();
-    });
-  }
-
-  return unarchived.length;
+    return result.changes;
+  });
 }
 
 // ── Mutations ───────────────────────────────────────────────────────────
@@ -35,17 +35,22 @@ const duplicateInboxCursorPayloadSchema = z
 
 export type DuplicateInboxCursorPayload = z.infer<typeof duplicateInboxCursorPayloadSchema>;
 
-export function encodeDuplicateInboxCursor(payload: DuplicateInboxCursorPayload): string {
+/** Opaque cursor text for a payload; decoders accept only this canonical form. */
+function serializeCursor(payload: object): string {
   return Buffer.from(JSON.stringify(payload), 'utf8').toString('base64url');
 }
 
+export function encodeDuplicateInboxCursor(payload: DuplicateInboxCursorPayload): string {
+  return serializeCursor(payload);
+}
+
 export function decodeDuplicateInboxCursor(value: string): DuplicateInboxCursorPayload | null {
   if (!/^[A-Za-z0-9_-]+$/.test(value)) return null;
 
   try {
     const decoded: unknown = JSON.parse(Buffer.from(value, 'base64url').toString('utf8'));
     const result = duplicateInboxCursorPayloadSchema.safeParse(decoded);
-    if (!result.success || encodeDuplicateInboxCursor(result.data) !== value) return null;
+    if (!result.success || serializeCursor(result.data) !== value) return null;
     return result.data;
   } catch {
     return null;
@@ -142,10 +147,7 @@ const documentLibraryCursorPayloadSchema = z
 export type DocumentLibraryCursorPayload = z.infer<typeof documentLibraryCursorPayloadSchema>;
 
 export function encodeDocumentLibraryCursor(payload: DocumentLibraryCursorPayload): string {
-  return Buffer.from(
-    JSON.stringify(documentLibraryCursorPayloadSchema.parse(payload)),
-    'utf8',
-  ).toString('base64url');
+  return serializeCursor(documentLibraryCursorPayloadSchema.parse(payload));
 }
 
 export function decodeDocumentLibraryCursor(value: string): DocumentLibraryCursorPayload | null {
@@ -154,7 +156,8 @@ export function decodeDocumentLibraryCursor(value: string): DocumentLibraryCurso
   try {
     const decoded: unknown = JSON.parse(Buffer.from(value, 'base64url').toString('utf8'));
     const result = documentLibraryCursorPayloadSchema.safeParse(decoded);
-    if (!result.success || encodeDocumentLibraryCursor(result.data) !== value) return null;
+    // The payload was just validated, so compare without parsing it again
+    if (!result.success || serializeCursor(result.data) !== value) return null;
     return result.data;
   } catch {
     return null;
@@ -467,6 +467,16 @@ export function claimDuplicateDeletionPlan(
 /** @deprecated Use claimDuplicateDeletionPlan with the durable job identity. */
 export const consumeDuplicateDeletionPlan = claimDuplicateDeletionPlan;
 
+function toDocumentCheckpoint(row: unknown): DuplicateDocumentCheckpoint {
+  const typed = row as Omit<DuplicateDocumentCheckpoint, 'retryable'> & {
+    retryable: number | null;
+  };
+  return {
+    ...typed,
+    retryable: typed.retryable === null ? null : Boolean(typed.retryable),
+  };
+}
+
 export function getDuplicateDeletionCheckpointState(
   sqlite: Database.Database,
   planId: string,
@@ -488,18 +498,40 @@ export function getDuplicateDeletionCheckpointState(
        ORDER BY group_id, ordinal`,
     )
     .all(planId)
-    .map((row) => {
-      const typed = row as Omit<DuplicateDocumentCheckpoint, 'retryable'> & {
-        retryable: number | null;
-      };
-      return {
-        ...typed,
-        retryable: typed.retryable === null ? null : Boolean(typed.retryable),
-      };
-    });
+    .map(toDocumentCheckpoint);
   return { groups, documents };
 }
 
+/**
+ * Checkpoints for one group of a plan. The worker reads these once per group
+ * through the primary key instead of reloading every checkpoint in the plan
+ * for each document.
+ */
+export function getDuplicateGroupCheckpointState(
+  sqlite: Database.Database,
+  planId: string,
+  groupId: string,
+): { group: DuplicateGroupCheckpoint | null; documents: DuplicateDocumentCheckpoint[] } {
+  const group = sqlite
+    .prepare(
+      `SELECT group_id AS groupId, ordinal, status, conflict_reason AS conflictReason
+       FROM reviewed_mutation_group_checkpoint
+       WHERE plan_id = ? AND group_id = ?`,
+    )
+    .get(planId, groupId) as DuplicateGroupCheckpoint | undefined;
+  const documents = sqlite
+    .prepare(
+      `SELECT group_id AS groupId, document_id AS documentId, paperless_id AS paperlessId,
+              ordinal, status, outcome, retryable
+       FROM reviewed_mutation_document_checkpoint
+       WHERE plan_id = ? AND group_id = ?
+       ORDER BY ordinal`,
+    )
+    .all(planId, groupId)
+    .map(toDocumentCheckpoint);
+  return { group: group ?? null, documents };
+}
+
 export function markDuplicateGroupStarted(
   sqlite: Database.Database,
   planId: string,
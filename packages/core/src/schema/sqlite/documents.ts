@@ -59,7 +59,11 @@ export const documentSignature = sqliteTable(
     minhashSignature: blob('minhash_signature', { mode: 'buffer' }),
     algorithmVersion: text('algorithm_version').notNull(),
     numPermutations: integer('num_permutations').notNull(),
+    contentHash: text('content_hash'),
     createdAt: text('created_at').notNull(),
   },
-  (table) => [uniqueIndex('document_signature_document_id_unique').on(table.documentId)],
+  (table) => [
+    uniqueIndex('document_signature_document_id_unique').on(table.documentId),
+    index('idx_ds_content_hash').on(table.contentHash),
+  ],
 );
@@ -34,6 +34,11 @@ describe('normalizeText', () => {
     expect(result.wordCount).toBe(5);
   });
 
+  it('should count words separated by mixed whitespace', () => {
+    const result = normalizeText('  one\ttwo\n\nthree   four\r\nfive  ');
+    expect(result.wordCount).toBe(5);
+  });
+
   it('should produce deterministic content hash', () => {
     const r1 = normalizeText('hello world');
     const r2 = normalizeText('hello world');
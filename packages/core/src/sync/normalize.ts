@@ -6,12 +6,22 @@ export interface NormalizedResult {
   contentHash: string;
 }
 
+const WHITESPACE_RUN_RE = /\s+/g;
+const SPACE_CHAR_CODE = 0x20;
+
 export function normalizeText(text: string): NormalizedResult {
   // Lowercase -> collapse whitespace -> trim
-  const normalizedText = text.toLowerCase().replace(/\s+/g, ' ').trim();
+  const normalizedText = text.toLowerCase().replace(WHITESPACE_RUN_RE, ' ').trim();
 
-  // Word count: split on spaces, filter empty
-  const wordCount = normalizedText === '' ? 0 : normalizedText.split(' ').length;
+  // Word count: whitespace is collapsed to single spaces, so words = spaces + 1.
+  // Counting in place avoids allocating a throwaway array of every word.
+  let wordCount = 0;
+  if (normalizedText !== '') {
+    wordCount = 1;
+    for (let i = 0; i < normalizedText.length; i++) {
+      if (normalizedText.charCodeAt(i) === SPACE_CHAR_CODE) wordCount++;
+    }
+  }
 
   // SHA-256 content hash
   const contentHash = createHash('sha256').update(normalizedText).digest('hex');
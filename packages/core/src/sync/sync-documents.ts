@@ -1,4 +1,4 @@
-import { eq } from 'drizzle-orm';
+import { count, eq } from 'drizzle-orm';
 import { document, documentContent } from '../schema/sqlite/documents.js';
 import { syncState } from '../schema/sqlite/app.js';
 import { createLogger } from '../logger.js';
@@ -70,17 +70,24 @@ export async function syncDocuments(
     };
 
     const seenPaperlessIds = new Set<number>();
-    let shouldStop = false;
     let totalCount: number | undefined;
 
-    for await (const page of client.getDocuments({ ordering: '-modified', pageSize })) {
-      if (shouldStop) break;
-
+    // An incremental sync usually reaches its cutoff on the first page, so it
+    // reads pages on demand instead of prefetching content it will discard
+    const pages = client.getDocuments({
+      ordering: '-modified',
+      pageSize,
+      prefetch: isFullSync ? undefined : 0,
+    });
+    for await (const page of pages) {
       totalCount ??= page.totalCount;
+      // One timestamp per page rather than formatting a new one per document
+      const syncedAt = new Date().toISOString();
 
       for (const doc of page.results) {
         result.totalFetched++;
-        seenPaperlessIds.add(doc.id);
+        // Only a full sync reconciles deletions, so only it needs the seen ids
+        if (isFullSync) seenPaperlessIds.add(doc.id);
 
         try {
           const fingerprint = computeFingerprint(doc);
@@ -92,6 +99,7 @@ export async function syncDocuments(
               db,
               doc,
               fingerprint,
+              syncedAt,
               refMaps,
               maxOcrLength,
               options?.syncJobId,
@@ -105,6 +113,7 @@ export async function syncDocuments(
               localDoc.id,
               doc,
               fingerprint,
+              syncedAt,
               refMaps,
               maxOcrLength,
               options?.syncJobId,
@@ -135,9 +144,7 @@ export async function syncDocuments(
       // Incremental sync cutoff: stop when oldest doc in batch is older than lastSyncAt
       if (!isFullSync && lastSyncAt && page.results.length > 0) {
         const oldestInBatch = page.results[page.results.length - 1];
-        if (oldestInBatch.modified < lastSyncAt) {
-          shouldStop = true;
-        }
+        if (oldestInBatch.modified < lastSyncAt) break;
       }
     }
 
@@ -158,7 +165,7 @@ export async function syncDocuments(
 
     // 7. Update sync state
     const now = new Date().toISOString();
-    const totalDocsCount = db.select().from(document).all().length;
+    const totalDocsCount = db.select({ value: count() }).from(document).get()?.value ?? 0;
 
     db.insert(syncState)
       .values({
@@ -228,7 +235,8 @@ function loadLocalDocuments(
     .from(document)
     .all();
 
-  return new Map(docs.map((d) => [d.paperlessId, { id: d.id, fingerprint: d.fingerprint }]));
+  // The selected rows already carry every field the lookup needs
+  return new Map(docs.map((d) => [d.paperlessId, d]));
 }
 
 function resolveTagNames(tagIds: number[], refMaps: ReferenceMaps): string[] {
@@ -242,12 +250,12 @@ function insertDocument(
   db: AppDatabase,
   doc: PaperlessDocument,
   fingerprint: string,
+  syncedAt: string,
   refMaps: ReferenceMaps,
   maxOcrLength: number,
   syncJobId?: string,
   syncGenerationId?: string,
 ): string {
-  const now = new Date().toISOString();
   const tagNames = resolveTagNames(doc.tags, refMaps);
   const content = doc.content.slice(0, maxOcrLength);
   const normalized = normalizeText(content);
@@ -271,7 +279,7 @@ function insertDocument(
         addedDate: doc.added,
         modifiedDate: doc.modified,
         processingStatus: 'pending',
-        syncedAt: now,
+        syncedAt,
         insertedBySyncJobId: syncJobId,
         insertedBySyncGenerationId: syncGenerationId,
         lastChangedBySyncJobId: syncJobId,
@@ -299,12 +307,12 @@ function updateDocument(
   localDocId: string,
   doc: PaperlessDocument,
   fingerprint: string,
+  syncedAt: string,
   refMaps: ReferenceMaps,
   maxOcrLength: number,
   syncJobId?: string,
   syncGenerationId?: string,
 ): void {
-  const now = new Date().toISOString();
   const tagNames = resolveTagNames(doc.tags, refMaps);
   const content = doc.content.slice(0, maxOcrLength);
   const normalized = normalizeText(content);
@@ -326,7 +334,7 @@ function updateDocument(
         addedDate: doc.added,
         modifiedDate: doc.modified,
         processingStatus: 'pending',
-        syncedAt: now,
+        syncedAt,
         lastChangedBySyncJobId: syncJobId,
         lastChangedBySyncGenerationId: syncGenerationId,
       })
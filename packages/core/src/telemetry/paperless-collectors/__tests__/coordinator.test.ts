@@ -65,6 +65,10 @@ function createMockClient() {
     getCorrespondents: vi.fn().mockResolvedValue([]),
     getDocumentTypes: vi.fn().mockResolvedValue([]),
     getStoragePaths: vi.fn().mockResolvedValue([]),
+    getTagCount: vi.fn().mockResolvedValue(0),
+    getCorrespondentCount: vi.fn().mockResolvedValue(0),
+    getDocumentTypeCount: vi.fn().mockResolvedValue(0),
+    getStoragePathCount: vi.fn().mockResolvedValue(0),
     getGroupCount: vi.fn().mockResolvedValue(2),
     getUserCount: vi.fn().mockResolvedValue(5),
     getRemoteVersion: vi.fn().mockResolvedValue({ version: '2.0.0', updateAvailable: false }),
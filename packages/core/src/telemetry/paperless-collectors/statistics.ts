@@ -96,18 +96,19 @@ export class StatisticsCollector implements Collector {
       return;
     }
 
-    // v2 fallback: fetch counts separately via paginated endpoints
-    const [tags, correspondents, documentTypes, storagePaths] = await Promise.all([
-      ctx.client.getTags(),
-      ctx.client.getCorrespondents(),
-      ctx.client.getDocumentTypes(),
-      ctx.client.getStoragePaths(),
+    // v2 fallback: read each endpoint's total from a one-item page instead of
+    // paging through every object just to count them
+    const [tagCount, correspondentCount, documentTypeCount, storagePathCount] = await Promise.all([
+      ctx.client.getTagCount(),
+      ctx.client.getCorrespondentCount(),
+      ctx.client.getDocumentTypeCount(),
+      ctx.client.getStoragePathCount(),
     ]);
 
-    this._tagCount = tags.length;
-    this._correspondentCount = correspondents.length;
-    this._documentTypeCount = documentTypes.length;
-    this._storagePathCount = storagePaths.length;
+    this._tagCount = tagCount;
+    this._correspondentCount = correspondentCount;
+    this._documentTypeCount = documentTypeCount;
+    this._storagePathCount = storagePathCount;
   }
 
   private _tagCount = 0;
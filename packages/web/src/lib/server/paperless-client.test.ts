@@ -0,0 +1,25 @@
+import { describe, expect, it, vi } from 'vitest';
+
+vi.mock('@paperless-dedupe/core', () => ({
+  PaperlessClient: vi.fn(function (this: { config: unknown }, config: unknown) {
+    this.config = config;
+  }),
+  toPaperlessConfig: (config: { PAPERLESS_URL: string }) => ({ url: config.PAPERLESS_URL }),
+}));
+
+import { getPaperlessClient } from './paperless-client';
+
+type Config = App.Locals['config'];
+
+describe('shared Paperless client', () => {
+  it('reuses one client until the Paperless settings change', () => {
+    const config = { PAPERLESS_URL: 'http://paperless:8000' } as Config;
+
+    const first = getPaperlessClient(config);
+    expect(getPaperlessClient({ ...config })).toBe(first);
+
+    const changed = getPaperlessClient({ PAPERLESS_URL: 'http://other:8000' } as Config);
+    expect(changed).not.toBe(first);
+    expect(changed).toMatchObject({ config: { url: 'http://other:8000' } });
+  });
+});
@@ -0,0 +1,19 @@
+import { PaperlessClient, toPaperlessConfig } from '@paperless-dedupe/core';
+
+let shared: { key: string; client: PaperlessClient } | null = null;
+
+/**
+ * Paperless client shared by request handlers. A client built per request
+ * forgets the API version it negotiated and gets its own
+ * PAPERLESS_MAX_REQUESTS_PER_SECOND budget, so concurrent requests were not
+ * paced against each other. The client is rebuilt when the Paperless
+ * settings change.
+ */
+export function getPaperlessClient(config: App.Locals['config']): PaperlessClient {
+  const paperlessConfig = toPaperlessConfig(config);
+  const key = JSON.stringify(paperlessConfig);
+  if (shared?.key !== key) {
+    shared = { key, client: new PaperlessClient(paperlessConfig) };
+  }
+  return shared.client;
+}
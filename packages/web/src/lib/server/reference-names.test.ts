@@ -0,0 +1,31 @@
+import { describe, expect, it, vi } from 'vitest';
+import { createReferenceNameCache } from './reference-names';
+
+describe('reference name cache', () => {
+  it('reuses names within the TTL and refetches after it expires', async () => {
+    let now = 1_000;
+    const cache = createReferenceNameCache(60_000, () => now);
+    const load = vi.fn().mockResolvedValue(['finance']);
+
+    await expect(cache.get('http://paperless:tags', load)).resolves.toEqual(['finance']);
+    now += 59_999;
+    await cache.get('http://paperless:tags', load);
+    expect(load).toHaveBeenCalledTimes(1);
+
+    now += 1;
+    await cache.get('http://paperless:tags', load);
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+
+  it('does not keep a failed fetch', async () => {
+    const cache = createReferenceNameCache(60_000, () => 1_000);
+    const load = vi
+      .fn()
+      .mockRejectedValueOnce(new Error('unavailable'))
+      .mockResolvedValueOnce(['Invoice']);
+
+    await expect(cache.get('types', load)).rejects.toThrow('unavailable');
+    await expect(cache.get('types', load)).resolves.toEqual(['Invoice']);
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,45 @@
+/** How long fetched Paperless reference names are reused before refetching. */
+export const REFERENCE_NAMES_TTL_MS = 60_000;
+
+interface CachedNames {
+  expiresAt: number;
+  names: Promise<string[]>;
+}
+
+export interface ReferenceNameCache {
+  get(key: string, load: () => Promise<string[]>): Promise<string[]>;
+  clear(): void;
+}
+
+/**
+ * Short-lived cache for Paperless reference name lists (correspondents,
+ * document types, tags). These change rarely, while endpoints such as the cost
+ * estimate enumerate them on every request. Concurrent callers share one
+ * in-flight fetch, and a failed fetch is not cached.
+ */
+export function createReferenceNameCache(
+  ttlMs = REFERENCE_NAMES_TTL_MS,
+  now: () => number = Date.now,
+): ReferenceNameCache {
+  const entries = new Map<string, CachedNames>();
+
+  return {
+    get(key, load) {
+      const cached = entries.get(key);
+      if (cached && cached.expiresAt > now()) return cached.names;
+
+      const names = load();
+      const entry = { expiresAt: now() + ttlMs, names };
+      entries.set(key, entry);
+      names.catch(() => {
+        if (entries.get(key) === entry) entries.delete(key);
+      });
+      return names;
+    },
+    clear() {
+      entries.clear();
+    },
+  };
+}
+
+export const referenceNameCache = createReferenceNameCache();
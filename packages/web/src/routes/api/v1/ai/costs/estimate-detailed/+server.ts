@@ -1,9 +1,10 @@
 import { apiSuccess, apiError, ErrorCode } from '$lib/server/api';
+import { getPaperlessClient } from '$lib/server/paperless-client';
+import { referenceNameCache } from '$lib/server/reference-names';
 import {
   getAiConfig,
   estimateProcessingCost,
   refreshPricingIfStale,
-  PaperlessClient,
   toPaperlessConfig,
 } from '@paperless-dedupe/core';
 import type { RequestHandler } from './$types';
@@ -18,18 +19,25 @@ export const GET: RequestHandler = async ({ locals }) => {
 
   const aiConfig = getAiConfig(locals.db);
   const paperlessConfig = toPaperlessConfig(locals.config);
-  const client = new PaperlessClient(paperlessConfig);
+  const client = getPaperlessClient(locals.config);
 
-  // Fetch reference data from Paperless (same as batch processing does)
+  // Fetch reference data from Paperless (same as batch processing does). The
+  // estimate is re-requested often, so recently fetched names are reused.
   const [correspondents, documentTypes, tags] = await Promise.all([
     aiConfig.includeCorrespondents
-      ? client.getCorrespondents().then((list) => list.map((c) => c.name))
+      ? referenceNameCache.get(`${paperlessConfig.url}:correspondents`, () =>
+          client.getCorrespondents().then((list) => list.map((c) => c.name)),
+        )
       : Promise.resolve([] as string[]),
     aiConfig.includeDocumentTypes
-      ? client.getDocumentTypes().then((list) => list.map((dt) => dt.name))
+      ? referenceNameCache.get(`${paperlessConfig.url}:documentTypes`, () =>
+          client.getDocumentTypes().then((list) => list.map((dt) => dt.name)),
+        )
       : Promise.resolve([] as string[]),
     aiConfig.includeTags
-      ? client.getTags().then((list) => list.map((t) => t.name))
+      ? referenceNameCache.get(`${paperlessConfig.url}:tags`, () =>
+          client.getTags().then((list) => list.map((t) => t.name)),
+        )
       : Promise.resolve([] as string[]),
   ]);
 
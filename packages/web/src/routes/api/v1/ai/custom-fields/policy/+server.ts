@@ -1,13 +1,12 @@
 import { apiError, apiSuccess, ErrorCode } from '$lib/server/api';
+import { getPaperlessClient } from '$lib/server/paperless-client';
 import { parseUniqueJson } from '$lib/server/unique-json';
 import {
   CustomFieldPolicyError,
   getCustomFieldPolicy,
   PaperlessApiError,
-  PaperlessClient,
   PaperlessConnectionError,
   replaceCustomFieldPolicy,
-  toPaperlessConfig,
 } from '@paperless-dedupe/core';
 import { z } from 'zod';
 import type { RequestHandler } from './$types';
@@ -27,10 +26,6 @@ const policyRequestSchema = z
   })
   .strict();
 
-function clientFor(locals: App.Locals): PaperlessClient {
-  return new PaperlessClient(toPaperlessConfig(locals.config));
-}
-
 function upstreamOrInternalError(operation: string, error: unknown) {
   if (error instanceof PaperlessApiError || error instanceof PaperlessConnectionError) {
     return apiError(ErrorCode.BAD_GATEWAY, { operation, retryable: true });
@@ -47,7 +42,7 @@ export const GET: RequestHandler = async ({ locals }) => {
   }
 
   try {
-    const liveFields = await clientFor(locals).getCustomFields();
+    const liveFields = await getPaperlessClient(locals.config).getCustomFields();
     const availableFields = liveFields
       .filter(({ dataType }) => dataType !== 'documentlink')
       .sort((left, right) => left.id - right.id);
@@ -86,7 +81,7 @@ export const PUT: RequestHandler = async ({ request, locals }) => {
     });
   }
   try {
-    const liveFields = await clientFor(locals).getCustomFields();
+    const liveFields = await getPaperlessClient(locals.config).getCustomFields();
     const policy = replaceCustomFieldPolicy(locals.db, parsed.data.fields, liveFields);
     return apiSuccess({ policy });
   } catch (error) {
@@ -1,11 +1,10 @@
 import { apiError, apiSuccess, ErrorCode } from '$lib/server/api';
+import { getPaperlessClient } from '$lib/server/paperless-client';
 import { RuntimeUnavailableError } from '$lib/server/scheduler';
 import {
   getLatestCustomFieldDiscoveryRun,
   JobType,
   OperationConflictError,
-  PaperlessClient,
-  toPaperlessConfig,
 } from '@paperless-dedupe/core';
 import { getServerRuntime } from '../../../../../../runtime.server';
 import type { RequestHandler } from './$types';
@@ -17,8 +16,7 @@ export const POST: RequestHandler = async ({ locals }) => {
   let existingFieldNames: string[] = [];
   let existingFieldsUnavailable = false;
   try {
-    const client = new PaperlessClient(toPaperlessConfig(locals.config));
-    existingFieldNames = (await client.getCustomFields())
+    existingFieldNames = (await getPaperlessClient(locals.config).getCustomFields())
       .map((field) => field.name.trim())
       .filter(Boolean)
       .sort((left, right) => left.localeCompare(right));
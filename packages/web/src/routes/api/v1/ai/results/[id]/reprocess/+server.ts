@@ -1,11 +1,10 @@
 import { apiSuccess, apiError, ErrorCode } from '$lib/server/api';
+import { getPaperlessClient } from '$lib/server/paperless-client';
 import {
   reprocessSingleResult,
   createAiProvider,
   getAiConfig,
   markAiResultFailed,
-  PaperlessClient,
-  toPaperlessConfig,
   CustomFieldPolicyError,
 } from '@paperless-dedupe/core';
 import type { RequestHandler } from './$types';
@@ -20,8 +19,7 @@ export const POST: RequestHandler = async ({ params, locals, url }) => {
   }
 
   const aiConfig = getAiConfig(locals.db);
-  const paperlessConfig = toPaperlessConfig(locals.config);
-  const client = new PaperlessClient(paperlessConfig);
+  const client = getPaperlessClient(locals.config);
 
   try {
     const provider = await createAiProvider(
@@ -1,10 +1,6 @@
 import { apiSuccess, apiError, ErrorCode } from '$lib/server/api';
-import {
-  aiFieldSelectionSchema,
-  createAiRevertPlan,
-  PaperlessClient,
-  toPaperlessConfig,
-} from '@paperless-dedupe/core';
+import { getPaperlessClient } from '$lib/server/paperless-client';
+import { aiFieldSelectionSchema, createAiRevertPlan } from '@paperless-dedupe/core';
 import type { RequestHandler } from './$types';
 
 export const POST: RequestHandler = async ({ request, params, locals }) => {
@@ -19,7 +15,7 @@ export const POST: RequestHandler = async ({ request, params, locals }) => {
   try {
     const preview = await createAiRevertPlan(
       locals.db,
-      new PaperlessClient(toPaperlessConfig(locals.config)),
+      getPaperlessClient(locals.config),
       [params.id],
       selection.data,
     );
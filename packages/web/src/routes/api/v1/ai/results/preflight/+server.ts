@@ -1,11 +1,6 @@
 import { apiSuccess, apiError, ErrorCode } from '$lib/server/api';
-import {
-  aiFieldSelectionSchema,
-  createAiApplyPlan,
-  getAiConfig,
-  PaperlessClient,
-  toPaperlessConfig,
-} from '@paperless-dedupe/core';
+import { getPaperlessClient } from '$lib/server/paperless-client';
+import { aiFieldSelectionSchema, createAiApplyPlan, getAiConfig } from '@paperless-dedupe/core';
 import type { ApplyScope } from '@paperless-dedupe/core';
 import type { RequestHandler } from './$types';
 
@@ -30,8 +25,7 @@ export const POST: RequestHandler = async ({ request, locals }) => {
   const allowClearing = body.allowClearing === true;
   const createMissingEntities = body.createMissingEntities !== false;
 
-  const paperlessConfig = toPaperlessConfig(locals.config);
-  const client = new PaperlessClient(paperlessConfig);
+  const client = getPaperlessClient(locals.config);
   const aiConfig = getAiConfig(locals.db);
 
   const preflight = await createAiApplyPlan(locals.db, client, scope, selection.data, {
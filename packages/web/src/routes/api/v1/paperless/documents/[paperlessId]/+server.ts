@@ -1,5 +1,6 @@
 import { apiSuccess, apiError, ErrorCode } from '$lib/server/api';
 import {
+  discardResponseBody,
   document,
   duplicateMember,
   OperationConflictError,
@@ -52,6 +53,7 @@ export const DELETE: RequestHandler = async ({ params, locals }) => {
         headers: buildAuthHeaders(config),
         signal: AbortSignal.timeout(15000),
       });
+      await discardResponseBody(upstream);
 
       if (!upstream.ok) {
         return apiError(ErrorCode.BAD_GATEWAY, `Paperless returned ${upstream.status}`);
@@ -1,4 +1,5 @@
 import { apiError, ErrorCode } from '$lib/server/api';
+import { discardResponseBody } from '@paperless-dedupe/core';
 import {
   buildPaperlessAuthHeaders,
   requirePaperlessAuthorization,
@@ -29,6 +30,7 @@ export const GET: RequestHandler = async ({ params, locals, request }) => {
     });
 
     if (!upstream.ok) {
+      await discardResponseBody(upstream);
       return apiError(ErrorCode.BAD_GATEWAY, `Paperless returned ${upstream.status}`);
     }
 
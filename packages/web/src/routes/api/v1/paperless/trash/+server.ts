@@ -1,5 +1,6 @@
 import { z } from 'zod';
 import { apiError, apiSuccess, ErrorCode } from '$lib/server/api';
+import { discardResponseBody } from '@paperless-dedupe/core';
 import type { RequestHandler } from './$types';
 
 function buildAuthHeaders(config: App.Locals['config']): Record<string, string> {
@@ -27,6 +28,7 @@ export const GET: RequestHandler = async ({ locals }) => {
     });
 
     if (!upstream.ok) {
+      await discardResponseBody(upstream);
       return apiError(ErrorCode.BAD_GATEWAY, `Paperless returned ${upstream.status}`);
     }
 
@@ -62,6 +64,7 @@ export const POST: RequestHandler = async ({ request, locals }) => {
       body: JSON.stringify({ action: 'empty' }),
       signal: AbortSignal.timeout(30000),
     });
+    await discardResponseBody(upstream);
 
     if (!upstream.ok) {
       return apiError(ErrorCode.BAD_GATEWAY, `Paperless returned ${upstream.status}`);